@@ -1,13 +1,19 @@
 # 標準庫
+import argparse
 import base64
+import io
 import os
+import resource
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
 
 # 第三方庫
 import numpy as np
 from PIL import Image
 from selenium import webdriver
-from tensorflow.keras.models import load_model
-from tensorflow.keras.preprocessing.image import img_to_array
 
 # 本地模組
 from screenshot_handler import ScreenshotHandler
@@ -15,7 +21,7 @@ from screenshot_handler import ScreenshotHandler
 
 class ImageProcessor:
     """
-    處理圖像的類別，包括獲取 Base64 圖像、保存圖像到文件以及處理圖像裁剪的功能。
+    處理圖像的類別，包括獲取 Base64 圖像、於記憶體中解碼或保存圖像到文件以及處理圖像裁剪的功能。
 
     屬性:
         WHITE_PIXEL_VALUE (int): 白色像素的值，預設為 255。
@@ -24,7 +30,7 @@ class ImageProcessor:
     Examples:
         >>> processor = ImageProcessor()
         >>> base64_data = processor.get_base64_image(driver, element)
-        >>> processor.save_base64_image(base64_data, "image.png")
+        >>> images = processor.process_pil_image(processor.decode_base64_image(base64_data), 30, 100)
     
     Raises:
         FileNotFoundError: 當圖像文件不存在時
@@ -114,6 +120,35 @@ class ImageProcessor:
                 print(f"截圖失敗: {screenshot_error}")
             raise
 
+    def decode_base64_image(self, base64_data: str) -> Image.Image:
+        """
+        於記憶體中將 Base64 數據解碼為圖像，不經過暫存文件。
+
+        Args:
+            base64_data (str): Base64 編碼的圖像數據。
+
+        Returns:
+            Image.Image: 解碼後的 PIL 圖像。
+
+        Examples:
+            >>> processor = ImageProcessor()
+            >>> image = processor.decode_base64_image("iVBORw0KGgoAAAA...")
+            >>> image.mode
+            'RGBA'
+
+        Raises:
+            ValueError: 當 base64_data 為空或無法解碼為圖像時
+        """
+        if not base64_data:
+            raise ValueError("base64_data 不可為空")
+
+        try:
+            image = Image.open(io.BytesIO(base64.b64decode(base64_data)))
+            image.load()
+        except (ValueError, OSError) as e:
+            raise ValueError(f"Base64 圖像解碼失敗: {e}")
+        return image
+
     def save_base64_image(self, base64_data: str, file_path: str) -> None:
         """
         將 Base64 數據保存為圖像文件。
@@ -147,7 +182,7 @@ class ImageProcessor:
 
     def process_image(self, image_path: str, target_height: int, target_width: int) -> list:
         """
-        處理圖像並返回裁剪後的圖像數組。
+        讀取圖像文件，交由 process_pil_image 處理並返回裁剪後的圖像數組。
 
         Args:
             image_path (str): 圖像文件的路徑。
@@ -169,11 +204,38 @@ class ImageProcessor:
         """
         if not os.path.exists(image_path):
             raise FileNotFoundError(f"圖像文件不存在: {image_path}")
+
+        with Image.open(image_path) as image:
+            return self.process_pil_image(image, target_height, target_width)
+
+    def process_pil_image(self, image: Image.Image, target_height: int, target_width: int) -> list:
+        """
+        處理記憶體中的圖像並返回裁剪後的圖像數組。
+
+        Args:
+            image (Image.Image): 驗證碼的 PIL 圖像。
+            target_height (int): 目標圖像的高度。
+            target_width (int): 目標圖像的寬度。
+
+        Returns:
+            list: 裁剪後的圖像數組，以數字數組的形式表示。
+
+        Examples:
+            >>> processor = ImageProcessor()
+            >>> images = processor.process_pil_image(processor.decode_base64_image(base64_data), 30, 100)
+            >>> len(images)
+            4
+
+        Raises:
+            ValueError: 當 image 為 None 時
+            ValueError: 當 target_height 或 target_width 小於等於 0 時
+        """
+        if image is None:
+            raise ValueError("image 不可為 None")
         if target_height <= 0 or target_width <= 0:
             raise ValueError("target_height 和 target_width 必須大於 0")
         
-        # 開啟圖像並轉換為灰階
-        image = Image.open(image_path)
+        # 轉換為灰階
         gray_image = image.convert('L')
         image_array = np.array(gray_image)
         
@@ -222,7 +284,7 @@ class ImageProcessor:
             background.paste(cropped_image, paste_position)
             
             # 將處理後的圖像轉換為數組並加入列表
-            cropped_images.append(img_to_array(background))
+            cropped_images.append(np.asarray(background, dtype='float32'))
         
         return cropped_images
 
@@ -253,6 +315,225 @@ class ImageProcessor:
         return int((range1[1] + range2[0]) / 2)
 
 
+class TFLiteCaptchaModel:
+    """
+    以 TFLite 直譯器執行的驗證碼模型，提供與 Keras 模型相同的 input_shape、predict 與呼叫介面。
+
+    以 ai-edge-litert（LiteRT）直譯器執行，不需載入 TensorFlow；未安裝時直接拋出錯誤，不退回 TensorFlow 內建的直譯器，
+    避免在選用 TFLite 後端時仍載入完整的 TensorFlow。
+    直譯器不可同時被多個執行緒呼叫，呼叫端需以 CaptchaModelRegistry.inference_lock 序列化。
+
+    屬性:
+        input_shape (tuple): 模型輸入形狀，第一維（批次大小）為 None。
+
+    Examples:
+        >>> model = TFLiteCaptchaModel("captcha_model_1.tflite")
+        >>> model(np.zeros((4, 30, 100, 3), dtype='float32')).shape
+        (4, 36)
+
+    Raises:
+        RuntimeError: 當未安裝 ai-edge-litert 時
+        ValueError: 當模型載入失敗時
+    """
+
+    def __init__(self, model_path: str):
+        """
+        建立 TFLite 直譯器並配置張量。
+
+        Args:
+            model_path (str): .tflite 模型的文件路徑。
+
+        Examples:
+            >>> model = TFLiteCaptchaModel("captcha_model_1.tflite")
+
+        Raises:
+            RuntimeError: 當未安裝 ai-edge-litert 時
+            ValueError: 當模型載入失敗時
+        """
+        try:
+            from ai_edge_litert.interpreter import Interpreter
+        except ImportError as e:
+            raise RuntimeError(f"TFLite 後端需要安裝 ai-edge-litert: {e}") from e
+
+        try:
+            self.interpreter = Interpreter(model_path=model_path)
+            self.interpreter.allocate_tensors()
+        except (ValueError, RuntimeError) as e:
+            raise ValueError(f"TFLite 模型載入失敗: {e}")
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self.input_shape = (None, *(int(dim) for dim in self._input['shape'][1:]))
+
+    def __call__(self, x: np.ndarray, training: bool = False) -> np.ndarray:
+        """
+        執行一次推論，批次大小與上次不同時重新配置輸入張量。
+
+        Args:
+            x (np.ndarray): 模型輸入，形狀為 (批次大小, 高, 寬, 通道)。
+            training (bool): 與 Keras 模型介面相容的參數，不影響推論，預設為 False。
+
+        Returns:
+            np.ndarray: 每筆輸入的字元機率分布。
+
+        Examples:
+            >>> model(np.zeros((4, 30, 100, 3), dtype='float32'))
+
+        Raises:
+            ValueError: 當輸入形狀與模型不相容時
+        """
+        x = np.asarray(x, dtype=self._input['dtype'])
+        if tuple(self.interpreter.get_input_details()[0]['shape']) != x.shape:
+            self.interpreter.resize_tensor_input(self._input['index'], x.shape)
+            self.interpreter.allocate_tensors()
+        self.interpreter.set_tensor(self._input['index'], x)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output['index'])
+
+    def predict(self, x: np.ndarray, verbose: int = 0) -> np.ndarray:
+        """
+        與 Keras model.predict 相容的推論介面。
+
+        Args:
+            x (np.ndarray): 模型輸入，形狀為 (批次大小, 高, 寬, 通道)。
+            verbose (int): 與 Keras 介面相容的參數，不輸出任何訊息，預設為 0。
+
+        Returns:
+            np.ndarray: 每筆輸入的字元機率分布。
+
+        Examples:
+            >>> model.predict(np.zeros((1, 30, 100, 3), dtype='float32'))
+
+        Raises:
+            ValueError: 當輸入形狀與模型不相容時
+        """
+        return self(x)
+
+
+class CaptchaModelRegistry:
+    """
+    行程內共用的驗證碼模型登錄表，依模型路徑快取已載入的模型。
+
+    副檔名為 .tflite 時以 TFLiteCaptchaModel 載入，其餘以 Keras load_model 載入；
+    TensorFlow 只在第一次載入 Keras 模型時才匯入。
+    同一個行程中所有登入（包含並行的 worker 執行緒）共用同一份模型，
+    模型只會在第一次取用時載入一次；warm_up 可在啟動時於背景執行緒先載入模型並執行一次假推論，
+    讓第一次登入不需等待模型載入與推論圖建立。
+
+    Examples:
+        >>> CaptchaModelRegistry.warm_up("captcha_model_1.keras")
+        >>> model = CaptchaModelRegistry.get("captcha_model_1.keras")
+
+    Raises:
+        FileNotFoundError: 當模型文件不存在時
+        ValueError: 當模型載入失敗時
+    """
+
+    _models: Dict[str, object] = {}
+    _path_locks: Dict[str, threading.Lock] = {}
+    _lock = threading.Lock()
+
+    # Keras 模型不保證可在多個執行緒同時推論，推論時以此鎖序列化
+    inference_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, model_path: str):
+        """
+        取得模型，尚未載入時載入並快取；多個執行緒同時取用同一路徑時只會載入一次。
+
+        Args:
+            model_path (str): 預訓練模型的文件路徑。
+
+        Returns:
+            已載入的 Keras 模型或 TFLiteCaptchaModel。
+
+        Examples:
+            >>> model = CaptchaModelRegistry.get("captcha_model_1.keras")
+
+        Raises:
+            ValueError: 當 model_path 為空時
+            FileNotFoundError: 當模型文件不存在時
+            RuntimeError: 當 .tflite 模型所需的 ai-edge-litert 未安裝時
+            ValueError: 當模型載入失敗時
+        """
+        if not model_path:
+            raise ValueError("model_path 不可為空")
+
+        key = os.path.abspath(model_path)
+        with cls._lock:
+            model = cls._models.get(key)
+            if model is not None:
+                return model
+            path_lock = cls._path_locks.setdefault(key, threading.Lock())
+
+        # 以路徑各自的鎖載入，避免載入大型模型時阻擋其他路徑的取用
+        with path_lock:
+            model = cls._models.get(key)
+            if model is not None:
+                return model
+
+            if not os.path.exists(key):
+                raise FileNotFoundError(f"模型文件不存在: {model_path}")
+
+            start = time.time()
+            if key.endswith('.tflite'):
+                model = TFLiteCaptchaModel(key)
+            else:
+                from tensorflow.keras.models import load_model
+                try:
+                    model = load_model(key)
+                except (OSError, ValueError) as e:
+                    # 檔案損毀或格式不符；其餘例外（如 TensorFlow 匯入失敗）直接拋出
+                    raise ValueError(f"模型載入失敗: {e}")
+            print(f"載入驗證碼模型 {model_path}，耗時 {time.time() - start:.2f} 秒")
+
+            with cls._lock:
+                cls._models[key] = model
+            return model
+
+    @classmethod
+    def warm_up(cls, model_path: str, background: bool = True) -> Optional[threading.Thread]:
+        """
+        載入模型並以全白的假輸入執行一次推論，預先建立推論圖。
+
+        Args:
+            model_path (str): 預訓練模型的文件路徑。
+            background (bool): 是否於背景執行緒執行，預設為 True。
+
+        Returns:
+            Optional[threading.Thread]: 背景執行時為執行中的執行緒，否則為 None。
+
+        Examples:
+            >>> CaptchaModelRegistry.warm_up("captcha_model_1.keras")
+            <Thread(captcha-warm-up, started daemon ...)>
+
+        Raises:
+            ValueError: 當 model_path 為空時
+        """
+        if not model_path:
+            raise ValueError("model_path 不可為空")
+
+        def run():
+            start = time.time()
+            try:
+                model = cls.get(model_path)
+                # 輸入形狀中未固定的維度以驗證碼字元裁切後的大小 (30, 100, 3) 補上
+                shape = [dim if dim else default for dim, default in zip(model.input_shape[1:], (30, 100, 3))]
+                with cls.inference_lock:
+                    model.predict(np.ones((1, *shape), dtype='float32'), verbose=0)
+            except (FileNotFoundError, RuntimeError, ValueError) as e:
+                print(f"驗證碼模型預熱失敗: {e}")
+                return
+            print(f"驗證碼模型預熱完成，耗時 {time.time() - start:.2f} 秒")
+
+        if not background:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, name="captcha-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+
 class CaptchaSolver:
     """
     CaptchaSolver 類別負責處理驗證碼的預測與解碼。
@@ -260,7 +541,7 @@ class CaptchaSolver:
     透過預先訓練的深度學習模型，這個類別可以加載圖像數據並進行驗證碼的解碼與預測。
 
     屬性:
-        model: 預訓練的驗證碼識別模型。
+        model: 預訓練的驗證碼識別模型，由 CaptchaModelRegistry 在行程內共用。
     
     Examples:
         >>> solver = CaptchaSolver("captcha_model_1.keras")
@@ -274,7 +555,7 @@ class CaptchaSolver:
 
     def __init__(self, model_path: str):
         """
-        初始化 CaptchaSolver 類別並加載模型。
+        初始化 CaptchaSolver 類別，模型由 CaptchaModelRegistry 取得，同一路徑在行程內只載入一次。
 
         Args:
             model_path (str): 預訓練模型的文件路徑。
@@ -283,16 +564,11 @@ class CaptchaSolver:
             >>> solver = CaptchaSolver("captcha_model_1.keras")
         
         Raises:
+            ValueError: 當 model_path 為空時
             FileNotFoundError: 當模型文件不存在時
             ValueError: 當模型載入失敗時
         """
-        if not os.path.exists(model_path):
-            raise FileNotFoundError(f"模型文件不存在: {model_path}")
-        
-        try:
-            self.model = load_model(model_path)
-        except Exception as e:
-            raise ValueError(f"模型載入失敗: {e}")
+        self.model = CaptchaModelRegistry.get(model_path)
 
     def load_data(self, data_dir: str, target_height: int, target_width: int) -> np.ndarray:
         """
@@ -322,6 +598,31 @@ class CaptchaSolver:
         images = np.array(cropped_images, dtype='float32') / 255.0
         return images
 
+    def load_base64(self, base64_data: str, target_height: int, target_width: int) -> np.ndarray:
+        """
+        於記憶體中將 Base64 驗證碼圖像轉換為模型輸入，不寫入暫存文件，並行的 worker 不會互相覆蓋驗證碼。
+
+        Args:
+            base64_data (str): Base64 編碼的驗證碼圖像。
+            target_height (int): 圖像裁剪後的目標高度。
+            target_width (int): 圖像裁剪後的目標寬度。
+
+        Returns:
+            np.ndarray: 處理後的圖像數據數組，範圍在 [0, 1] 之間。
+
+        Examples:
+            >>> solver = CaptchaSolver("captcha_model_1.keras")
+            >>> images = solver.load_base64(image_base64, 30, 100)
+            >>> images.shape
+            (4, 30, 100, 3)
+
+        Raises:
+            ValueError: 當 base64_data 無法解碼或 target_height、target_width 無效時
+        """
+        processor = ImageProcessor()
+        cropped_images = processor.process_pil_image(processor.decode_base64_image(base64_data), target_height, target_width)
+        return np.array(cropped_images, dtype='float32') / 255.0
+
     def decode_prediction(self, pred: np.ndarray) -> str:
         """
         將模型的預測結果解碼為可讀的字元串。
@@ -347,12 +648,16 @@ class CaptchaSolver:
         int_to_char = {i: c for c, i in ImageProcessor.CHAR_TO_INT.items()}
         return ''.join([int_to_char[np.argmax(c)] for c in pred])
 
-    def predict_captcha(self, images: np.ndarray) -> str:
+    def predict_captcha(self, images: np.ndarray, batched: bool = True) -> str:
         """
         使用加載的模型對圖像數據進行預測，並解碼成驗證碼字串。
 
+        預設將同一張驗證碼的所有字元裁切圖以單次前向傳遞推論；batched 為 False 時沿用逐張呼叫 model.predict 的方式，
+        供比較延遲使用。
+
         Args:
-            images (np.ndarray): 預處理後的圖像數據數組。
+            images (np.ndarray): 預處理後的圖像數據數組，形狀為 (字元數, 高, 寬, 通道)。
+            batched (bool): 是否以單次前向傳遞推論所有字元，預設為 True。
 
         Returns:
             str: 解碼後的驗證碼字串。
@@ -370,5 +675,243 @@ class CaptchaSolver:
         if not isinstance(images, np.ndarray):
             raise ValueError("images 必須是 numpy ndarray")
         
-        predictions = [self.decode_prediction(self.model.predict(np.expand_dims(img, axis=0))) for img in images]
+        if batched:
+            return self.predict_batch(images[np.newaxis])[0]
+
+        with CaptchaModelRegistry.inference_lock:
+            predictions = [self.decode_prediction(self.model.predict(np.expand_dims(img, axis=0))) for img in images]
         return ''.join(predictions)
+
+    def predict_batch(self, captchas: np.ndarray) -> List[str]:
+        """
+        以單次前向傳遞推論多張驗證碼的所有字元裁切圖，供離線評估大量驗證碼使用。
+
+        直接呼叫 model(x, training=False)，省去 model.predict 每次建立資料集與批次迴圈的額外開銷。
+
+        Args:
+            captchas (np.ndarray): 多張驗證碼的裁切圖，形狀為 (驗證碼數, 字元數, 高, 寬, 通道)。
+
+        Returns:
+            List[str]: 依輸入順序解碼後的驗證碼字串。
+
+        Examples:
+            >>> solver = CaptchaSolver("captcha_model_1.keras")
+            >>> captchas = np.stack([solver.load_data(path, 30, 100) for path in ["a.png", "b.png"]])
+            >>> solver.predict_batch(captchas)
+            ['A1B2', 'C3D4']
+
+        Raises:
+            ValueError: 當 captchas 不是五維 numpy ndarray 時
+        """
+        pred = self.predict_proba(captchas)
+        return [self.decode_prediction(captcha_pred) for captcha_pred in pred]
+
+    def predict_proba(self, captchas: np.ndarray) -> np.ndarray:
+        """
+        以單次前向傳遞取得多張驗證碼每個字元的機率分布。
+
+        Args:
+            captchas (np.ndarray): 多張驗證碼的裁切圖，形狀為 (驗證碼數, 字元數, 高, 寬, 通道)。
+
+        Returns:
+            np.ndarray: 形狀為 (驗證碼數, 字元數, 類別數) 的機率分布。
+
+        Examples:
+            >>> solver = CaptchaSolver("captcha_model_1.keras")
+            >>> solver.predict_proba(solver.load_data("captcha.png", 30, 100)[np.newaxis]).shape
+            (1, 4, 36)
+
+        Raises:
+            ValueError: 當 captchas 不是五維 numpy ndarray 時
+        """
+        if not isinstance(captchas, np.ndarray) or captchas.ndim != 5:
+            raise ValueError("captchas 必須是形狀為 (驗證碼數, 字元數, 高, 寬, 通道) 的 numpy ndarray")
+
+        count, chars = captchas.shape[:2]
+        crops = captchas.reshape((count * chars, *captchas.shape[2:])).astype('float32', copy=False)
+        with CaptchaModelRegistry.inference_lock:
+            pred = np.asarray(self.model(crops, training=False))
+        return pred.reshape((count, chars, -1))
+
+
+def export_tflite(model_path: str, output_path: Optional[str] = None) -> str:
+    """
+    將 Keras 驗證碼模型轉換為 TFLite 模型，正式環境改用 .tflite 時不需載入 TensorFlow。
+
+    先以 Keras model.export 輸出 SavedModel，再交由 TFLiteConverter 轉換；只允許 TFLite 內建運算子，
+    轉換結果不依賴 TensorFlow 的 Flex 運算子，可由 ai-edge-litert 直譯器執行。
+
+    Args:
+        model_path (str): Keras 模型的文件路徑。
+        output_path (Optional[str]): 輸出路徑，預設為將 model_path 的副檔名改為 .tflite。
+
+    Returns:
+        str: 輸出的 .tflite 文件路徑。
+
+    Examples:
+        >>> export_tflite("captcha_model_1.keras")
+        'captcha_model_1.tflite'
+
+    Raises:
+        ValueError: 當 model_path 已是 .tflite 模型時
+        FileNotFoundError: 當模型文件不存在時
+        ValueError: 當模型載入失敗時
+    """
+    if model_path.endswith('.tflite'):
+        raise ValueError("model_path 必須是 Keras 模型")
+    output_path = output_path or f"{os.path.splitext(model_path)[0]}.tflite"
+
+    import tensorflow as tf
+
+    model = CaptchaModelRegistry.get(model_path)
+    saved_model_dir = tempfile.mkdtemp(prefix="captcha_saved_model_")
+    try:
+        model.export(saved_model_dir)
+        converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_dir)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS]
+        tflite_model = converter.convert()
+    finally:
+        shutil.rmtree(saved_model_dir, ignore_errors=True)
+
+    with open(output_path, "wb") as f:
+        f.write(tflite_model)
+    print(f"已輸出 TFLite 模型 {output_path}（{len(tflite_model) / 1024:.0f} KB）")
+    return output_path
+
+
+def check_parity(reference: CaptchaSolver, candidate: CaptchaSolver, captchas: np.ndarray) -> dict:
+    """
+    比對兩個後端對同一批驗證碼的解碼結果與機率分布差異。
+
+    Args:
+        reference (CaptchaSolver): 作為基準的 CaptchaSolver，通常為 Keras 模型。
+        candidate (CaptchaSolver): 要比對的 CaptchaSolver，例如 TFLite 模型。
+        captchas (np.ndarray): 多張驗證碼的裁切圖，形狀為 (驗證碼數, 字元數, 高, 寬, 通道)。
+
+    Returns:
+        dict: 包含 reference、candidate 解碼結果、mismatches 不一致的索引與 max_abs_diff 機率最大差異。
+
+    Examples:
+        >>> check_parity(CaptchaSolver("captcha_model_1.keras"), CaptchaSolver("captcha_model_1.tflite"), captchas)
+        {'reference': ['A1B2'], 'candidate': ['A1B2'], 'mismatches': [], 'max_abs_diff': 1.2e-06}
+
+    Raises:
+        ValueError: 當 captchas 不是五維 numpy ndarray 時
+    """
+    reference_pred = reference.predict_proba(captchas)
+    candidate_pred = candidate.predict_proba(captchas)
+    reference_labels = [reference.decode_prediction(pred) for pred in reference_pred]
+    candidate_labels = [candidate.decode_prediction(pred) for pred in candidate_pred]
+    return {
+        "reference": reference_labels,
+        "candidate": candidate_labels,
+        "mismatches": [i for i, (a, b) in enumerate(zip(reference_labels, candidate_labels)) if a != b],
+        "max_abs_diff": float(np.max(np.abs(reference_pred - candidate_pred))),
+    }
+
+
+def benchmark_inference(solver: CaptchaSolver, images: np.ndarray, iterations: int = 20) -> dict:
+    """
+    比較逐字元呼叫 model.predict 與單次前向傳遞推論同一張驗證碼的延遲，並確認兩者解碼結果相同。
+
+    Args:
+        solver (CaptchaSolver): 已載入模型的 CaptchaSolver。
+        images (np.ndarray): 單張驗證碼的裁切圖，形狀為 (字元數, 高, 寬, 通道)。
+        iterations (int): 每種方式的推論次數，預設為 20。
+
+    Returns:
+        dict: 包含 label、per_char 與 batched 平均毫秒數。
+
+    Examples:
+        >>> solver = CaptchaSolver("captcha_model_1.keras")
+        >>> benchmark_inference(solver, solver.load_data("captcha_image.png", 30, 100))
+        {'label': 'A1B2', 'per_char': 182.4, 'batched': 9.7}
+
+    Raises:
+        ValueError: 當 iterations 小於等於 0 時
+        RuntimeError: 當兩種方式的解碼結果不同時
+    """
+    if iterations <= 0:
+        raise ValueError("iterations 必須大於 0")
+
+    # 兩種方式各先執行一次，排除推論圖建立的耗時
+    per_char_label = solver.predict_captcha(images, batched=False)
+    batched_label = solver.predict_captcha(images)
+    if per_char_label != batched_label:
+        raise RuntimeError(f"逐字元與批次推論結果不同: {per_char_label} != {batched_label}")
+
+    timings = {"label": batched_label}
+    for name, batched in (("per_char", False), ("batched", True)):
+        start = time.time()
+        for _ in range(iterations):
+            solver.predict_captcha(images, batched=batched)
+        timings[name] = (time.time() - start) / iterations * 1000
+    return timings
+
+
+def report_backend(model_path: str, image_paths: List[str], iterations: int = 20, parity_model_path: Optional[str] = None) -> None:
+    """
+    輸出單一後端的模型載入耗時、推論延遲、峰值記憶體與批次解碼結果，並可與另一個模型比對。
+
+    模型載入耗時包含首次匯入 TensorFlow 或 TFLite 直譯器的時間；各後端應各自以獨立行程執行，峰值記憶體才可互相比較。
+
+    Args:
+        model_path (str): 驗證碼模型路徑，副檔名為 .tflite 時使用 TFLite 後端。
+        image_paths (List[str]): 驗證碼圖片路徑。
+        iterations (int): 延遲比較的推論次數，預設為 20。
+        parity_model_path (Optional[str]): 比對解碼結果的另一個模型路徑，預設為 None。
+
+    Examples:
+        >>> report_backend("captcha_model_1.tflite", ["captcha_image.png"], parity_model_path="captcha_model_1.keras")
+
+    Raises:
+        ValueError: 當 image_paths 為空時
+        FileNotFoundError: 當模型或圖片文件不存在時
+    """
+    if not image_paths:
+        raise ValueError("image_paths 不可為空")
+
+    start = time.time()
+    solver = CaptchaSolver(model_path)
+    load_seconds = time.time() - start
+    captchas = np.stack([solver.load_data(path, 30, 100) for path in image_paths])
+
+    timings = benchmark_inference(solver, captchas[0], iterations)
+    print(f"{image_paths[0]}: {timings['label']}，逐字元 predict 平均 {timings['per_char']:.1f} 毫秒，"
+          f"單次前向傳遞平均 {timings['batched']:.1f} 毫秒")
+
+    start = time.time()
+    labels = solver.predict_batch(captchas)
+    elapsed = time.time() - start
+    for path, label in zip(image_paths, labels):
+        print(f"{path}: {label}")
+    print(f"批次推論 {len(labels)} 張驗證碼，耗時 {elapsed * 1000:.1f} 毫秒")
+
+    # ru_maxrss 在 Linux 以 KB 為單位，於載入比對模型前量測
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"後端 {model_path}: 模型載入 {load_seconds:.2f} 秒，峰值記憶體 {peak_mb:.0f} MB")
+
+    if parity_model_path:
+        result = check_parity(CaptchaSolver(parity_model_path), solver, captchas)
+        print(f"與 {parity_model_path} 比對: {len(captchas) - len(result['mismatches'])}/{len(captchas)} 張一致，"
+              f"機率最大差異 {result['max_abs_diff']:.2e}")
+        for i in result["mismatches"]:
+            print(f"  {image_paths[i]}: {result['reference'][i]} != {result['candidate'][i]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="驗證碼模型推論延遲比較、後端比對與離線評估")
+    parser.add_argument("images", nargs="*", help="驗證碼圖片路徑，可指定多張")
+    parser.add_argument("--model", default="captcha_model_1.keras", help="驗證碼模型路徑，副檔名為 .tflite 時使用 TFLite 後端")
+    parser.add_argument("--iterations", type=int, default=20, help="延遲比較的推論次數")
+    parser.add_argument("--export-tflite", metavar="OUTPUT_PATH", nargs="?", const="",
+                        help="將 --model 指定的 Keras 模型轉換為 TFLite，未指定輸出路徑時改副檔名為 .tflite")
+    parser.add_argument("--parity-model", help="與 --model 比對解碼結果的另一個模型路徑")
+    args = parser.parse_args()
+
+    if args.export_tflite is None and not args.images:
+        parser.error("需要至少一張驗證碼圖片或 --export-tflite")
+    if args.export_tflite is not None:
+        export_tflite(args.model, args.export_tflite or None)
+    if args.images:
+        report_backend(args.model, args.images, args.iterations, args.parity_model)
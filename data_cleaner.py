@@ -2,9 +2,11 @@
 import re
 import time
 from datetime import datetime, timedelta
+from typing import List
 
 # 第三方庫
 from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -236,6 +238,47 @@ class FlightDataExtractor:
         ValueError: 當資料擷取失敗時
     """
     
+    # 讀取卡片航班明細文字的 JavaScript 函式，
+    # 篩選條件與 _determine_flight_direction、_find_segment_rows 的 XPath 相同
+    FLIGHT_TABLES_JS = """
+    function readFlightTables(card) {
+        const hasClass = (el, name) => (' ' + (el.getAttribute('class') || '').trim().split(/\\s+/).join(' ') + ' ')
+            .indexOf(' ' + name + ' ') !== -1;
+        const classContains = (el, name) => (el.getAttribute('class') || '').indexOf(name) !== -1;
+        const directCells = (tr, name) => Array.from(tr.children)
+            .filter(td => td.tagName === 'TD' && classContains(td, name));
+        const visibleText = el => el.getClientRects().length ? el.innerText.trim() : '';
+        const cellTexts = (tr, name) => {
+            const td = Array.from(tr.getElementsByTagName('td')).find(el => classContains(el, name));
+            return td ? Array.from(td.getElementsByTagName('p')).map(visibleText) : null;
+        };
+        return Array.from(card.querySelectorAll('table.flightDetails_table')).map(table => {
+            const hasReturnTitle = Array.from(table.getElementsByTagName('p')).some(p =>
+                classContains(p, 'detail_title') && p.textContent.indexOf('回程') !== -1);
+            const trs = Array.from(table.getElementsByTagName('tr'));
+            let rows = trs.filter(tr => !hasClass(tr, 'flightDetails_gray') && !hasClass(tr, 'middleStay') &&
+                directCells(tr, 'cell_2').some(td => hasClass(td, 'cell_2') && hasClass(td, 'b-box')));
+            if (!rows.length) {
+                rows = trs.filter(tr => !classContains(tr, 'flightDetails_gray') &&
+                    ['cell_2', 'cell_3', 'cell_5'].some(name => directCells(tr, name).length));
+            }
+            return {
+                class_name: table.getAttribute('class') || '',
+                has_return_title: hasReturnTitle,
+                rows: rows.map(tr => ({
+                    cell_2: cellTexts(tr, 'cell_2'),
+                    cell_3: cellTexts(tr, 'cell_3'),
+                    cell_5: cellTexts(tr, 'cell_5'),
+                    cell_6: cellTexts(tr, 'cell_6'),
+                })),
+            };
+        });
+    }
+    """
+    
+    # 以單次 execute_script 取回整張卡片航班明細文字的腳本
+    FLIGHT_DETAILS_SCRIPT = FLIGHT_TABLES_JS + "return readFlightTables(arguments[0]);"
+    
     def _validate_extract_parameters(
         self,
         card: webdriver.remote.webelement.WebElement,
@@ -444,15 +487,35 @@ class FlightDataExtractor:
         
         # 重試機制：嘗試三次提取航班資訊
         for _ in range(3):
-            p_texts = [p.text.strip() for p in cell2.find_elements(By.TAG_NAME, "p") if p.text.strip()]
-            candidates = [t for t in p_texts if re.search(r"[A-Z0-9]{2,3}\s?\d+", t)]
-            if candidates:
-                flight_and_cabin_text = candidates[-1]
+            p_texts = [p.text.strip() for p in cell2.find_elements(By.TAG_NAME, "p")]
+            flight_and_cabin_text = self._select_flight_and_cabin_text(p_texts)
+            if flight_and_cabin_text:
                 break
             time.sleep(0.2)
         
         return FlightDataParser.parse_flight_and_cabin(flight_and_cabin_text)
     
+    @staticmethod
+    def _select_flight_and_cabin_text(p_texts: list) -> str:
+        """
+        從 cell_2 的段落文字中選出含航班編號的最後一行。
+        
+        Args:
+            p_texts: cell_2 內各 <p> 的文字
+        
+        Returns:
+            str: 含航班編號的文字；找不到時為空字串
+        
+        Examples:
+            >>> FlightDataExtractor._select_flight_and_cabin_text(["長榮航空", "BR198 經濟艙 K"])
+            'BR198 經濟艙 K'
+        
+        Raises:
+            無特定錯誤
+        """
+        candidates = [t for t in p_texts if t and re.search(r"[A-Z0-9]{2,3}\s?\d+", t)]
+        return candidates[-1] if candidates else ""
+    
     def _extract_airport_and_time(
         self,
         row: webdriver.remote.webelement.WebElement,
@@ -487,11 +550,31 @@ class FlightDataExtractor:
         if not cell_class:
             raise ValueError("cell_class 不可為空")
         
-        airport = ""
-        dt = None
-        
         cell = row.find_element(By.CSS_SELECTOR, f"td.{cell_class}")
         cell_ps = [p.text.strip() for p in cell.find_elements(By.TAG_NAME, "p")]
+        return self._parse_airport_and_time(cell_ps, assumed_year)
+    
+    @staticmethod
+    def _parse_airport_and_time(cell_ps: list, assumed_year: int) -> tuple[str, datetime | None]:
+        """
+        從出發或抵達 cell 的段落文字解析機場代碼和時間。
+        
+        Args:
+            cell_ps: cell 內各 <p> 的文字
+            assumed_year: 假定的年份用於日期解析
+        
+        Returns:
+            tuple[str, datetime | None]: (機場 IATA 代碼, 日期時間物件)
+        
+        Examples:
+            >>> FlightDataExtractor._parse_airport_and_time(["TPE 台北", "10/15(三) 14:30"], 2025)
+            ('TPE', datetime.datetime(2025, 10, 15, 14, 30))
+        
+        Raises:
+            ValueError: 當日期時間格式無效時
+        """
+        airport = ""
+        dt = None
         
         if cell_ps:
             # 從第一行提取機場代碼
@@ -540,11 +623,31 @@ class FlightDataExtractor:
         if row is None:
             raise ValueError("row 不可為 None")
         
+        cell6 = row.find_element(By.CSS_SELECTOR, "td.cell_6")
+        cell6_ps = [p.text.strip() for p in cell6.find_elements(By.TAG_NAME, "p")]
+        return self._parse_equipment_and_duration(cell6_ps)
+    
+    @staticmethod
+    def _parse_equipment_and_duration(cell6_ps: list) -> tuple[str, timedelta]:
+        """
+        從 cell_6 的段落文字解析機型和飛行時間。
+        
+        Args:
+            cell6_ps: cell_6 內各 <p> 的文字
+        
+        Returns:
+            tuple[str, timedelta]: (機型文字, 飛行時間)
+        
+        Examples:
+            >>> FlightDataExtractor._parse_equipment_and_duration(["長榮航空 789", "03小時25分鐘"])
+            ('長榮航空 789', datetime.timedelta(seconds=12300))
+        
+        Raises:
+            無特定錯誤
+        """
         equipment_text = ""
         duration_td = timedelta(0)
-        
-        cell6 = row.find_element(By.CSS_SELECTOR, "td.cell_6")
-        cell6_ps = [p.text.strip() for p in cell6.find_elements(By.TAG_NAME, "p") if p.text.strip()]
+        cell6_ps = [t for t in cell6_ps if t]
         
         if cell6_ps:
             # 尋找飛行時間（包含「小時」或「分」的文字）
@@ -614,6 +717,45 @@ class FlightDataExtractor:
         # 提取機型和飛行時間
         equipment_text, duration_td = self._extract_equipment_and_duration(row)
         
+        return self._format_segment_data(
+            flight_no, cabin_and_code, dep_airport, dep_dt, arr_airport, arr_dt, equipment_text, duration_td
+        )
+    
+    @staticmethod
+    def _format_segment_data(
+        flight_no: str,
+        cabin_and_code: str,
+        dep_airport: str,
+        dep_dt: datetime | None,
+        arr_airport: str,
+        arr_dt: datetime | None,
+        equipment_text: str,
+        duration_td: timedelta
+    ) -> dict:
+        """
+        將解析後的航段欄位格式化為航段資料字典。
+        
+        Args:
+            flight_no: 航班編號
+            cabin_and_code: 艙等與艙等編碼
+            dep_airport: 出發機場
+            dep_dt: 出發時間
+            arr_airport: 抵達機場
+            arr_dt: 抵達時間
+            equipment_text: 機型
+            duration_td: 飛行時間
+        
+        Returns:
+            dict: 與 _extract_segment_data 相同格式的航段資料
+        
+        Examples:
+            >>> FlightDataExtractor._format_segment_data(
+            ...     "BR198", "經濟艙K", "TPE", None, "NRT", None, "", timedelta(0))["flight_no"]
+            'BR198'
+        
+        Raises:
+            無特定錯誤
+        """
         # 格式化日期時間
         dep_str = DateTimeParser.format_datetime_to_string(dep_dt)
         arr_str = DateTimeParser.format_datetime_to_string(arr_dt)
@@ -630,6 +772,38 @@ class FlightDataExtractor:
             "duration": dur_str
         }
     
+    @staticmethod
+    def split_record_by_leg(record: dict, departure_index: int, return_index: int) -> dict:
+        """
+        將航班記錄依方向拆為去程與回程欄位，以 (方向, 選項索引) 為鍵供航段快取使用。
+        
+        行李欄位（去程行李1 等）不屬於航段，即使 record 為含行李的完整資料列也會排除。
+        
+        Args:
+            record: 航班記錄或完整的資料列
+            departure_index: 去程選項索引
+            return_index: 回程選項索引
+        
+        Returns:
+            dict: {("去程", departure_index): 去程欄位, ("回程", return_index): 回程欄位}
+        
+        Examples:
+            >>> legs = FlightDataExtractor.split_record_by_leg(record, 0, 2)
+            >>> legs[("回程", 2)]["回程航班編號1"]
+            'BR197'
+        
+        Raises:
+            無特定錯誤
+        """
+        return {
+            ("去程", departure_index): {
+                k: v for k, v in record.items() if k.startswith("去程") and not k.startswith("去程行李")
+            },
+            ("回程", return_index): {
+                k: v for k, v in record.items() if k.startswith("回程") and not k.startswith("回程行李")
+            },
+        }
+    
     def _write_segment_to_record(
         self,
         record: dict,
@@ -753,6 +927,144 @@ class FlightDataExtractor:
         
         # 步驟 5: 返回結果
         return [record]
+    
+    def extract_and_clean_flight_data_by_script(
+        self,
+        card: webdriver.remote.webelement.WebElement,
+        start_date: str,
+        return_date: str
+    ) -> list:
+        """
+        以單次 execute_script 取回整張卡片的航班明細文字，再於 Python 端解析。
+        
+        逐一呼叫 find_element / .text 時每個航段需要數十次 WebDriver 往返，
+        此方法將整張卡片壓縮為一次往返，解析邏輯與 extract_and_clean_flight_data 共用。
+        若有航段尚未渲染出航班編號，改用 extract_and_clean_flight_data 的重試流程。
+
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            start_date (str): 去程日期，格式 'YYYY/MM/DD'，僅用於推斷年份。
+            return_date (str): 回程日期，格式 'YYYY/MM/DD'，僅用於推斷年份。
+
+        Returns:
+            list[dict]: 只包含一筆紀錄的列表，欄位與 extract_and_clean_flight_data 相同。
+        
+        Examples:
+            >>> extractor = FlightDataExtractor()
+            >>> data = extractor.extract_and_clean_flight_data_by_script(card, "2025/10/15", "2025/10/20")
+            >>> len(data)
+            1
+        
+        Raises:
+            ValueError: 當 card 為 None 或日期格式無效時
+            NoSuchElementException: 當航段缺少必要的 cell 元素時
+        """
+        year_outbound, year_inbound = self._validate_extract_parameters(
+            card, start_date, return_date
+        )
+        
+        tables = card.parent.execute_script(self.FLIGHT_DETAILS_SCRIPT, card) or []
+        record = self._build_record_from_tables(tables, year_outbound, year_inbound)
+        if record is None:
+            # 航班編號尚未渲染，交由逐元素流程重試
+            return self.extract_and_clean_flight_data(card, start_date, return_date)
+        return [record]
+    
+    def extract_flight_data_from_snapshot(
+        self,
+        card_snapshot: dict,
+        start_date: str,
+        return_date: str
+    ) -> dict | None:
+        """
+        從 CardSnapshotExtractor 取得的卡片快照解析目前選取組合的航班明細。
+        
+        Args:
+            card_snapshot (dict): CardSnapshotExtractor.capture 回傳的單張卡片快照。
+            start_date (str): 去程日期，格式 'YYYY/MM/DD'，僅用於推斷年份。
+            return_date (str): 回程日期，格式 'YYYY/MM/DD'，僅用於推斷年份。
+        
+        Returns:
+            dict | None: 航班記錄；快照中沒有可見的航班明細時為 None。
+        
+        Examples:
+            >>> extractor = FlightDataExtractor()
+            >>> record = extractor.extract_flight_data_from_snapshot(snapshots[0], "2025/10/15", "2025/10/20")
+        
+        Raises:
+            ValueError: 當 card_snapshot 為 None 或日期格式無效時
+            NoSuchElementException: 當航段缺少必要的 cell 元素時
+        """
+        year_outbound, year_inbound = self._validate_extract_parameters(
+            card_snapshot, start_date, return_date
+        )
+        return self._build_record_from_tables(card_snapshot["flight_tables"], year_outbound, year_inbound)
+    
+    def _build_record_from_tables(
+        self,
+        tables: list,
+        year_outbound: int,
+        year_inbound: int,
+        allow_incomplete: bool = False
+    ) -> dict | None:
+        """
+        將 readFlightTables 回傳的航班明細文字解析為航班記錄。
+        
+        Args:
+            tables: readFlightTables 回傳的表格列表
+            year_outbound: 去程年份
+            year_inbound: 回程年份
+            allow_incomplete: 為 True 時沒有表格或缺少航班編號仍回傳記錄（與逐元素流程重試失敗後的結果相同），預設為 False
+        
+        Returns:
+            dict | None: 航班記錄；allow_incomplete 為 False 且沒有表格或有航段尚未顯示航班編號時為 None
+        
+        Examples:
+            >>> extractor = FlightDataExtractor()
+            >>> record = extractor._build_record_from_tables(tables, 2025, 2025)
+            >>> record["去程航班編號1"]
+            'BR198'
+        
+        Raises:
+            NoSuchElementException: 當航段缺少必要的 cell 元素時
+        """
+        if not tables and not allow_incomplete:
+            return None
+        
+        record = self._initialize_flight_record()
+        segment_index = {"去程": 1, "回程": 1}
+        
+        for idx, table in enumerate(tables):
+            if table["has_return_title"] or "return_line" in table["class_name"]:
+                direction = "回程"
+            else:
+                direction = "回程" if idx == 1 else "去程"
+            assumed_year = year_inbound if direction == "回程" else year_outbound
+            
+            for row in table["rows"]:
+                if segment_index[direction] > 3:
+                    continue
+                
+                for cell_class in ["cell_2", "cell_3", "cell_5", "cell_6"]:
+                    if row[cell_class] is None:
+                        raise NoSuchElementException(f"航段缺少 td.{cell_class}")
+                
+                flight_and_cabin_text = self._select_flight_and_cabin_text(row["cell_2"])
+                if not flight_and_cabin_text and not allow_incomplete:
+                    return None
+                
+                flight_no, cabin_and_code = FlightDataParser.parse_flight_and_cabin(flight_and_cabin_text)
+                dep_airport, dep_dt = self._parse_airport_and_time(row["cell_3"], assumed_year)
+                arr_airport, arr_dt = self._parse_airport_and_time(row["cell_5"], assumed_year)
+                equipment_text, duration_td = self._parse_equipment_and_duration(row["cell_6"])
+                
+                segment_data = self._format_segment_data(
+                    flight_no, cabin_and_code, dep_airport, dep_dt, arr_airport, arr_dt, equipment_text, duration_td
+                )
+                self._write_segment_to_record(record, segment_data, direction, segment_index[direction])
+                segment_index[direction] += 1
+        
+        return record
 
 
 class PriceDataExtractor:
@@ -823,12 +1135,13 @@ class PriceDataExtractor:
         except Exception:
             return 0.0
     
-    def extract_and_clean_price_data(self, card: webdriver.remote.webelement.WebElement) -> list:
+    def extract_and_clean_price_data(self, card: webdriver.remote.webelement.WebElement, timeout: float = 5) -> list:
         """
         自單張航班卡片的「票價」區塊抽取並清洗資料。
         
         Args:
             card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            timeout (float): 等待 DBGModal 出現的上限秒數，預設為 5。
         
         Returns:
             list[dict]: 只包含一筆紀錄的列表。
@@ -846,8 +1159,41 @@ class PriceDataExtractor:
             raise ValueError("card 不可為 None")
         
         driver = getattr(card, "parent", None) or getattr(card, "_parent", None)
-        results = []
+        if driver is None:
+            return [self.parse_modal_text("")]
+
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.ID, "DBGModal"))
+            )
+        except Exception:
+            return [self.parse_modal_text("")]
 
+        try:
+            modal = driver.find_element(By.ID, "DBGModal")
+        except Exception:
+            return [self.parse_modal_text("")]
+
+        return [self.parse_modal_text(modal.text or "")]
+
+    def parse_modal_text(self, modal_text: str) -> dict:
+        """
+        解析 DBGModal 票價明細文字。
+        
+        Args:
+            modal_text (str): DBGModal 的顯示文字；取不到彈出視窗時傳入空字串以取得預設值。
+        
+        Returns:
+            dict: 票價紀錄。
+        
+        Examples:
+            >>> extractor = PriceDataExtractor()
+            >>> extractor.parse_modal_text("GDS Type: 1A")["GDS Type"]
+            '1A'
+        
+        Raises:
+            無特定錯誤
+        """
         record = {
             "GDS Type": "",
             "稅金": 0,
@@ -862,26 +1208,6 @@ class PriceDataExtractor:
             "公式類型": -1,
         }
 
-        if driver is None:
-            results.append(record)
-            return results
-
-        try:
-            WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.ID, "DBGModal"))
-            )
-        except Exception:
-            results.append(record)
-            return results
-
-        try:
-            modal = driver.find_element(By.ID, "DBGModal")
-        except Exception:
-            results.append(record)
-            return results
-
-        modal_text = modal.text or ""
-
         # 解析 GDS Type
         m = re.search(r"GDS\s*Type[:：]\s*([^\s\r\n]+)", modal_text)
         if m:
@@ -964,8 +1290,7 @@ class PriceDataExtractor:
             if m_total2:
                 record["總售價"] = self.parse_int(m_total2.group(1))
 
-        results.append(record)
-        return results
+        return record
 
 
 class BaggageDataExtractor:
@@ -1011,21 +1336,70 @@ class BaggageDataExtractor:
         if driver is None:
             raise ValueError("driver 不可為 None")
         
+        baggage_rows = []
+        for row in card.find_elements(By.CSS_SELECTOR, ".bagInformation_tab table.bagInformation tbody tr.bagInformation_item"):
+            baggage_rows.append({
+                "segment": row.find_element(By.CSS_SELECTOR, "td.segment").text.strip(),
+                "flight_num": row.find_element(By.CSS_SELECTOR, "td.flight_num").text.strip(),
+                "adult": row.find_element(By.CSS_SELECTOR, "td[data-title='成人']").text.strip(),
+            })
+        
+        return self._build_baggage_info(baggage_rows, current_flight_details)
+    
+    def extract_baggage_data_from_snapshot(self, card_snapshot: dict, current_flight_details: dict) -> dict | None:
+        """
+        從 CardSnapshotExtractor 取得的卡片快照解析目前選取組合的行李資訊。
+        
+        Args:
+            card_snapshot (dict): CardSnapshotExtractor.capture 回傳的單張卡片快照。
+            current_flight_details (dict): 當前航班的詳細資訊，用於判斷行李去回程。
+        
+        Returns:
+            dict | None: 行李資訊；快照中沒有可見的行李表格時為 None。
+        
+        Examples:
+            >>> extractor = BaggageDataExtractor()
+            >>> data = extractor.extract_baggage_data_from_snapshot(snapshots[0], flight_details)
+        
+        Raises:
+            ValueError: 當 card_snapshot 為 None 時
+        """
+        if card_snapshot is None:
+            raise ValueError("card_snapshot 不可為 None")
+        
+        if not card_snapshot["baggage_rows"]:
+            return None
+        return self._build_baggage_info(card_snapshot["baggage_rows"], current_flight_details)
+    
+    def _build_baggage_info(self, baggage_rows: list, current_flight_details: dict) -> dict:
+        """
+        將行李表格各列文字依航段對應到去程或回程行李欄位。
+        
+        Args:
+            baggage_rows: 每列包含 segment、flight_num、adult 文字的字典列表
+            current_flight_details: 當前航班的詳細資訊，用於判斷行李去回程
+        
+        Returns:
+            dict: 包含結構化行李數據的字典
+        
+        Examples:
+            >>> extractor = BaggageDataExtractor()
+            >>> extractor._build_baggage_info(
+            ...     [{"segment": "TPE 台北 － NRT 東京", "flight_num": "BR198", "adult": "23 公斤"}],
+            ...     {"去程起飛機場1": "TPE", "去程降落機場1": "NRT"})
+            {'去程行李1': '23公斤'}
+        
+        Raises:
+            無特定錯誤
+        """
         card_baggage_info = {}
         outbound_baggage_counter = 0
         return_baggage_counter = 0
 
-        baggage_rows = card.find_elements(By.CSS_SELECTOR, ".bagInformation_tab table.bagInformation tbody tr.bagInformation_item")
-
-        for row_idx, row in enumerate(baggage_rows):
-            segment_element = row.find_element(By.CSS_SELECTOR, "td.segment")
-            segment_text = segment_element.text.strip()
-
-            flight_num_element = row.find_element(By.CSS_SELECTOR, "td.flight_num")
-            flight_num_text = flight_num_element.text.strip()
-
-            adult_baggage_element = row.find_element(By.CSS_SELECTOR, "td[data-title='成人']")
-            adult_baggage_text = adult_baggage_element.text.strip()
+        for baggage_row in baggage_rows:
+            segment_text = baggage_row["segment"]
+            flight_num_text = baggage_row["flight_num"]
+            adult_baggage_text = baggage_row["adult"]
 
             match = re.search(r'(\d+)\s*(公斤|件)?', adult_baggage_text)
             if match:
@@ -1070,3 +1444,76 @@ class BaggageDataExtractor:
                 print(f"警告：無法判斷航段類型 ({flight_num_text})")
                 
         return card_baggage_info
+
+
+class CardSnapshotExtractor:
+    """
+    頁面快照擷取器，以一次 execute_script 序列化頁面上所有航班卡片。
+    
+    快照內容包含兩組 MultiSegment 的選項文字與目前選取索引、目前可見的航班明細與行李表格，
+    以及顯示票價，供 FlightDataExtractor、BaggageDataExtractor 等擷取器共用，
+    減少逐一 find_element 與點擊分頁的瀏覽器往返。
+    
+    Examples:
+        >>> snapshots = CardSnapshotExtractor().capture(driver)
+        >>> snapshots[0]["selected"]
+        [0, 0]
+    
+    Raises:
+        ValueError: 當 driver 為 None 時
+    """
+    
+    SNAPSHOT_SCRIPT = FlightDataExtractor.FLIGHT_TABLES_JS + """
+    const groupSelector = "div[ng-repeat='MultiSegment in cjSegment[$index]'][ng-init='MultiSegmentIndex=$index']";
+    const visibleText = el => el && el.getClientRects().length ? el.innerText.trim() : '';
+    return Array.from(document.getElementsByClassName('airPrice_box')).map(card => {
+        const groups = Array.from(card.querySelectorAll(groupSelector))
+            .filter(div => div.getAttribute('class') === 'ng-scope');
+        const options = groups.map(div => Array.from(div.querySelectorAll("input[type='radio'][name]")));
+        const labelOf = radio => {
+            const label = radio.closest('label') || radio.parentElement;
+            return label ? label.textContent.replace(/\\s+/g, ' ').trim() : '';
+        };
+        const price = card.querySelector("strong[bo-text='SaleGroup.Display_Price | number']");
+        return {
+            multi_segment_count: groups.length,
+            departure_options: (options[0] || []).map(labelOf),
+            return_options: (options[1] || []).map(labelOf),
+            selected: options.slice(0, 2).map(radios => radios.findIndex(radio => radio.checked)),
+            flight_tables: readFlightTables(card),
+            baggage_rows: Array.from(card.querySelectorAll(
+                '.bagInformation_tab table.bagInformation tbody tr.bagInformation_item'
+            )).filter(tr => tr.getClientRects().length).map(tr => ({
+                segment: visibleText(tr.querySelector('td.segment')),
+                flight_num: visibleText(tr.querySelector('td.flight_num')),
+                adult: visibleText(tr.querySelector("td[data-title='成人']")),
+            })),
+            display_price: price ? price.textContent.trim() : '',
+        };
+    });
+    """
+    
+    def capture(self, driver: webdriver.Chrome) -> List[dict]:
+        """
+        以一次瀏覽器呼叫取得頁面上所有航班卡片的快照。
+        
+        Args:
+            driver (webdriver.Chrome): 已載入票價頁面的 WebDriver 實例。
+        
+        Returns:
+            List[dict]: 依頁面順序排列的卡片快照，與 driver.find_elements(By.CLASS_NAME, 'airPrice_box') 一一對應。
+                每筆包含 multi_segment_count、departure_options、return_options、
+                selected（[去程索引, 回程索引]，未選取為 -1）、flight_tables、baggage_rows、display_price。
+        
+        Examples:
+            >>> snapshots = CardSnapshotExtractor().capture(driver)
+            >>> len(snapshots) > 0
+            True
+        
+        Raises:
+            ValueError: 當 driver 為 None 時
+        """
+        if driver is None:
+            raise ValueError("driver 不可為 None")
+        
+        return driver.execute_script(self.SNAPSHOT_SCRIPT) or []
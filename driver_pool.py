@@ -0,0 +1,505 @@
+# 標準庫
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+# 第三方庫
+import psutil
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+# 本地模組
+from profile_template import ChromeProfileTemplate
+from session_store import SessionStore
+from web_operator import WebDriverFactory, WebNavigator
+
+
+class WebDriverPool:
+    """
+    WebDriver 連線池，負責提供已啟動且已登入的 Chrome WebDriver 並重複使用。
+
+    每個 driver 在歸還時會進行健康檢查（瀏覽器存活、登入 session 在伺服器端仍有效、沒有殘留的彈出視窗），
+    並在達到任務數上限或 Chrome 行程樹記憶體上限時回收重建。
+    每個 driver 會分配獨立的遠端除錯連接埠與使用者資料目錄，可供多個 worker 同時使用。
+
+    屬性:
+        max_tasks_per_driver (int): 單一 driver 最多執行的任務數。
+        max_memory_mb (float): 單一 driver 的 Chrome 行程樹 RSS 上限（MB）。
+        session_store (Optional[SessionStore]): 登入 session 快取。
+        base_port (int): 分配遠端除錯連接埠的起始值。
+        page_load_strategy (str): 新建 driver 的頁面載入策略。
+        enable_performance_log (bool): 新建 driver 是否啟用 performance log。
+        profile_template (Optional[ChromeProfileTemplate]): 新建 driver 的使用者資料目錄範本。
+        captcha_debug_dir (Optional[str]): 登入時保存驗證碼圖片的除錯目錄。
+
+    Examples:
+        >>> pool = WebDriverPool(max_tasks_per_driver=20, max_memory_mb=1024)
+        >>> driver = pool.acquire("user", "pass", "captcha_model_1.keras")
+        >>> pool.release(driver)
+        >>> pool.close_all()
+
+    Raises:
+        ValueError: 當參數無效時
+    """
+
+    # 未提供 session_store 時登入 session 的檢查間隔秒數，與 SessionStore 的預設 TTL 相同
+    DEFAULT_SESSION_CHECK_SECONDS = 1800
+
+    def __init__(
+        self,
+        max_tasks_per_driver: int = 20,
+        max_memory_mb: float = 1024,
+        session_store: Optional[SessionStore] = None,
+        base_port: int = 9222,
+        page_load_strategy: str = 'normal',
+        enable_performance_log: bool = False,
+        profile_template: Optional[ChromeProfileTemplate] = None,
+        captcha_debug_dir: Optional[str] = None
+    ):
+        """
+        初始化 WebDriver 連線池。
+
+        Args:
+            max_tasks_per_driver (int): 單一 driver 最多執行的任務數，預設為 20。
+            max_memory_mb (float): 單一 driver 的 Chrome 行程樹（瀏覽器、renderer、GPU 等子行程）RSS 上限（MB），預設為 1024。
+            session_store (Optional[SessionStore]): 登入 session 快取，新建 driver 時優先還原快取的 session，預設為 None。
+            base_port (int): 分配遠端除錯連接埠的起始值，預設為 9222。
+            page_load_strategy (str): 新建 driver 的頁面載入策略，預設為 'normal'。
+            enable_performance_log (bool): 新建 driver 是否啟用 performance log（錄製 XHR fixture 時需要），預設為 False。
+            profile_template (Optional[ChromeProfileTemplate]): 已預熱的使用者資料目錄範本，提供時新建 driver
+                前先複製到獨立的使用者資料目錄；範本不存在時改用空白目錄，預設為 None。
+            captcha_debug_dir (Optional[str]): 登入時保存驗證碼圖片的除錯目錄，預設為 None 不保存。
+
+        Examples:
+            >>> pool = WebDriverPool(max_tasks_per_driver=10)
+
+        Raises:
+            ValueError: 當 max_tasks_per_driver 或 max_memory_mb 小於等於 0 時
+        """
+        if max_tasks_per_driver <= 0:
+            raise ValueError("max_tasks_per_driver 必須大於 0")
+        if max_memory_mb <= 0:
+            raise ValueError("max_memory_mb 必須大於 0")
+
+        self.max_tasks_per_driver = max_tasks_per_driver
+        self.max_memory_mb = max_memory_mb
+        self.session_store = session_store
+        self.base_port = base_port
+        self.page_load_strategy = page_load_strategy
+        self.enable_performance_log = enable_performance_log
+        self.profile_template = profile_template
+        if profile_template is not None and not profile_template.exists():
+            print(f"Chrome 範本目錄 {profile_template.template_dir} 不存在，新建 driver 改用空白目錄")
+            self.profile_template = None
+        self.captcha_debug_dir = captcha_debug_dir
+        self._idle_drivers: List[webdriver.Chrome] = []
+        self._task_counts: Dict[int, int] = {}
+        self._session_checked_at: Dict[int, float] = {}
+        self._resources: Dict[int, Tuple[int, str]] = {}
+        self._used_ports: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def acquire(self, username: str, password: str, captcha_model_path: str) -> webdriver.Chrome:
+        """
+        取得一個已登入的 WebDriver；若池中沒有閒置的 driver 則建立並登入新的 driver。
+
+        Args:
+            username (str): 登入帳號。
+            password (str): 登入密碼。
+            captcha_model_path (str): 驗證碼模型路徑。
+
+        Returns:
+            webdriver.Chrome: 已登入的 Chrome WebDriver 實例。
+
+        Examples:
+            >>> pool = WebDriverPool()
+            >>> driver = pool.acquire("user", "pass", "captcha_model_1.keras")
+
+        Raises:
+            ValueError: 當 username、password 或 captcha_model_path 為空時
+            RuntimeError: 當 WebDriver 建立或登入失敗時
+        """
+        with self._lock:
+            if self._idle_drivers:
+                driver = self._idle_drivers.pop()
+                print(f"從連線池取得 driver（已執行 {self._task_counts[id(driver)]} 個任務）")
+                return driver
+
+        port, user_data_dir = self._allocate_resources()
+        launch_start = time.time()
+        try:
+            driver = WebDriverFactory.create_driver(
+                remote_debugging_port=port,
+                user_data_dir=user_data_dir,
+                page_load_strategy=self.page_load_strategy,
+                enable_performance_log=self.enable_performance_log
+            )
+        except RuntimeError:
+            self._free_resources(port, user_data_dir)
+            raise
+        print(f"Chrome 啟動耗時 {time.time() - launch_start:.2f} 秒（{'範本目錄' if self.profile_template else '空白目錄'}）")
+
+        with self._lock:
+            self._task_counts[id(driver)] = 0
+            self._resources[id(driver)] = (port, user_data_dir)
+
+        navigator = WebNavigator(driver)
+        try:
+            navigator.login_with_retry(
+                username,
+                password,
+                captcha_model_path,
+                session_store=self.session_store,
+                captcha_debug_dir=self.captcha_debug_dir
+            )
+        except (WebDriverException, RuntimeError, OSError, ValueError):
+            # 登入失敗（驗證碼、模型載入、逾時等）時關閉 Chrome 並釋放連接埠與使用者資料目錄
+            self._discard(driver)
+            raise
+        if not self._is_alive(driver):
+            self._discard(driver)
+            raise RuntimeError("WebDriver 登入失敗，無法加入連線池")
+        with self._lock:
+            self._session_checked_at[id(driver)] = time.time()
+
+        print(f"連線池建立新的已登入 driver（連接埠 {port}）")
+        return driver
+
+    def remaining_tasks(self, driver: webdriver.Chrome) -> int:
+        """
+        取得 driver 在達到 max_tasks_per_driver 前還能執行的任務數，包含目前正在執行的任務。
+
+        Args:
+            driver (webdriver.Chrome): 由 acquire 取得的 WebDriver 實例。
+
+        Returns:
+            int: 剩餘可執行的任務數。
+
+        Examples:
+            >>> pool = WebDriverPool(max_tasks_per_driver=20)
+            >>> driver = pool.acquire("user", "pass", "captcha_model_1.keras")
+            >>> pool.remaining_tasks(driver)
+            20
+
+        Raises:
+            無特定錯誤
+        """
+        with self._lock:
+            return self.max_tasks_per_driver - self._task_counts.get(id(driver), 0)
+
+    def complete_task(self, driver: webdriver.Chrome) -> bool:
+        """
+        累計一個已完成的任務，並檢查 driver 是否仍可繼續使用。
+
+        達到任務數上限、健康檢查未通過或記憶體超過上限時關閉 driver。
+        以同一個 driver 連續處理多個頁面時，每個頁面完成後呼叫一次，最後一個頁面改由 release 累計。
+
+        Args:
+            driver (webdriver.Chrome): 由 acquire 取得的 WebDriver 實例。
+
+        Returns:
+            bool: driver 仍可使用時為 True；已被關閉時為 False。
+
+        Examples:
+            >>> pool = WebDriverPool()
+            >>> driver = pool.acquire("user", "pass", "captcha_model_1.keras")
+            >>> pool.complete_task(driver)
+            True
+
+        Raises:
+            ValueError: 當 driver 為 None 時
+        """
+        if driver is None:
+            raise ValueError("driver 不可為 None")
+
+        with self._lock:
+            task_count = self._task_counts.get(id(driver), 0) + 1
+            self._task_counts[id(driver)] = task_count
+
+        if task_count >= self.max_tasks_per_driver:
+            print(f"driver 已執行 {task_count} 個任務，回收重建")
+            self._discard(driver)
+            return False
+
+        if not self._is_healthy(driver):
+            print("driver 健康檢查未通過，回收重建")
+            self._discard(driver)
+            return False
+
+        memory_mb = self._get_memory_usage_mb(driver)
+        if memory_mb > self.max_memory_mb:
+            print(f"driver 記憶體用量 {memory_mb:.1f} MB 超過上限 {self.max_memory_mb} MB，回收重建")
+            self._discard(driver)
+            return False
+
+        return True
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        歸還 WebDriver 至連線池。
+
+        歸還時以 complete_task 累計任務數並進行健康檢查，未通過檢查或超過上限的 driver 會直接關閉。
+
+        Args:
+            driver (webdriver.Chrome): 要歸還的 WebDriver 實例。
+
+        Examples:
+            >>> pool = WebDriverPool()
+            >>> driver = pool.acquire("user", "pass", "captcha_model_1.keras")
+            >>> pool.release(driver)
+
+        Raises:
+            ValueError: 當 driver 為 None 時
+        """
+        if driver is None:
+            raise ValueError("driver 不可為 None")
+
+        if not self.complete_task(driver):
+            return
+
+        # 清空頁面釋放資源，保留登入 cookie
+        try:
+            driver.get("about:blank")
+        except WebDriverException as e:
+            print(f"driver 重設頁面失敗，回收重建: {e}")
+            self._discard(driver)
+            return
+
+        with self._lock:
+            self._idle_drivers.append(driver)
+
+    def close_all(self) -> None:
+        """
+        關閉連線池中所有閒置的 WebDriver。
+
+        Examples:
+            >>> pool = WebDriverPool()
+            >>> pool.close_all()
+
+        Raises:
+            無特定錯誤
+        """
+        with self._lock:
+            drivers = list(self._idle_drivers)
+            self._idle_drivers.clear()
+
+        for driver in drivers:
+            self._discard(driver)
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        """
+        關閉 WebDriver 並移除其任務計數。
+
+        Args:
+            driver (webdriver.Chrome): 要關閉的 WebDriver 實例。
+
+        Examples:
+            >>> pool._discard(driver)
+
+        Raises:
+            無特定錯誤（關閉失敗時僅記錄訊息）
+        """
+        with self._lock:
+            self._task_counts.pop(id(driver), None)
+            self._session_checked_at.pop(id(driver), None)
+            resources = self._resources.pop(id(driver), None)
+        try:
+            driver.quit()
+        except (WebDriverException, OSError) as e:
+            # driver 可能已在登入失敗時關閉，再次 quit 會拋出連線錯誤
+            print(f"關閉 driver 失敗: {e}")
+        if resources:
+            self._free_resources(*resources)
+
+    def _allocate_resources(self) -> Tuple[int, str]:
+        """
+        為新的 driver 分配尚未使用的遠端除錯連接埠與獨立的使用者資料目錄，有範本時複製範本內容。
+
+        Returns:
+            Tuple[int, str]: (連接埠, 使用者資料目錄路徑)。
+
+        Examples:
+            >>> pool = WebDriverPool()
+            >>> port, user_data_dir = pool._allocate_resources()
+            >>> port
+            9222
+
+        Raises:
+            OSError: 當暫存目錄建立失敗時
+        """
+        with self._lock:
+            port = self.base_port
+            while port in self._used_ports:
+                port += 1
+            self._used_ports.add(port)
+        user_data_dir = tempfile.mkdtemp(prefix=f"chrome_profile_{port}_")
+        if self.profile_template is not None:
+            try:
+                copy_seconds = self.profile_template.copy_to(user_data_dir)
+                print(f"已複製 Chrome 範本至 {user_data_dir}，耗時 {copy_seconds:.2f} 秒")
+            except OSError as e:
+                # 複製失敗時清空目錄，改以空白目錄啟動
+                print(f"複製 Chrome 範本失敗，改用空白目錄: {e}")
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+                os.makedirs(user_data_dir, exist_ok=True)
+        return port, user_data_dir
+
+    def _free_resources(self, port: int, user_data_dir: str) -> None:
+        """
+        釋放 driver 使用的連接埠並刪除使用者資料目錄。
+
+        Args:
+            port (int): 要釋放的連接埠。
+            user_data_dir (str): 要刪除的使用者資料目錄路徑。
+
+        Examples:
+            >>> pool._free_resources(9222, "/tmp/chrome_profile_9222_abc")
+
+        Raises:
+            無特定錯誤
+        """
+        with self._lock:
+            self._used_ports.discard(port)
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        """
+        檢查瀏覽器與 WebDriver session 是否仍可回應。
+
+        Args:
+            driver (webdriver.Chrome): 要檢查的 WebDriver 實例。
+
+        Returns:
+            bool: 可回應時為 True。
+
+        Examples:
+            >>> WebDriverPool._is_alive(driver)
+            True
+
+        Raises:
+            無特定錯誤
+        """
+        try:
+            driver.execute_script("return document.readyState")
+            return True
+        except WebDriverException:
+            return False
+
+    def _is_healthy(self, driver: webdriver.Chrome) -> bool:
+        """
+        健康檢查：瀏覽器存活、登入 session 在伺服器端仍有效、沒有殘留的 alert 或票價彈出視窗。
+
+        過期的 ASP.NET session 仍會留下 cookie，因此以 SessionStore 相同的會員登入頁請求確認登入狀態；
+        此請求需經過網路，距離上次確認未超過 session 快取的 TTL 時略過，不在每個任務後都發出。
+
+        Args:
+            driver (webdriver.Chrome): 要檢查的 WebDriver 實例。
+
+        Returns:
+            bool: 通過健康檢查時為 True。
+
+        Examples:
+            >>> pool = WebDriverPool()
+            >>> pool._is_healthy(driver)
+            True
+
+        Raises:
+            無特定錯誤
+        """
+        try:
+            # 先關閉殘留的 alert，否則後續的 script 呼叫都會失敗
+            alert = EC.alert_is_present()(driver)
+            if alert:
+                alert.accept()
+        except WebDriverException:
+            return False
+
+        if not self._is_alive(driver):
+            return False
+
+        try:
+            if self._session_check_due(driver):
+                if not SessionStore.is_session_valid(driver.get_cookies()):
+                    print("driver 登入 session 已失效")
+                    return False
+                with self._lock:
+                    self._session_checked_at[id(driver)] = time.time()
+
+            # 關閉殘留的票價彈出視窗
+            overlays = driver.find_elements(By.CSS_SELECTOR, ".ui-widget-overlay.ui-front")
+            for overlay in overlays:
+                driver.execute_script("arguments[0].click();", overlay)
+            if overlays and driver.find_elements(By.CSS_SELECTOR, ".ui-widget-overlay.ui-front"):
+                return False
+        except WebDriverException:
+            return False
+
+        return True
+
+    def _session_check_due(self, driver: webdriver.Chrome) -> bool:
+        """
+        判斷是否需要再次向伺服器確認 driver 的登入 session。
+
+        檢查間隔為 session_store 的 TTL，未提供 session_store 時為 DEFAULT_SESSION_CHECK_SECONDS。
+
+        Args:
+            driver (webdriver.Chrome): 要檢查的 WebDriver 實例。
+
+        Returns:
+            bool: 距離上次確認已超過檢查間隔或從未確認時為 True。
+
+        Examples:
+            >>> pool._session_check_due(driver)
+            False
+
+        Raises:
+            無特定錯誤
+        """
+        interval = self.session_store.ttl_seconds if self.session_store else self.DEFAULT_SESSION_CHECK_SECONDS
+        with self._lock:
+            checked_at = self._session_checked_at.get(id(driver))
+        return checked_at is None or time.time() - checked_at >= interval
+
+    @staticmethod
+    def _get_memory_usage_mb(driver: webdriver.Chrome) -> float:
+        """
+        取得 chromedriver 所有子行程（瀏覽器、renderer、GPU、網路服務等）的 RSS 總和（MB）。
+
+        各行程共用的記憶體頁會重複計入，數值會略高於實際用量，但可反映 renderer 與 GPU 行程的成長。
+
+        Args:
+            driver (webdriver.Chrome): 要檢查的 WebDriver 實例。
+
+        Returns:
+            float: Chrome 行程樹 RSS 總和（MB）；無法取得 chromedriver 行程時為 0。
+
+        Examples:
+            >>> WebDriverPool._get_memory_usage_mb(driver)
+            612.4
+
+        Raises:
+            無特定錯誤
+        """
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is None:
+            return 0.0
+
+        try:
+            processes = psutil.Process(process.pid).children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return 0.0
+
+        total_bytes = 0
+        for child in processes:
+            try:
+                total_bytes += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # 子行程可能在列舉後結束
+                continue
+        return total_bytes / (1024 * 1024)
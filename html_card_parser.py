@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+航班卡片 HTML 離線解析器
+
+以 lxml 解析卡片或 DBGModal 的 outerHTML，產生與 data_cleaner 各擷取器相同格式的紀錄，
+可交由 ProcessPoolExecutor 並行解析，讓瀏覽器不必等待解析完成即可處理下一個組合。
+
+使用方式：
+    python html_card_parser.py --fixtures-dir html_fixtures
+"""
+
+# 標準庫
+import argparse
+import json
+import os
+from typing import List, Optional
+
+# 第三方庫
+from lxml import html as lxml_html
+
+# 本地模組
+from data_cleaner import BaggageDataExtractor, FlightDataExtractor, PriceDataExtractor
+
+
+# 與 Selenium WebElement.text 相同，區塊元素前後視為換行
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset", "figcaption",
+    "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main",
+    "nav", "ol", "p", "pre", "section", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}
+HIDDEN_TAGS = {"script", "style", "template", "noscript", "head", "title", "meta", "link"}
+
+
+def _class_xpath(class_name: str) -> str:
+    """
+    產生與 CSS class 選擇器相同語意的 XPath 條件。
+
+    Args:
+        class_name (str): class 名稱。
+
+    Returns:
+        str: XPath 條件字串。
+
+    Examples:
+        >>> _class_xpath("cell_2")
+        "contains(concat(' ', normalize-space(@class), ' '), ' cell_2 ')"
+
+    Raises:
+        無特定錯誤
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def _is_hidden(element) -> bool:
+    """
+    判斷元素本身是否被隱藏（ng-hide、hidden 屬性或 inline style 的 display:none）。
+
+    離線 HTML 沒有版面資訊，只能依標記判斷，足以涵蓋 Angular ng-show / ng-hide 切換的內容。
+
+    Args:
+        element: lxml 元素。
+
+    Returns:
+        bool: 被隱藏時為 True。
+
+    Examples:
+        >>> _is_hidden(lxml_html.fragment_fromstring('<p class="ng-hide">x</p>'))
+        True
+
+    Raises:
+        無特定錯誤
+    """
+    if not isinstance(element.tag, str) or element.tag in HIDDEN_TAGS:
+        return True
+    if element.get("hidden") is not None:
+        return True
+    if "ng-hide" in (element.get("class") or "").split():
+        return True
+    style = (element.get("style") or "").replace(" ", "").lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def visible_text(element) -> str:
+    """
+    取得元素的可見文字，規則比照 Selenium WebElement.text：
+    隱藏元素（含祖先被隱藏）為空字串、區塊元素與 <br> 換行、每行壓縮空白並去除空行。
+
+    Args:
+        element: lxml 元素。
+
+    Returns:
+        str: 可見文字。
+
+    Examples:
+        >>> visible_text(lxml_html.fragment_fromstring('<td><p>TPE  台北</p><p class="ng-hide">x</p></td>'))
+        'TPE 台北'
+
+    Raises:
+        無特定錯誤
+    """
+    if any(_is_hidden(node) for node in element.iterancestors()) or _is_hidden(element):
+        return ""
+
+    pieces = []
+
+    def walk(node):
+        is_block = node.tag in BLOCK_TAGS
+        if is_block or node.tag == "br":
+            pieces.append("\n")
+        if node.text:
+            pieces.append(node.text)
+        for child in node:
+            if not _is_hidden(child):
+                walk(child)
+            if child.tail:
+                pieces.append(child.tail)
+        if is_block:
+            pieces.append("\n")
+
+    walk(element)
+    lines = (" ".join(line.replace("\xa0", " ").split()) for line in "".join(pieces).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class HtmlCardParser:
+    """
+    航班卡片 HTML 離線解析器，輸入卡片或 DBGModal 的 outerHTML，輸出與 Selenium 擷取流程相同的紀錄。
+
+    選擇器與 FlightDataExtractor、BaggageDataExtractor 的 XPath 相同，
+    文字解析直接沿用 data_cleaner 的解析函式，確保兩條路徑結果一致。
+
+    Examples:
+        >>> parser = HtmlCardParser()
+        >>> record = parser.parse_flight_data(card_html, "2025/10/15", "2025/10/20")[0]
+
+    Raises:
+        ValueError: 當 HTML 為空時
+    """
+
+    SEGMENT_ROW_XPATH = (
+        ".//tr[not(" + _class_xpath("flightDetails_gray") + ") and not(" + _class_xpath("middleStay") + ") and "
+        "td[" + _class_xpath("cell_2") + " and " + _class_xpath("b-box") + "]]"
+    )
+    FALLBACK_SEGMENT_ROW_XPATH = (
+        ".//tr[not(contains(@class,'flightDetails_gray')) and "
+        "(td[contains(@class,'cell_2')] or td[contains(@class,'cell_3')] or td[contains(@class,'cell_5')])]"
+    )
+    RETURN_TITLE_XPATH = (
+        ".//p[contains(@class,'detail_title') and contains(.,'回程')] | "
+        ".//p[contains(@class,'desktop_detail_title') and contains(.,'回程')]"
+    )
+    BAGGAGE_ROW_XPATH = (
+        ".//*[" + _class_xpath("bagInformation_tab") + "]//table[" + _class_xpath("bagInformation") + "]"
+        "//tbody//tr[" + _class_xpath("bagInformation_item") + "]"
+    )
+
+    def __init__(self):
+        """
+        初始化離線解析器。
+
+        Examples:
+            >>> parser = HtmlCardParser()
+
+        Raises:
+            無特定錯誤
+        """
+        self.flight_extractor = FlightDataExtractor()
+        self.baggage_extractor = BaggageDataExtractor()
+        self.price_extractor = PriceDataExtractor()
+
+    @staticmethod
+    def _parse_root(source_html: str):
+        """
+        將 HTML 字串解析為 lxml 元素。
+
+        Args:
+            source_html (str): 卡片或彈出視窗的 outerHTML，也可以是整頁 page_source。
+
+        Returns:
+            lxml 元素。
+
+        Examples:
+            >>> HtmlCardParser._parse_root("<div class='airPrice_box'></div>").tag
+            'div'
+
+        Raises:
+            ValueError: 當 source_html 為空時
+        """
+        if not source_html:
+            raise ValueError("source_html 不可為空")
+        return lxml_html.fromstring(source_html)
+
+    @staticmethod
+    def _cell_texts(row, cell_class: str) -> Optional[List[str]]:
+        """
+        取得航段列中指定 cell 內各 <p> 的可見文字。
+
+        Args:
+            row: 航段列 lxml 元素。
+            cell_class (str): cell 的 class 名稱，例如 'cell_2'。
+
+        Returns:
+            Optional[List[str]]: 各 <p> 的文字；找不到 cell 時為 None。
+
+        Examples:
+            >>> HtmlCardParser._cell_texts(row, "cell_3")
+            ['TPE 台北', '10/15(三) 14:30']
+
+        Raises:
+            無特定錯誤
+        """
+        cells = row.xpath(".//td[" + _class_xpath(cell_class) + "]")
+        if not cells:
+            return None
+        return [visible_text(p) for p in cells[0].iter("p")]
+
+    def _read_flight_tables(self, card) -> List[dict]:
+        """
+        讀取卡片中的航班明細表格，輸出格式與 FlightDataExtractor.FLIGHT_TABLES_JS 相同。
+
+        Args:
+            card: 卡片 lxml 元素。
+
+        Returns:
+            List[dict]: 每個表格包含 class_name、has_return_title、rows。
+
+        Examples:
+            >>> tables = HtmlCardParser()._read_flight_tables(card)
+
+        Raises:
+            無特定錯誤
+        """
+        tables = []
+        for table in card.xpath(".//table[" + _class_xpath("flightDetails_table") + "]"):
+            rows = table.xpath(self.SEGMENT_ROW_XPATH) or table.xpath(self.FALLBACK_SEGMENT_ROW_XPATH)
+            tables.append({
+                "class_name": table.get("class") or "",
+                "has_return_title": bool(table.xpath(self.RETURN_TITLE_XPATH)),
+                "rows": [
+                    {cell_class: self._cell_texts(row, cell_class)
+                     for cell_class in ["cell_2", "cell_3", "cell_5", "cell_6"]}
+                    for row in rows
+                ],
+            })
+        return tables
+
+    def parse_flight_data(self, card_html: str, start_date: str, return_date: str) -> list:
+        """
+        解析航班資訊分頁開啟時的卡片 HTML。
+
+        Args:
+            card_html (str): 卡片 outerHTML。
+            start_date (str): 去程日期，格式 'YYYY/MM/DD'，僅用於推斷年份。
+            return_date (str): 回程日期，格式 'YYYY/MM/DD'，僅用於推斷年份。
+
+        Returns:
+            list[dict]: 只包含一筆紀錄的列表，欄位與 FlightDataExtractor.extract_and_clean_flight_data 相同。
+
+        Examples:
+            >>> parser = HtmlCardParser()
+            >>> parser.parse_flight_data(card_html, "2025/10/15", "2025/10/20")[0]["去程航班編號1"]
+            'BR198'
+
+        Raises:
+            ValueError: 當 card_html 為空或日期格式無效時
+            NoSuchElementException: 當航段缺少必要的 cell 元素時
+        """
+        card = self._parse_root(card_html)
+        year_outbound, year_inbound = self.flight_extractor._validate_extract_parameters(
+            card, start_date, return_date
+        )
+        record = self.flight_extractor._build_record_from_tables(
+            self._read_flight_tables(card), year_outbound, year_inbound, allow_incomplete=True
+        )
+        return [record]
+
+    def parse_baggage_data(self, card_html: str, current_flight_details: dict) -> dict:
+        """
+        解析行李資訊分頁開啟時的卡片 HTML。
+
+        Args:
+            card_html (str): 卡片 outerHTML。
+            current_flight_details (dict): 當前航班記錄，用於判斷行李去回程。
+
+        Returns:
+            dict: 與 BaggageDataExtractor.extract_and_clean_baggage_data 相同格式的行李資訊。
+
+        Examples:
+            >>> HtmlCardParser().parse_baggage_data(card_html, flight_record)
+            {'去程行李1': '23公斤', '回程行李1': '23公斤'}
+
+        Raises:
+            ValueError: 當 card_html 為空時
+        """
+        card = self._parse_root(card_html)
+        baggage_rows = []
+        for row in card.xpath(self.BAGGAGE_ROW_XPATH):
+            texts = {}
+            for key, xpath in [
+                ("segment", ".//td[" + _class_xpath("segment") + "]"),
+                ("flight_num", ".//td[" + _class_xpath("flight_num") + "]"),
+                ("adult", ".//td[@data-title='成人']"),
+            ]:
+                cells = row.xpath(xpath)
+                if not cells:
+                    raise ValueError(f"行李列缺少 {key} 欄位")
+                texts[key] = visible_text(cells[0])
+            baggage_rows.append(texts)
+        return self.baggage_extractor._build_baggage_info(baggage_rows, current_flight_details)
+
+    def parse_price_data(self, modal_html: str) -> list:
+        """
+        解析 DBGModal 票價明細 HTML。
+
+        Args:
+            modal_html (str): DBGModal outerHTML；取不到彈出視窗時傳入空字串以取得預設值。
+
+        Returns:
+            list[dict]: 只包含一筆紀錄的列表，欄位與 PriceDataExtractor.extract_and_clean_price_data 相同。
+
+        Examples:
+            >>> HtmlCardParser().parse_price_data(modal_html)[0]["總售價"]
+            12345
+
+        Raises:
+            無特定錯誤
+        """
+        modal_text = visible_text(self._parse_root(modal_html)) if modal_html else ""
+        return [self.price_extractor.parse_modal_text(modal_text)]
+
+
+def parse_combination_html(
+    start_date: str,
+    return_date: str,
+    created_at: float,
+    modal_html: str,
+    flight_html: Optional[str] = None,
+    baggage_html: Optional[str] = None,
+    flight_record: Optional[dict] = None,
+    baggage_info: Optional[dict] = None
+) -> dict:
+    """
+    解析單一航班組合的 HTML 並合併為一筆資料列，供 ProcessPoolExecutor 在子行程中執行。
+
+    已由頁面快照取得的航班或行李資料可直接傳入，對應的 HTML 傳入 None。
+
+    Args:
+        start_date (str): 去程日期，格式 'YYYY/MM/DD'。
+        return_date (str): 回程日期，格式 'YYYY/MM/DD'。
+        created_at (float): 擷取時間戳記。
+        modal_html (str): DBGModal outerHTML。
+        flight_html (Optional[str]): 航班資訊分頁開啟時的卡片 outerHTML，預設為 None。
+        baggage_html (Optional[str]): 行李資訊分頁開啟時的卡片 outerHTML，預設為 None。
+        flight_record (Optional[dict]): 已解析的航班記錄，預設為 None。
+        baggage_info (Optional[dict]): 已解析的行李資訊，預設為 None。
+
+    Returns:
+        dict: 與 FlightDataCollector.collect_all_flight_data 相同格式的資料列。
+
+    Examples:
+        >>> future = pool.submit(parse_combination_html, "2025/10/15", "2025/10/20", time.time(),
+        ...                      modal_html, flight_html=flight_html, baggage_html=baggage_html)
+
+    Raises:
+        ValueError: 當 flight_html 與 flight_record 皆未提供，或 baggage_html 與 baggage_info 皆未提供時
+    """
+    if flight_html is None and flight_record is None:
+        raise ValueError("flight_html 與 flight_record 至少需提供一個")
+    if baggage_html is None and baggage_info is None:
+        raise ValueError("baggage_html 與 baggage_info 至少需提供一個")
+
+    parser = HtmlCardParser()
+    if flight_record is None:
+        flight_record = parser.parse_flight_data(flight_html, start_date, return_date)[0]
+    if baggage_info is None:
+        baggage_info = parser.parse_baggage_data(baggage_html, flight_record)
+    price_record = parser.parse_price_data(modal_html)[0]
+    return {**flight_record, **price_record, **baggage_info, "建立時間": created_at}
+
+
+def verify_fixtures(fixtures_dir: str) -> int:
+    """
+    比對錄製的 HTML fixture 與 Selenium 擷取結果是否一致。
+
+    每個 fixture 子目錄包含 FlightDataCollector 錄製的 flight.html、baggage.html、modal.html
+    與 expected.json（Selenium 路徑的資料列與查詢日期）。
+
+    Args:
+        fixtures_dir (str): fixture 根目錄。
+
+    Returns:
+        int: 結果不一致的 fixture 數量。
+
+    Examples:
+        >>> verify_fixtures("html_fixtures")
+        0
+
+    Raises:
+        FileNotFoundError: 當 fixtures_dir 不存在時
+    """
+    if not os.path.isdir(fixtures_dir):
+        raise FileNotFoundError(f"fixture 目錄不存在: {fixtures_dir}")
+
+    mismatches = 0
+    fixture_names = sorted(
+        name for name in os.listdir(fixtures_dir)
+        if os.path.isfile(os.path.join(fixtures_dir, name, "expected.json"))
+    )
+    for name in fixture_names:
+        fixture_path = os.path.join(fixtures_dir, name)
+        with open(os.path.join(fixture_path, "expected.json"), "r", encoding="utf-8") as f:
+            expected = json.load(f)
+
+        sources = {}
+        for part in ["flight", "baggage", "modal"]:
+            with open(os.path.join(fixture_path, f"{part}.html"), "r", encoding="utf-8") as f:
+                sources[part] = f.read()
+
+        row = parse_combination_html(
+            expected["start_date"],
+            expected["return_date"],
+            expected["row"]["建立時間"],
+            sources["modal"],
+            flight_html=sources["flight"],
+            baggage_html=sources["baggage"]
+        )
+        diffs = {
+            key: (expected["row"].get(key), row.get(key))
+            for key in set(expected["row"]) | set(row)
+            if expected["row"].get(key) != row.get(key)
+        }
+        if diffs:
+            mismatches += 1
+            print(f"{name} 不一致: {diffs}")
+
+    print(f"共比對 {len(fixture_names)} 個 fixture，{mismatches} 個不一致")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="航班卡片 HTML 離線解析器")
+    parser.add_argument("--fixtures-dir", default="html_fixtures", help="錄製的 HTML fixture 目錄")
+    args = parser.parse_args()
+    raise SystemExit(1 if verify_fixtures(args.fixtures_dir) else 0)
@@ -0,0 +1,264 @@
+# 標準庫
+import json
+import math
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, TypeVar
+
+# 第三方庫
+from selenium.common.exceptions import TimeoutException
+
+T = TypeVar("T")
+
+
+class LatencyRecorder:
+    """
+    等待延遲記錄器，記錄每條航線在各等待點實際花費的秒數，並由高百分位數推算等待上限。
+
+    正常的航線可在頁面卡住時提早失敗，較慢的航線則取得足夠的等待時間。
+    樣本數不足時使用呼叫端提供的預設上限；逾時的等待以實際耗時計入樣本，
+    因此上限過緊時會在之後的任務自動放寬。其他錯誤（例如元素失效、session 中斷）不代表等待時間，不計入樣本。
+
+    屬性:
+        file_path (Optional[str]): 延遲紀錄檔案路徑，None 時只保存在記憶體中。
+        percentile (float): 推算上限使用的百分位數。
+        margin (float): 百分位數乘上的安全倍數。
+        min_samples (int): 開始使用推算上限所需的最少樣本數。
+        max_samples (int): 每個等待點保留的最近樣本數。
+        min_timeout (float): 推算上限的下限秒數。
+        max_factor (float): 推算上限不超過預設上限的倍數。
+
+    Examples:
+        >>> recorder = LatencyRecorder("wait_latency.json")
+        >>> recorder.measure("TPE-NRT", "flight_details", 5, lambda timeout: wait_flight_details(timeout))
+        >>> recorder.save()
+
+    Raises:
+        ValueError: 當參數無效時
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        percentile: float = 0.95,
+        margin: float = 1.5,
+        min_samples: int = 20,
+        max_samples: int = 200,
+        min_timeout: float = 1.0,
+        max_factor: float = 3.0
+    ):
+        """
+        初始化等待延遲記錄器並載入既有紀錄。
+
+        Args:
+            file_path (Optional[str]): 延遲紀錄檔案路徑，None 時不讀寫檔案，預設為 None。
+            percentile (float): 推算上限使用的百分位數，預設為 0.95。
+            margin (float): 百分位數乘上的安全倍數，預設為 1.5。
+            min_samples (int): 開始使用推算上限所需的最少樣本數，預設為 20。
+            max_samples (int): 每個等待點保留的最近樣本數，預設為 200。
+            min_timeout (float): 推算上限的下限秒數，預設為 1.0。
+            max_factor (float): 推算上限不超過預設上限的倍數，預設為 3.0。
+
+        Examples:
+            >>> recorder = LatencyRecorder("wait_latency.json", percentile=0.99)
+
+        Raises:
+            ValueError: 當 percentile 不在 0 與 1 之間時
+            ValueError: 當 margin、min_timeout 或 max_factor 小於等於 0 時
+            ValueError: 當 min_samples 小於等於 0 或 max_samples 小於 min_samples 時
+        """
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile 必須介於 0 與 1 之間")
+        if margin <= 0 or min_timeout <= 0 or max_factor <= 0:
+            raise ValueError("margin、min_timeout 與 max_factor 必須大於 0")
+        if min_samples <= 0 or max_samples < min_samples:
+            raise ValueError("min_samples 必須大於 0 且 max_samples 不可小於 min_samples")
+
+        self.file_path = file_path
+        self.percentile = percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.min_timeout = min_timeout
+        self.max_factor = max_factor
+        self._samples: Dict[str, Dict[str, List[float]]] = self._load()
+        self._pending: Dict[str, Dict[str, List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def timeout_for(self, route: str, wait_point: str, default_timeout: float) -> float:
+        """
+        取得航線在指定等待點的等待上限。
+
+        Args:
+            route (str): 航線代碼，例如 'TPE-NRT'。
+            wait_point (str): 等待點名稱，例如 'flight_details'。
+            default_timeout (float): 樣本不足時使用的預設上限秒數。
+
+        Returns:
+            float: 等待上限秒數。
+
+        Examples:
+            >>> recorder = LatencyRecorder()
+            >>> recorder.timeout_for("TPE-NRT", "flight_details", 5)
+            5
+
+        Raises:
+            無特定錯誤
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(route, {}).get(wait_point, []))
+        if len(samples) < self.min_samples:
+            return default_timeout
+
+        rank = max(0, math.ceil(self.percentile * len(samples)) - 1)
+        learned = samples[rank] * self.margin
+        return min(max(learned, self.min_timeout), default_timeout * self.max_factor)
+
+    def record(self, route: str, wait_point: str, seconds: float) -> None:
+        """
+        記錄一次等待的實際秒數。
+
+        Args:
+            route (str): 航線代碼。
+            wait_point (str): 等待點名稱。
+            seconds (float): 實際等待秒數。
+
+        Examples:
+            >>> recorder = LatencyRecorder()
+            >>> recorder.record("TPE-NRT", "flight_details", 0.8)
+
+        Raises:
+            無特定錯誤
+        """
+        with self._lock:
+            for store in (self._samples, self._pending):
+                samples = store.setdefault(route, {}).setdefault(wait_point, [])
+                samples.append(round(seconds, 3))
+                del samples[:-self.max_samples]
+
+    def measure(self, route: str, wait_point: str, default_timeout: float, wait_fn: Callable[[float], T]) -> T:
+        """
+        以推算的上限執行等待並記錄實際耗時；逾時時同樣記錄耗時後再拋出原本的例外，其他例外不記錄。
+
+        Args:
+            route (str): 航線代碼。
+            wait_point (str): 等待點名稱。
+            default_timeout (float): 樣本不足時使用的預設上限秒數。
+            wait_fn (Callable[[float], T]): 接收上限秒數並執行等待的函式。
+
+        Returns:
+            T: wait_fn 的回傳值。
+
+        Examples:
+            >>> recorder = LatencyRecorder()
+            >>> recorder.measure("TPE-NRT", "price_modal", 5, lambda timeout: WebDriverWait(driver, timeout).until(cond))
+
+        Raises:
+            任何 wait_fn 拋出的例外，例如 TimeoutException
+        """
+        timeout = self.timeout_for(route, wait_point, default_timeout)
+        start = time.time()
+        try:
+            result = wait_fn(timeout)
+        except (TimeoutException, TimeoutError):
+            print(f"{route} 等待 {wait_point} 逾時，上限為 {timeout:.1f} 秒（預設 {default_timeout} 秒）")
+            self.record(route, wait_point, time.time() - start)
+            raise
+        self.record(route, wait_point, time.time() - start)
+        return result
+
+    def summary(self, route: str, default_timeouts: Dict[str, float]) -> str:
+        """
+        產生航線各等待點的樣本數、百分位數與目前上限摘要。
+
+        Args:
+            route (str): 航線代碼。
+            default_timeouts (Dict[str, float]): 等待點名稱對應的預設上限秒數。
+
+        Returns:
+            str: 每個等待點一段的摘要文字。
+
+        Examples:
+            >>> recorder.summary("TPE-NRT", {"flight_details": 5})
+            'flight_details: 42 筆，p95 0.81 秒，上限 1.22 秒（預設 5 秒）'
+
+        Raises:
+            無特定錯誤
+        """
+        parts = []
+        for wait_point, default_timeout in default_timeouts.items():
+            with self._lock:
+                samples = sorted(self._samples.get(route, {}).get(wait_point, []))
+            if not samples:
+                continue
+            rank = max(0, math.ceil(self.percentile * len(samples)) - 1)
+            timeout = self.timeout_for(route, wait_point, default_timeout)
+            parts.append(f"{wait_point}: {len(samples)} 筆，p{round(self.percentile * 100)} {samples[rank]:.2f} 秒，"
+                         f"上限 {timeout:.2f} 秒（預設 {default_timeout} 秒）")
+        return "；".join(parts)
+
+    def save(self) -> None:
+        """
+        將本次新增的樣本合併寫入延遲紀錄檔案，其他行程在此期間寫入的樣本會一併保留。
+        寫入失敗時保留尚未寫入的樣本，下次 save 再一併寫入。
+
+        Examples:
+            >>> recorder = LatencyRecorder("wait_latency.json")
+            >>> recorder.save()
+
+        Raises:
+            IOError: 當檔案寫入失敗時
+        """
+        if not self.file_path:
+            return
+
+        with self._lock:
+            if not self._pending:
+                return
+
+            merged = self._load()
+            for route, points in self._pending.items():
+                for wait_point, samples in points.items():
+                    stored = merged.setdefault(route, {}).setdefault(wait_point, [])
+                    stored.extend(samples)
+                    del stored[:-self.max_samples]
+
+            # 先寫入暫存檔再替換，避免多個 worker 同時寫入造成檔案損毀
+            temp_path = f"{self.file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(merged, f, ensure_ascii=False)
+                os.replace(temp_path, self.file_path)
+            except IOError as e:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise IOError(f"延遲紀錄寫入失敗: {e}")
+
+            self._samples = merged
+            self._pending = {}
+
+    def _load(self) -> Dict[str, Dict[str, List[float]]]:
+        """
+        讀取延遲紀錄檔案。
+
+        Returns:
+            Dict[str, Dict[str, List[float]]]: 航線 -> 等待點 -> 樣本秒數；檔案不存在或格式錯誤時為空字典。
+
+        Examples:
+            >>> recorder = LatencyRecorder("wait_latency.json")
+            >>> samples = recorder._load()
+
+        Raises:
+            無特定錯誤
+        """
+        if not self.file_path or not os.path.exists(self.file_path):
+            return {}
+
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"讀取延遲紀錄失敗: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
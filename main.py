@@ -9,12 +9,19 @@ ColaTourFareScraper 主程式入口
 
 # 標準庫
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# 行程啟動計時起點，用於輸出啟動耗時報告；於匯入第三方庫與本地模組前記錄，報告涵蓋其匯入耗時
+STARTUP_TIME = time.perf_counter()
+
+# 第三方庫
 import dotenv
 
 # 本地模組
+# 爬蟲相關模組（Selenium、pandas、驗證碼模型等）在取得日期列表後才於 main() 中載入，
+# 讓日期 API 階段與 DRY_RUN 不需等待大型套件匯入
 from api_client import DatePairGenerator
-from data_uploader import BigQueryUploader
-from task_controller import ScraperTaskController
 
 dotenv.load_dotenv()
 
@@ -23,7 +30,7 @@ def main():
     主程式入口函數。
     
     此函數負責：
-    1. 從 API 取得日期對列表
+    1. 從 API 取得日期對列表（DRY_RUN 時輸出日期列表後結束）
     2. 迴圈處理每個機場組合和日期
     3. 執行爬蟲任務
     4. 上傳資料到 BigQuery
@@ -41,36 +48,96 @@ def main():
         raise ValueError("環境變數 IATA_ID 未設定")
     
     # 使用 API 動態生成日期列表
+    api_start = time.perf_counter()
+    print(f"啟動至呼叫日期 API 前耗時 {api_start - STARTUP_TIME:.2f} 秒")
     generator = DatePairGenerator()
     date_pairs = generator.generate_from_api()
+    formatted_pairs = [
+        (f"{date[0][0]}/{date[0][1]}/{date[0][2]}", f"{date[1][0]}/{date[1][1]}/{date[1][2]}")
+        for date in date_pairs
+    ]
+    print(f"日期 API 耗時 {time.perf_counter() - api_start:.2f} 秒，共 {len(formatted_pairs)} 組日期")
+    
+    if os.getenv('DRY_RUN', 'false').lower() == 'true':
+        for start_date, return_date in formatted_pairs:
+            print(f"預計爬取: TPE -> {iata_id}, {start_date} - {return_date}")
+        return
+    
+    import_start = time.perf_counter()
+    from captcha_handler import CaptchaModelRegistry
+    
+    # 於背景載入驗證碼模型並預熱，與載入其餘模組、啟動 Chrome 同時進行
+    captcha_model_path = os.getenv('CAPTCHA_MODEL_PATH', 'captcha_model_1.keras')
+    if os.getenv('CAPTCHA_WARM_UP', 'true').lower() == 'true':
+        CaptchaModelRegistry.warm_up(captcha_model_path)
+    
+    from data_uploader import BigQueryUploader
+    from driver_pool import WebDriverPool
+    from latency_recorder import LatencyRecorder
+    from profile_template import ChromeProfileTemplate
+    from session_store import SessionStore
+    from task_controller import ParallelScrapeRunner
+    print(f"載入爬蟲模組耗時 {time.perf_counter() - import_start:.2f} 秒")
+    
+    max_workers = int(os.getenv('SCRAPER_WORKERS', '1'))
+    html_parse_workers = int(os.getenv('HTML_PARSE_WORKERS', '0'))
+    html_parse_pool = ProcessPoolExecutor(max_workers=html_parse_workers) if html_parse_workers > 0 else None
     
-    # 初始化控制器和上傳器
-    controller = ScraperTaskController()
+    # 初始化登入 session 快取、WebDriver 連線池、並行執行器和上傳器
+    session_store = SessionStore(
+        file_path=os.getenv('SESSION_CACHE_PATH', 'colatour_session.json'),
+        ttl_seconds=int(os.getenv('SESSION_CACHE_TTL_SECONDS', '1800'))
+    )
+    driver_pool = WebDriverPool(
+        max_tasks_per_driver=int(os.getenv('DRIVER_MAX_TASKS', '20')),
+        max_memory_mb=float(os.getenv('DRIVER_MAX_MEMORY_MB', '1024')),
+        session_store=session_store,
+        page_load_strategy=os.getenv('PAGE_LOAD_STRATEGY', 'normal'),
+        enable_performance_log=bool(os.getenv('HTML_FIXTURE_DIR')),
+        profile_template=ChromeProfileTemplate(os.getenv('CHROME_PROFILE_TEMPLATE_DIR'))
+        if os.getenv('CHROME_PROFILE_TEMPLATE_DIR') else None,
+        captcha_debug_dir=os.getenv('CAPTCHA_DEBUG_DIR') or None
+    )
+    runner = ParallelScrapeRunner(
+        driver_pool=driver_pool,
+        max_workers=max_workers,
+        lean_mode=os.getenv('LEAN_MODE', 'false').lower() == 'true',
+        html_parse_pool=html_parse_pool,
+        fixture_dir=os.getenv('HTML_FIXTURE_DIR') or None,
+        latency_recorder=LatencyRecorder(
+            file_path=os.getenv('WAIT_LATENCY_PATH', 'wait_latency.json'),
+            percentile=float(os.getenv('WAIT_LATENCY_PERCENTILE', '0.95')),
+            margin=float(os.getenv('WAIT_LATENCY_MARGIN', '1.5'))
+        ),
+        pipeline=os.getenv('PIPELINE_NAVIGATION', 'false').lower() == 'true',
+        captcha_model_path=captcha_model_path
+    )
     uploader = BigQueryUploader()
     
-    # 迴圈處理每個機場組合
-    for iata in [['TPE', iata_id]]:
-        # 迴圈處理每組日期
-        for date in date_pairs:
-            print(f"正在爬取: {iata[0]} -> {iata[1]}, "
-                  f"{date[0][0]}/{date[0][1]}/{date[0][2]} - {date[1][0]}/{date[1][1]}/{date[1][2]}")
-            
-            # 執行爬蟲任務
-            final_df = controller.run_scraping_task(
-                origin_code=iata[0],
-                destination_code=iata[1],
-                start_date=f"{date[0][0]}/{date[0][1]}/{date[0][2]}",
-                return_date=f"{date[1][0]}/{date[1][1]}/{date[1][2]}"
-            )
-            
-            # 上傳資料到 BigQuery
-            uploader.upload_dataframe(
-                dataframe=final_df,
-                table_id='economy.New_cola_air_tickets_price',
-                project_id='testing-cola-rd'
-            )
-            
-            print(f"完成爬取並上傳 {len(final_df)} 筆資料")
+    try:
+        # 迴圈處理每個機場組合
+        for iata in [['TPE', iata_id]]:
+            # 並行執行爬蟲任務，依完成順序上傳資料到 BigQuery
+            for start_date, return_date, final_df in runner.run(iata[0], iata[1], formatted_pairs):
+                for failure in final_df.attrs.get("failed_combinations", []):
+                    print(f"{start_date} - {return_date} 未擷取的組合: 第 {failure['card_index'] + 1} 張卡片，"
+                          f"去程 {failure['departure_index'] + 1}、回程 {failure['return_index'] + 1}，{failure['error']}")
+                if final_df.empty:
+                    print(f"{start_date} - {return_date} 查無資料，略過上傳")
+                    continue
+                
+                uploader.upload_dataframe(
+                    dataframe=final_df,
+                    table_id='economy.New_cola_air_tickets_price',
+                    project_id='testing-cola-rd'
+                )
+                
+                print(f"完成爬取並上傳 {start_date} - {return_date} 共 {len(final_df)} 筆資料")
+    finally:
+        driver_pool.close_all()
+        if html_parse_pool is not None:
+            html_parse_pool.shutdown()
+        print(f"session 快取命中 {session_store.hits} 次，未命中 {session_store.misses} 次")
 
 
 if __name__ == "__main__":
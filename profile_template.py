@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+預熱 Chrome 使用者資料目錄範本
+
+範本目錄已完成 Chrome 首次啟動流程，且 HTTP 快取中已有可樂旅遊的 JS/CSS，
+每個 worker 啟動時複製一份範本作為自己的 --user-data-dir，省去首次啟動與重新下載靜態資源的時間。
+
+使用方式：
+    python profile_template.py --build chrome_profile_template
+    python profile_template.py --benchmark chrome_profile_template --origin TPE --destination NRT \
+        --start-date 2025/10/15 --return-date 2025/10/20
+"""
+
+# 標準庫
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+# 第三方庫
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# 本地模組
+from web_operator import WebDriverFactory, WebNavigator
+
+
+class ChromeProfileTemplate:
+    """
+    預熱的 Chrome 使用者資料目錄範本，負責建立範本並複製到各 worker 的暫存目錄。
+
+    複製時略過 Chrome 的單一實例鎖定檔與上次的分頁紀錄，其餘（HTTP 快取、首次啟動狀態）照常複製。
+
+    屬性:
+        template_dir (str): 範本目錄路徑。
+
+    Examples:
+        >>> template = ChromeProfileTemplate("chrome_profile_template")
+        >>> template.build()
+        >>> template.copy_to("/tmp/chrome_profile_9222_abc")
+
+    Raises:
+        ValueError: 當 template_dir 為空時
+    """
+
+    # 不複製的檔案與目錄：單一實例鎖定檔會讓 Chrome 誤判範本仍在使用，分頁紀錄會還原上次的頁面，
+    # Cookie 資料庫會讓所有 worker 共用建立範本時的登入狀態。
+    # ignore_patterns 比對的是檔名，"Cookies" 同時涵蓋 Default/Cookies 與 Default/Network/Cookies
+    IGNORED_NAMES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "Sessions", "Current Session",
+                     "Current Tabs", "Last Session", "Last Tabs", "Crashpad", "Cookies", "Cookies-journal")
+
+    WARM_UP_URL = 'https://www.colatour.com.tw/'
+
+    def __init__(self, template_dir: str):
+        """
+        初始化範本。
+
+        Args:
+            template_dir (str): 範本目錄路徑。
+
+        Examples:
+            >>> template = ChromeProfileTemplate("chrome_profile_template")
+
+        Raises:
+            ValueError: 當 template_dir 為空時
+        """
+        if not template_dir:
+            raise ValueError("template_dir 不可為空")
+        self.template_dir = template_dir
+
+    def exists(self) -> bool:
+        """
+        檢查範本目錄是否已建立。
+
+        Returns:
+            bool: 範本目錄存在且不為空時為 True。
+
+        Examples:
+            >>> ChromeProfileTemplate("chrome_profile_template").exists()
+            True
+
+        Raises:
+            無特定錯誤
+        """
+        return os.path.isdir(self.template_dir) and bool(os.listdir(self.template_dir))
+
+    def build(self, warm_up_urls: tuple = ()) -> None:
+        """
+        以範本目錄啟動 Chrome 完成首次啟動流程，並開啟可樂旅遊頁面填入 HTTP 快取。
+
+        Args:
+            warm_up_urls (tuple): 首頁之外額外開啟的網址，例如機票查詢頁面，預設為空。
+
+        Examples:
+            >>> template = ChromeProfileTemplate("chrome_profile_template")
+            >>> template.build((WebNavigator.build_flight_page_url("TPE", "NRT", "2025/10/15", "2025/10/20"),))
+
+        Raises:
+            RuntimeError: 當 WebDriver 建立失敗時
+        """
+        os.makedirs(self.template_dir, exist_ok=True)
+        driver = WebDriverFactory.create_driver(user_data_dir=os.path.abspath(self.template_dir))
+        try:
+            for url in (self.WARM_UP_URL, *warm_up_urls):
+                start = time.time()
+                driver.get(url)
+                print(f"預熱 {url}，耗時 {time.time() - start:.2f} 秒")
+        finally:
+            driver.quit()
+
+        size_mb = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, names in os.walk(self.template_dir)
+            for name in names
+            if os.path.isfile(os.path.join(root, name))
+        ) / (1024 * 1024)
+        print(f"已建立 Chrome 範本 {self.template_dir}（{size_mb:.1f} MB）")
+
+    def copy_to(self, user_data_dir: str) -> float:
+        """
+        將範本複製到 worker 的使用者資料目錄。
+
+        Args:
+            user_data_dir (str): 目的使用者資料目錄，可為已存在的空目錄。
+
+        Returns:
+            float: 複製耗時秒數。
+
+        Examples:
+            >>> template = ChromeProfileTemplate("chrome_profile_template")
+            >>> template.copy_to("/tmp/chrome_profile_9222_abc")
+            0.21
+
+        Raises:
+            FileNotFoundError: 當範本目錄不存在時
+            OSError: 當複製失敗時
+        """
+        if not os.path.isdir(self.template_dir):
+            raise FileNotFoundError(f"Chrome 範本目錄不存在: {self.template_dir}")
+
+        start = time.time()
+        shutil.copytree(
+            self.template_dir,
+            user_data_dir,
+            ignore=shutil.ignore_patterns(*self.IGNORED_NAMES),
+            symlinks=True,
+            dirs_exist_ok=True
+        )
+        return time.time() - start
+
+
+def measure_startup(
+    template: ChromeProfileTemplate | None,
+    origin_code: str,
+    destination_code: str,
+    start_date: str,
+    return_date: str
+) -> dict:
+    """
+    量測以空白或範本使用者資料目錄啟動 Chrome 後，第一次 driver.get 與票價頁面 tab01 出現的耗時。
+
+    Args:
+        template (ChromeProfileTemplate | None): 使用的範本，None 表示空白目錄。
+        origin_code (str): 出發地代碼。
+        destination_code (str): 目的地代碼。
+        start_date (str): 出發日期，格式為 'YYYY/MM/DD'。
+        return_date (str): 返回日期，格式為 'YYYY/MM/DD'。
+
+    Returns:
+        dict: 包含 copy、launch、first_get、tab01 秒數；tab01 未出現時為 None。
+
+    Examples:
+        >>> measure_startup(ChromeProfileTemplate("chrome_profile_template"), "TPE", "NRT", "2025/10/15", "2025/10/20")
+        {'copy': 0.2, 'launch': 0.9, 'first_get': 1.1, 'tab01': 6.3}
+
+    Raises:
+        RuntimeError: 當 WebDriver 建立失敗時
+    """
+    user_data_dir = tempfile.mkdtemp(prefix="chrome_profile_benchmark_")
+    timings = {"copy": 0.0}
+    try:
+        if template is not None:
+            timings["copy"] = template.copy_to(user_data_dir)
+
+        start = time.time()
+        driver = WebDriverFactory.create_driver(user_data_dir=user_data_dir)
+        timings["launch"] = time.time() - start
+        try:
+            start = time.time()
+            driver.get(ChromeProfileTemplate.WARM_UP_URL)
+            timings["first_get"] = time.time() - start
+
+            navigator = WebNavigator(driver)
+            start = time.time()
+            navigator.navigate_to_flight_page(origin_code, destination_code, start_date, return_date)
+            try:
+                navigator.wait_for_results(timeout=45)
+                timings["tab01"] = time.time() - start
+            except TimeoutException:
+                timings["tab01"] = None
+        finally:
+            driver.quit()
+    finally:
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="預熱 Chrome 使用者資料目錄範本")
+    parser.add_argument("--build", metavar="TEMPLATE_DIR", help="建立範本目錄")
+    parser.add_argument("--benchmark", metavar="TEMPLATE_DIR", help="比較空白目錄與範本目錄的啟動耗時")
+    parser.add_argument("--origin", default="TPE", help="出發地代碼")
+    parser.add_argument("--destination", default="NRT", help="目的地代碼")
+    parser.add_argument("--start-date", default="", help="出發日期，格式為 YYYY/MM/DD")
+    parser.add_argument("--return-date", default="", help="返回日期，格式為 YYYY/MM/DD")
+    args = parser.parse_args()
+
+    if args.build:
+        urls = ()
+        if args.start_date and args.return_date:
+            urls = (WebNavigator.build_flight_page_url(args.origin, args.destination, args.start_date, args.return_date),)
+        ChromeProfileTemplate(args.build).build(urls)
+
+    if args.benchmark:
+        if not args.start_date or not args.return_date:
+            parser.error("--benchmark 需要 --start-date 與 --return-date")
+        for label, template in (("空白目錄", None), ("範本目錄", ChromeProfileTemplate(args.benchmark))):
+            try:
+                timings = measure_startup(template, args.origin, args.destination, args.start_date, args.return_date)
+            except (RuntimeError, WebDriverException) as e:
+                print(f"{label} 量測失敗: {e}")
+                continue
+            tab01 = f"{timings['tab01']:.2f} 秒" if timings["tab01"] is not None else "逾時"
+            print(f"{label}: 複製 {timings['copy']:.2f} 秒，啟動 {timings['launch']:.2f} 秒，"
+                  f"第一次 driver.get {timings['first_get']:.2f} 秒，tab01 出現 {tab01}")
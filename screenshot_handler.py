@@ -6,13 +6,14 @@ from datetime import datetime
 from typing import Optional
 
 # 第三方庫
-from google.cloud import storage
 from selenium import webdriver
 
 
 class ScreenshotHandler:
     """
     截圖處理器，負責截取網頁截圖並上傳到 Cloud Storage。
+
+    Cloud Storage 用戶端在第一次上傳時才匯入與建立，未發生錯誤的任務不需載入 google-cloud-storage。
     
     Examples:
         >>> handler = ScreenshotHandler("testing-cola-rd-vector-storage")
@@ -40,7 +41,27 @@ class ScreenshotHandler:
             raise ValueError("bucket_name 不可為空")
         
         self.bucket_name = bucket_name
-        self.storage_client = storage.Client()
+        self._storage_client = None
+
+    @property
+    def storage_client(self):
+        """
+        取得 Cloud Storage 用戶端，第一次取用時才匯入 google-cloud-storage 並建立。
+
+        Returns:
+            google.cloud.storage.Client: Cloud Storage 用戶端。
+
+        Examples:
+            >>> handler = ScreenshotHandler("testing-cola-rd-vector-storage")
+            >>> bucket = handler.storage_client.bucket(handler.bucket_name)
+
+        Raises:
+            google.auth.exceptions.DefaultCredentialsError: 當找不到 Google Cloud 憑證時
+        """
+        if self._storage_client is None:
+            from google.cloud import storage
+            self._storage_client = storage.Client()
+        return self._storage_client
     
     def capture_and_upload(
         self,
@@ -0,0 +1,219 @@
+# 標準庫
+import json
+import os
+import threading
+import time
+from typing import List, Optional
+
+# 第三方庫
+import requests
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+
+class SessionStore:
+    """
+    登入 session 快取，負責將登入成功後的可樂旅遊 cookie 保存至本地檔案並在 TTL 內重複使用。
+
+    新的 driver 會先載入快取的 cookie 並以一次輕量請求驗證 session，
+    只有在 session 過期或失效時才需要走驗證碼登入流程。
+
+    屬性:
+        file_path (str): 快取檔案路徑。
+        ttl_seconds (int): 快取有效秒數。
+        hits (int): 快取命中次數。
+        misses (int): 快取未命中次數。
+
+    Examples:
+        >>> store = SessionStore("colatour_session.json", ttl_seconds=1800)
+        >>> if not store.restore(driver):
+        ...     navigator.login_with_retry("user", "pass", "captcha_model_1.keras")
+        ...     store.save(driver)
+
+    Raises:
+        ValueError: 當參數無效時
+    """
+
+    BASE_URL = 'https://www.colatour.com.tw'
+    LOGIN_URL = 'https://www.colatour.com.tw/C000_Portal/C000_MemberLogin.aspx'
+
+    def __init__(self, file_path: str = 'colatour_session.json', ttl_seconds: int = 1800):
+        """
+        初始化登入 session 快取。
+
+        Args:
+            file_path (str): 快取檔案路徑，預設為 'colatour_session.json'。
+            ttl_seconds (int): 快取有效秒數，預設為 1800 秒。
+
+        Examples:
+            >>> store = SessionStore(ttl_seconds=600)
+
+        Raises:
+            ValueError: 當 file_path 為空或 ttl_seconds 小於等於 0 時
+        """
+        if not file_path:
+            raise ValueError("file_path 不可為空")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds 必須大於 0")
+
+        self.file_path = file_path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def save(self, driver: webdriver.Chrome) -> None:
+        """
+        將 driver 目前的 cookie 序列化保存至快取檔案。
+
+        Args:
+            driver (webdriver.Chrome): 已登入的 WebDriver 實例。
+
+        Examples:
+            >>> store = SessionStore()
+            >>> store.save(driver)
+
+        Raises:
+            ValueError: 當 driver 為 None 時
+            IOError: 當檔案寫入失敗時
+        """
+        if driver is None:
+            raise ValueError("driver 不可為 None")
+
+        payload = {
+            "saved_at": time.time(),
+            "cookies": driver.get_cookies(),
+        }
+
+        # 先寫入暫存檔再替換，避免多個 worker 同時寫入造成檔案損毀
+        temp_path = f"{self.file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(temp_path, self.file_path)
+        except IOError as e:
+            raise IOError(f"session 快取寫入失敗: {e}")
+        print(f"已保存登入 session 至 {self.file_path}")
+
+    def restore(self, driver: webdriver.Chrome) -> bool:
+        """
+        嘗試將快取的 cookie 載入 driver，並驗證 session 是否仍有效。
+
+        Args:
+            driver (webdriver.Chrome): 尚未登入的 WebDriver 實例。
+
+        Returns:
+            bool: 成功還原有效 session 時為 True，需要重新登入時為 False。
+
+        Examples:
+            >>> store = SessionStore()
+            >>> store.restore(driver)
+            True
+
+        Raises:
+            ValueError: 當 driver 為 None 時
+        """
+        if driver is None:
+            raise ValueError("driver 不可為 None")
+
+        cookies = self._load_cookies()
+        restored = False
+        if cookies and self.is_session_valid(cookies):
+            try:
+                # 需先進入同網域才能寫入 cookie
+                driver.get(f"{self.BASE_URL}/favicon.ico")
+                for cookie in cookies:
+                    driver.add_cookie(cookie)
+                restored = True
+            except WebDriverException as e:
+                print(f"載入 session cookie 失敗: {e}")
+
+        with self._lock:
+            if restored:
+                self.hits += 1
+            else:
+                self.misses += 1
+            total = self.hits + self.misses
+            print(f"session 快取{'命中' if restored else '未命中'}，"
+                  f"命中率 {self.hits}/{total} ({self.hits / total:.0%})，已省下 {self.hits} 次驗證碼登入")
+        return restored
+
+    def _load_cookies(self) -> Optional[List[dict]]:
+        """
+        讀取快取檔案並回傳未過期的 cookie 列表。
+
+        Returns:
+            Optional[List[dict]]: cookie 列表；檔案不存在、格式錯誤或超過 TTL 時為 None。
+
+        Examples:
+            >>> store = SessionStore()
+            >>> cookies = store._load_cookies()
+
+        Raises:
+            無特定錯誤
+        """
+        if not os.path.exists(self.file_path):
+            return None
+
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"讀取 session 快取失敗: {e}")
+            return None
+
+        saved_at = payload.get("saved_at", 0)
+        if time.time() - saved_at > self.ttl_seconds:
+            print("session 快取已超過 TTL")
+            return None
+
+        now = time.time()
+        cookies = [
+            cookie for cookie in payload.get("cookies", [])
+            if cookie.get("expiry") is None or cookie["expiry"] > now
+        ]
+        return cookies or None
+
+    @classmethod
+    def is_session_valid(cls, cookies: List[dict]) -> bool:
+        """
+        以一次輕量 HTTP 請求確認 cookie 對應的登入 session 是否有效。
+
+        已登入時會員登入頁不會再顯示帳號輸入欄位，以此判斷 session 狀態。
+        WebDriverPool 的健康檢查也以此確認 driver 的登入 session 尚未在伺服器端過期。
+
+        Args:
+            cookies (List[dict]): Selenium 格式的 cookie 列表。
+
+        Returns:
+            bool: session 有效時為 True。
+
+        Examples:
+            >>> SessionStore.is_session_valid(driver.get_cookies())
+            True
+
+        Raises:
+            無特定錯誤
+        """
+        if not cookies:
+            return False
+
+        session = requests.Session()
+        for cookie in cookies:
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/")
+            )
+
+        try:
+            response = session.get(cls.LOGIN_URL, timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"驗證 session 失敗: {e}")
+            return False
+        finally:
+            session.close()
+
+        return 'txtMemberIdno' not in response.text
@@ -1,19 +1,45 @@
 # 標準庫
+import json
+import os
+import queue
+import threading
 import time
-from typing import List
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple
 
 # 第三方庫
 import pandas as pd
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 # 本地模組
-from data_cleaner import BaggageDataExtractor, FlightDataExtractor, PriceDataExtractor
+from data_cleaner import (
+    BaggageDataExtractor,
+    CardSnapshotExtractor,
+    FlightDataExtractor,
+    PriceDataExtractor,
+)
+from driver_pool import WebDriverPool
+from html_card_parser import parse_combination_html
+from latency_recorder import LatencyRecorder
 from screenshot_handler import ScreenshotHandler
-from web_operator import FlightOptionExpander, WebDriverFactory, WebNavigator
+from session_store import SessionStore
+from web_operator import (
+    CardElementCache,
+    DomQuiescenceWaiter,
+    FlightOptionExpander,
+    WebDriverFactory,
+    WebNavigator,
+    XhrResponseCapture,
+)
 
 
 class FlightDataCollector:
@@ -28,43 +54,96 @@ class FlightDataCollector:
         ValueError: 當參數無效時
     """
     
-    def __init__(self, driver: webdriver.Chrome):
+    MULTI_SEGMENT_XPATH = (
+        ".//div[@ng-repeat='MultiSegment in cjSegment[$index]' and @ng-init='MultiSegmentIndex=$index' and @class='ng-scope']"
+    )
+
+    # 各等待點在樣本不足時使用的預設上限秒數
+    DEFAULT_WAIT_TIMEOUTS = {"flight_details": 5, "baggage_info": 5, "price_modal": 5}
+
+    # 單一組合可重試的錯誤，其他錯誤（例如瀏覽器 session 失效）仍中止整個任務
+    RETRYABLE_ERRORS = (TimeoutException, NoSuchElementException, StaleElementReferenceException)
+    
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        html_parse_pool: Optional[Executor] = None,
+        fixture_dir: Optional[str] = None,
+        quiescence: Optional[DomQuiescenceWaiter] = None,
+        latency_recorder: Optional[LatencyRecorder] = None,
+        route: str = '',
+        max_retries: int = 1
+    ):
         """
         初始化航班資料收集器。
         
         Args:
             driver (webdriver.Chrome): Selenium WebDriver 實例。
+            html_parse_pool (Optional[Executor]): HTML 解析行程池，提供時瀏覽器只取得各分頁的 outerHTML，
+                解析交由 html_card_parser 在行程池中並行執行，預設為 None。
+            fixture_dir (Optional[str]): 提供時將每個組合的 outerHTML 與擷取結果保存為 fixture，
+                供 html_card_parser 比對離線解析結果，預設為 None。
+            quiescence (Optional[DomQuiescenceWaiter]): 共用的 DOM 靜止等待器，None 時自行建立，預設為 None。
+            latency_recorder (Optional[LatencyRecorder]): 等待延遲記錄器，依紀錄推算各等待點的上限，
+                None 時只在記憶體中記錄，預設為 None。
+            route (str): 航線代碼，作為延遲紀錄的分類，預設為空字串。
+            max_retries (int): 單一組合擷取失敗時重新點擊並重試的次數，預設為 1。
         
         Examples:
             >>> collector = FlightDataCollector(driver)
+            >>> collector = FlightDataCollector(driver, html_parse_pool=ProcessPoolExecutor(4))
         
         Raises:
-            ValueError: 當 driver 為 None 時
+            ValueError: 當 driver 為 None 或 max_retries 小於 0 時
         """
         if driver is None:
             raise ValueError("driver 不可為 None")
+        if max_retries < 0:
+            raise ValueError("max_retries 不可小於 0")
         
         self.driver = driver
+        self.html_parse_pool = html_parse_pool
+        self.fixture_dir = fixture_dir
+        self.quiescence = quiescence or DomQuiescenceWaiter(driver)
+        self.latency_recorder = latency_recorder or LatencyRecorder()
+        self.route = route
         self.flight_extractor = FlightDataExtractor()
         self.baggage_extractor = BaggageDataExtractor()
         self.price_extractor = PriceDataExtractor()
+        self.snapshot_extractor = CardSnapshotExtractor()
+        self.max_retries = max_retries
+        self.snapshot_hits = 0
+        self.leg_memo_hits = 0
+        self.failed_combinations: List[dict] = []
     
-    def collect_all_flight_data(self, start_date: str, return_date: str) -> List[dict]:
+    def collect_all_flight_data(
+        self,
+        start_date: str,
+        return_date: str,
+        only_combinations: Optional[Set[Tuple[int, int, int]]] = None
+    ) -> List[dict]:
         """
         收集所有航班資料。
         
+        單一組合擷取失敗時會重新點擊選項並重試 max_retries 次，仍失敗則略過該組合並記錄於
+        failed_combinations，其他組合照常擷取。
+        
         Args:
             start_date (str): 出發日期，格式 'YYYY/MM/DD'。
             return_date (str): 回程日期，格式 'YYYY/MM/DD'。
+            only_combinations (Optional[Set[Tuple[int, int, int]]]): 只擷取這些 (卡片索引, 去程索引, 回程索引)
+                組合，用於重新擷取先前失敗的組合，None 時擷取全部，預設為 None。
         
         Returns:
-            List[dict]: 收集到的所有航班資料列表。
+            List[dict]: 收集到的所有航班資料列表，不含失敗的組合。
         
         Examples:
             >>> collector = FlightDataCollector(driver)
             >>> data = collector.collect_all_flight_data("2025/10/15", "2025/10/20")
             >>> len(data) > 0
             True
+            >>> failed = {(f["card_index"], f["departure_index"], f["return_index"]) for f in collector.failed_combinations}
+            >>> retried = collector.collect_all_flight_data("2025/10/15", "2025/10/20", only_combinations=failed)
         
         Raises:
             ValueError: 當 start_date 或 return_date 為空時
@@ -77,13 +156,29 @@ class FlightDataCollector:
         flight_cards = self.driver.find_elements(By.CLASS_NAME, 'airPrice_box')
         print(f"找到 {len(flight_cards)} 張航班卡片")
 
+        # 一次取得所有卡片的選項與目前可見的明細，目前選取的組合可直接從快照取得資料
+        snapshots = self.snapshot_extractor.capture(self.driver)
+        if len(snapshots) != len(flight_cards):
+            print(f"警告：快照卡片數 {len(snapshots)} 與頁面卡片數 {len(flight_cards)} 不一致，不使用快照")
+            snapshots = [None] * len(flight_cards)
+        self.snapshot_hits = 0
+        self.leg_memo_hits = 0
+        self.failed_combinations = []
+
         extracted_rows = []
+        pending_rows = []
+        card_locators = []
         for card_index, card in enumerate(flight_cards):
+            if only_combinations is not None and not any(c[0] == card_index for c in only_combinations):
+                continue
+            card_snapshot = snapshots[card_index]
+
             # 驗證每一張卡片是否只有兩組 MultiSegment div
-            multi_segment_divs = card.find_elements(
-                By.XPATH, 
-                ".//div[@ng-repeat='MultiSegment in cjSegment[$index]' and @ng-init='MultiSegmentIndex=$index' and @class='ng-scope']"
-            )
+            if card_snapshot is not None and card_snapshot["multi_segment_count"] != 2:
+                print(f"警告：第 {card_index + 1} 張卡片包含 {card_snapshot['multi_segment_count']} 組 MultiSegment div（預期為 2 組）")
+                continue
+
+            multi_segment_divs = card.find_elements(By.XPATH, self.MULTI_SEGMENT_XPATH)
             
             if len(multi_segment_divs) != 2:
                 print(f"警告：第 {card_index + 1} 張卡片包含 {len(multi_segment_divs)} 組 MultiSegment div（預期為 2 組）")
@@ -91,108 +186,578 @@ class FlightDataCollector:
             else:
                 print(f"第 {card_index + 1} 張卡片驗證通過：包含 {len(multi_segment_divs)} 組 MultiSegment div")
 
-            # 去程航班以及按鈕
-            departure_flights_buttons = multi_segment_divs[0].find_elements(
-                By.XPATH, 
-                ".//input[@type='radio' and @name]"
-            )
-            
-            # 回程航班以及按鈕
-            return_flights_buttons = multi_segment_divs[1].find_elements(
-                By.XPATH, 
-                ".//input[@type='radio' and @name]"
-            )
-            
-            dep_count = len(departure_flights_buttons)
-            ret_count = len(return_flights_buttons)
+            # 同一張卡片的選項按鈕、分頁與票價元素只定位一次，失效時自動重新定位
+            locators = CardElementCache()
+            card_locators.append(locators)
 
-            for d_idx in range(dep_count):
-                dep_list = multi_segment_divs[0].find_elements(
-                    By.XPATH, 
-                    ".//input[@type='radio' and @name]"
+            def find_radios(group_index: int, card=card) -> list:
+                return card.find_elements(
+                    By.XPATH,
+                    f"({self.MULTI_SEGMENT_XPATH})[{group_index + 1}]//input[@type='radio' and @name]"
                 )
-                if d_idx >= len(dep_list):
-                    break
-                dep_btn = dep_list[d_idx]
-                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", dep_btn)
-                self.driver.execute_script("arguments[0].click();", dep_btn)
-                time.sleep(0.1)
 
+            if card_snapshot is not None:
+                dep_count = len(card_snapshot["departure_options"])
+                ret_count = len(card_snapshot["return_options"])
+                selected_combination = tuple(card_snapshot["selected"])
+            else:
+                # 去程、回程航班按鈕數
+                dep_count = locators.use("departure_radios", lambda: find_radios(0), len)
+                ret_count = locators.use("return_radios", lambda: find_radios(1), len)
+                selected_combination = None
+
+            # 卡片尚未點擊任何選項時，快照中的明細即為目前選取組合的資料
+            card_untouched = True
+
+            # 以 (方向, 選項索引) 記錄已讀取的航段，去程航段只隨去程選項改變，回程亦同
+            leg_memo = {}
+
+            # 卡片上目前選取的去程選項，None 表示未知
+            selected_departure = selected_combination[0] if selected_combination else None
+
+            for d_idx in range(dep_count):
                 for r_idx in range(ret_count):
-                    ret_list = multi_segment_divs[1].find_elements(
-                        By.XPATH, 
-                        ".//input[@type='radio' and @name]"
-                    )
-                    if r_idx >= len(ret_list):
-                        break
-                    ret_btn = ret_list[r_idx]
-                    self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", ret_btn)
-                    self.driver.execute_script("arguments[0].click();", ret_btn)
-                    time.sleep(0.1)
-
-                    # 航班資訊取得
-                    flight_tab = card.find_element(By.CSS_SELECTOR, "a.tab01")
-                    self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", flight_tab)
-                    self.driver.execute_script("arguments[0].click();", flight_tab)
-                    try:
-                        WebDriverWait(self.driver, 5).until(
-                            lambda d: len(card.find_elements(By.CSS_SELECTOR, ".flightDetails_table")) >= 2
-                        )
-                    except TimeoutException:
-                        # WebDriverWait 超時時進行截圖
-                        try:
-                            screenshot_handler = ScreenshotHandler("testing-cola-rd-vector-storage")
-                            screenshot_handler.capture_and_upload(self.driver, "webdriverwait_timeout_flight_details")
-                        except Exception as screenshot_error:
-                            print(f"截圖失敗: {screenshot_error}")
-                        raise
-                    flight_extracted = self.flight_extractor.extract_and_clean_flight_data(
-                        card, start_date, return_date
-                    )
-
-                    # 行李資訊取得
-                    baggage_tab = card.find_element(By.CSS_SELECTOR, "a.tab03")
-                    self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", baggage_tab)
-                    self.driver.execute_script("arguments[0].click();", baggage_tab)
-                    try:
-                        WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".bagInformation_tab"))
-                        )
-                    except TimeoutException:
-                        # WebDriverWait 超時時進行截圖
+                    if only_combinations is not None and (card_index, d_idx, r_idx) not in only_combinations:
+                        continue
+
+                    use_snapshot = card_untouched and selected_combination == (d_idx, r_idx)
+                    card_untouched = False
+                    last_error = None
+                    for attempt in range(1, self.max_retries + 2):
                         try:
-                            screenshot_handler = ScreenshotHandler("testing-cola-rd-vector-storage")
-                            screenshot_handler.capture_and_upload(self.driver, "webdriverwait_timeout_baggage_info")
-                        except Exception as screenshot_error:
-                            print(f"截圖失敗: {screenshot_error}")
-                        raise
-                    current_flight_details = flight_extracted[0] if flight_extracted else {}
-                    card_baggage_info = self.baggage_extractor.extract_and_clean_baggage_data(
-                        card, self.driver, current_flight_details
-                    )
-
-                    # 票價資訊取得
-                    price_strong = card.find_element(
-                        By.CSS_SELECTOR, 
-                        "strong[bo-text='SaleGroup.Display_Price | number']"
-                    )
-                    self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", price_strong)
-                    self.driver.execute_script("arguments[0].click();", price_strong)
-                    price_extracted = self.price_extractor.extract_and_clean_price_data(card)
-
-                    # 點擊背景遮罩復原彈出視窗
-                    overlay = self.driver.find_element(By.CSS_SELECTOR, ".ui-widget-overlay.ui-front")
-                    self.driver.execute_script("arguments[0].click();", overlay)
-
-                    # 爬取時間戳記
-                    created_at = time.time()
-
-                    # 合併資料
-                    row = {**flight_extracted[0], **price_extracted[0], **card_baggage_info, "建立時間": created_at}
-                    extracted_rows.append(row)
+                            if attempt > 1:
+                                # 重試前關閉可能殘留的票價彈出視窗，並重新點擊兩個方向的選項
+                                self._dismiss_price_modal()
+                                selected_departure = None
+                                use_snapshot = False
+                            if selected_departure != d_idx:
+                                self._select_option(card, locators, find_radios, 0, d_idx)
+                                selected_departure = d_idx
+                            if not use_snapshot:
+                                self._select_option(card, locators, find_radios, 1, r_idx)
+                            result = self._collect_combination(
+                                card,
+                                locators,
+                                card_snapshot if use_snapshot else None,
+                                leg_memo,
+                                d_idx,
+                                r_idx,
+                                start_date,
+                                return_date
+                            )
+                            last_error = None
+                            break
+                        except self.RETRYABLE_ERRORS as e:
+                            last_error = e
+                            print(f"第 {card_index + 1} 張卡片組合（去程 {d_idx + 1}、回程 {r_idx + 1}）"
+                                  f"第 {attempt} 次擷取失敗: {type(e).__name__}")
+
+                    if last_error is not None:
+                        self.failed_combinations.append({
+                            "start_date": start_date,
+                            "return_date": return_date,
+                            "card_index": card_index,
+                            "departure_index": d_idx,
+                            "return_index": r_idx,
+                            "attempts": self.max_retries + 1,
+                            "error": f"{type(last_error).__name__}: {getattr(last_error, 'msg', None) or last_error}",
+                        })
+                        continue
+
+                    if isinstance(result, Future):
+                        pending_rows.append(result)
+                    else:
+                        extracted_rows.append(result)
 
+        if pending_rows:
+            extracted_rows.extend(future.result() for future in pending_rows)
+            print(f"HTML 解析行程池完成 {len(pending_rows)} 個組合")
+
+        print(f"頁面快照命中 {self.snapshot_hits} 個組合，省下對應的航班與行李分頁點擊")
+        print(f"航段快取命中 {self.leg_memo_hits} 個組合，省下對應的航班分頁點擊與明細讀取")
+        print(f"元素定位快取省下 {sum(l.saved_lookups for l in card_locators)} 次查詢，"
+              f"實際查詢 {sum(l.lookups for l in card_locators)} 次，"
+              f"其中因元素失效重新定位 {sum(l.refreshes for l in card_locators)} 次")
+        if self.failed_combinations:
+            print(f"{len(self.failed_combinations)} 個組合重試後仍擷取失敗，已略過")
         return extracted_rows
 
+    def _select_option(self, card, locators: CardElementCache, find_radios: Callable[[int], list], group_index: int, index: int) -> None:
+        """
+        點擊指定方向的航班選項並等待卡片靜止。
+        
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            locators (CardElementCache): 此卡片的元素定位快取。
+            find_radios (Callable[[int], list]): 依 MultiSegment 索引取得選項按鈕的函式。
+            group_index (int): 0 為去程、1 為回程。
+            index (int): 要點擊的選項索引。
+        
+        Examples:
+            >>> collector._select_option(card, locators, find_radios, 0, 1)
+        
+        Raises:
+            NoSuchElementException: 當選項索引超出按鈕數時
+        """
+        clicked = locators.use(
+            "departure_radios" if group_index == 0 else "return_radios",
+            lambda: find_radios(group_index),
+            lambda radios: self._click_option(radios, index)
+        )
+        if not clicked:
+            raise NoSuchElementException(f"找不到第 {index + 1} 個{'去程' if group_index == 0 else '回程'}選項")
+        # 上限不超過原本的固定 sleep，靜止等待只會縮短、不會拉長每次點擊的等待
+        self.quiescence.wait(root=card, quiet_ms=50, timeout=0.1, replaced_sleep=0.1)
+
+    def _collect_combination(
+        self,
+        card,
+        locators: CardElementCache,
+        card_snapshot: Optional[dict],
+        leg_memo: dict,
+        d_idx: int,
+        r_idx: int,
+        start_date: str,
+        return_date: str
+    ):
+        """
+        擷取目前選取組合的航班、行李與票價資料。
+        
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            locators (CardElementCache): 此卡片的元素定位快取。
+            card_snapshot (Optional[dict]): 目前組合可使用的卡片快照，沒有時為 None。
+            leg_memo (dict): 此卡片以 (方向, 選項索引) 記錄的已讀取航段。
+            d_idx (int): 去程選項索引。
+            r_idx (int): 回程選項索引。
+            start_date (str): 出發日期，格式 'YYYY/MM/DD'。
+            return_date (str): 回程日期，格式 'YYYY/MM/DD'。
+        
+        Returns:
+            dict | Future: 合併後的資料列；使用 HTML 解析行程池時為完成後回傳資料列的 Future。
+        
+        Examples:
+            >>> row = collector._collect_combination(card, locators, None, {}, 0, 0, "2025/10/15", "2025/10/20")
+        
+        Raises:
+            TimeoutException: 當分頁內容未在時限內出現時
+            NoSuchElementException: 當找不到分頁、票價或背景遮罩元素時
+        """
+        flight_record = None
+        if card_snapshot is not None:
+            flight_record = self.flight_extractor.extract_flight_data_from_snapshot(
+                card_snapshot, start_date, return_date
+            )
+        if flight_record is not None:
+            self.snapshot_hits += 1
+            leg_memo.update(self.flight_extractor.split_record_by_leg(flight_record, d_idx, r_idx))
+        elif ("去程", d_idx) in leg_memo and ("回程", r_idx) in leg_memo:
+            # 兩個方向的航段都已讀取過，直接組合而不再開啟航班分頁
+            flight_record = {**leg_memo[("去程", d_idx)], **leg_memo[("回程", r_idx)]}
+            self.leg_memo_hits += 1
+
+        # 交由 HTML 解析行程池時，瀏覽器只負責開啟分頁並取得 outerHTML
+        if self.html_parse_pool is not None:
+            future = self._submit_html_parse(card, locators, card_snapshot, flight_record, start_date, return_date)
+            if flight_record is None:
+                # 解析完成後才寫入航段快取，不阻塞瀏覽器；解析完成前的後續組合仍會開啟航班分頁
+                def memo_legs(done: Future, d_idx=d_idx, r_idx=r_idx) -> None:
+                    if done.exception() is None:
+                        leg_memo.update(self.flight_extractor.split_record_by_leg(done.result(), d_idx, r_idx))
+                future.add_done_callback(memo_legs)
+            return future
+
+        # 航班資訊取得
+        fixture_sources = {}
+        if flight_record is not None:
+            flight_extracted = [flight_record]
+        else:
+            flight_extracted = self._extract_flight_details(card, locators, start_date, return_date)
+            leg_memo.update(self.flight_extractor.split_record_by_leg(flight_extracted[0], d_idx, r_idx))
+            if self.fixture_dir:
+                fixture_sources["flight"] = card.get_attribute("outerHTML")
+
+        # 行李資訊取得
+        current_flight_details = flight_extracted[0] if flight_extracted else {}
+        card_baggage_info = None
+        if card_snapshot is not None and flight_record is not None:
+            card_baggage_info = self.baggage_extractor.extract_baggage_data_from_snapshot(
+                card_snapshot, current_flight_details
+            )
+        if card_baggage_info is None:
+            card_baggage_info = self._extract_baggage_details(card, locators, current_flight_details)
+            if self.fixture_dir:
+                fixture_sources["baggage"] = card.get_attribute("outerHTML")
+
+        # 票價資訊取得
+        self._open_price_modal(card, locators)
+        price_extracted = self._wait_price_modal(
+            lambda timeout: self.price_extractor.extract_and_clean_price_data(card, timeout)
+        )
+        if self.fixture_dir:
+            fixture_sources["modal"] = self._get_price_modal_html(0.1)
+
+        # 點擊背景遮罩復原彈出視窗
+        self._close_price_modal()
+
+        # 爬取時間戳記
+        created_at = time.time()
+
+        # 合併資料
+        row = {**flight_extracted[0], **price_extracted[0], **card_baggage_info, "建立時間": created_at}
+        if len(fixture_sources) == 3:
+            self._record_fixture(fixture_sources, row, start_date, return_date)
+        return row
+
+    def _dismiss_price_modal(self) -> None:
+        """
+        點擊所有殘留的背景遮罩，關閉前一次失敗時未關閉的票價彈出視窗。
+        
+        Examples:
+            >>> collector._dismiss_price_modal()
+        
+        Raises:
+            StaleElementReferenceException: 當遮罩在點擊前已被移除時
+        """
+        for overlay in self.driver.find_elements(By.CSS_SELECTOR, ".ui-widget-overlay.ui-front"):
+            self.driver.execute_script("arguments[0].click();", overlay)
+
+    def _click_option(self, radios: list, index: int) -> bool:
+        """
+        捲動並點擊指定索引的航班選項按鈕。
+        
+        Args:
+            radios (list): 同一組 MultiSegment 的選項按鈕。
+            index (int): 要點擊的選項索引。
+        
+        Returns:
+            bool: 已點擊時為 True；索引超出按鈕數時為 False。
+        
+        Examples:
+            >>> collector._click_option(radios, 0)
+            True
+        
+        Raises:
+            StaleElementReferenceException: 當按鈕已失效時
+        """
+        if index >= len(radios):
+            return False
+        self._scroll_and_click(radios[index])
+        return True
+
+    def _submit_html_parse(
+        self,
+        card,
+        locators: CardElementCache,
+        card_snapshot: Optional[dict],
+        flight_record: Optional[dict],
+        start_date: str,
+        return_date: str
+    ) -> Future:
+        """
+        開啟目前組合所需的分頁並取得 outerHTML，交由 HTML 解析行程池解析。
+        
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            locators (CardElementCache): 此卡片的元素定位快取。
+            card_snapshot (Optional[dict]): 目前組合可使用的卡片快照，沒有時為 None。
+            flight_record (Optional[dict]): 已由快照解析的航班記錄，沒有時為 None。
+            start_date (str): 出發日期，格式 'YYYY/MM/DD'。
+            return_date (str): 回程日期，格式 'YYYY/MM/DD'。
+        
+        Returns:
+            Future: 完成後回傳合併後資料列的 Future。
+        
+        Examples:
+            >>> future = collector._submit_html_parse(card, locators, None, None, "2025/10/15", "2025/10/20")
+            >>> row = future.result()
+        
+        Raises:
+            TimeoutException: 當分頁內容未在時限內出現時
+        """
+        flight_html = None
+        if flight_record is None:
+            self._open_flight_tab(card, locators)
+            flight_html = card.get_attribute("outerHTML")
+
+        baggage_info = None
+        if flight_record is not None and card_snapshot is not None:
+            baggage_info = self.baggage_extractor.extract_baggage_data_from_snapshot(card_snapshot, flight_record)
+        baggage_html = None
+        if baggage_info is None:
+            self._open_baggage_tab(card, locators)
+            baggage_html = card.get_attribute("outerHTML")
+
+        self._open_price_modal(card, locators)
+        modal_html = self._wait_price_modal(self._get_price_modal_html)
+        self._close_price_modal()
+
+        return self.html_parse_pool.submit(
+            parse_combination_html,
+            start_date,
+            return_date,
+            time.time(),
+            modal_html,
+            flight_html=flight_html,
+            baggage_html=baggage_html,
+            flight_record=flight_record,
+            baggage_info=baggage_info
+        )
+
+    def _open_flight_tab(self, card, locators: CardElementCache) -> None:
+        """
+        點擊航班資訊分頁並等待航班明細表格出現。
+        
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            locators (CardElementCache): 此卡片的元素定位快取。
+        
+        Examples:
+            >>> collector._open_flight_tab(card, CardElementCache())
+        
+        Raises:
+            TimeoutException: 當航班明細未在時限內出現時
+        """
+        locators.use(
+            "flight_tab",
+            lambda: card.find_element(By.CSS_SELECTOR, "a.tab01"),
+            self._scroll_and_click
+        )
+        try:
+            self.latency_recorder.measure(
+                self.route,
+                "flight_details",
+                self.DEFAULT_WAIT_TIMEOUTS["flight_details"],
+                lambda timeout: WebDriverWait(self.driver, timeout).until(
+                    lambda d: len(card.find_elements(By.CSS_SELECTOR, ".flightDetails_table")) >= 2
+                )
+            )
+        except TimeoutException:
+            # WebDriverWait 超時時進行截圖
+            try:
+                screenshot_handler = ScreenshotHandler("testing-cola-rd-vector-storage")
+                screenshot_handler.capture_and_upload(self.driver, "webdriverwait_timeout_flight_details")
+            except Exception as screenshot_error:
+                print(f"截圖失敗: {screenshot_error}")
+            raise
+
+    def _open_baggage_tab(self, card, locators: CardElementCache) -> None:
+        """
+        點擊行李資訊分頁並等待行李表格出現。
+        
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            locators (CardElementCache): 此卡片的元素定位快取。
+        
+        Examples:
+            >>> collector._open_baggage_tab(card, CardElementCache())
+        
+        Raises:
+            TimeoutException: 當行李資訊未在時限內出現時
+        """
+        locators.use(
+            "baggage_tab",
+            lambda: card.find_element(By.CSS_SELECTOR, "a.tab03"),
+            self._scroll_and_click
+        )
+        try:
+            self.latency_recorder.measure(
+                self.route,
+                "baggage_info",
+                self.DEFAULT_WAIT_TIMEOUTS["baggage_info"],
+                lambda timeout: WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".bagInformation_tab"))
+                )
+            )
+        except TimeoutException:
+            # WebDriverWait 超時時進行截圖
+            try:
+                screenshot_handler = ScreenshotHandler("testing-cola-rd-vector-storage")
+                screenshot_handler.capture_and_upload(self.driver, "webdriverwait_timeout_baggage_info")
+            except Exception as screenshot_error:
+                print(f"截圖失敗: {screenshot_error}")
+            raise
+
+    def _open_price_modal(self, card, locators: CardElementCache) -> None:
+        """
+        點擊顯示票價開啟 DBGModal 票價明細彈出視窗。
+        
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            locators (CardElementCache): 此卡片的元素定位快取。
+        
+        Examples:
+            >>> collector._open_price_modal(card, CardElementCache())
+        
+        Raises:
+            NoSuchElementException: 當卡片沒有顯示票價時
+        """
+        locators.use(
+            "price",
+            lambda: card.find_element(By.CSS_SELECTOR, "strong[bo-text='SaleGroup.Display_Price | number']"),
+            self._scroll_and_click
+        )
+
+    def _scroll_and_click(self, element) -> None:
+        """
+        將元素捲動至畫面中央並以 JavaScript 點擊。
+        
+        Args:
+            element (webdriver.remote.webelement.WebElement): 要點擊的元素。
+        
+        Examples:
+            >>> collector._scroll_and_click(flight_tab)
+        
+        Raises:
+            StaleElementReferenceException: 當元素已失效時
+        """
+        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", element)
+        self.driver.execute_script("arguments[0].click();", element)
+
+    def _close_price_modal(self) -> None:
+        """
+        點擊背景遮罩關閉票價明細彈出視窗。
+        
+        遮罩在每次關閉彈出視窗時都會被移除，因此不放入定位快取。
+        
+        Examples:
+            >>> collector._close_price_modal()
+        
+        Raises:
+            NoSuchElementException: 當找不到背景遮罩時
+        """
+        overlay = self.driver.find_element(By.CSS_SELECTOR, ".ui-widget-overlay.ui-front")
+        self.driver.execute_script("arguments[0].click();", overlay)
+
+    def _wait_price_modal(self, read_modal: Callable[[float], Any]) -> Any:
+        """
+        以推算的上限等待並讀取 DBGModal，記錄實際等待時間。
+        
+        Args:
+            read_modal (Callable[[float], Any]): 接收上限秒數、等待並讀取彈出視窗的函式。
+        
+        Returns:
+            Any: read_modal 的回傳值。
+        
+        Examples:
+            >>> modal_html = collector._wait_price_modal(collector._get_price_modal_html)
+        
+        Raises:
+            無特定錯誤
+        """
+        return self.latency_recorder.measure(
+            self.route, "price_modal", self.DEFAULT_WAIT_TIMEOUTS["price_modal"], read_modal
+        )
+
+    def _get_price_modal_html(self, timeout: float = 5) -> str:
+        """
+        取得 DBGModal 票價明細彈出視窗的 outerHTML。
+        
+        Args:
+            timeout (float): 等待彈出視窗出現的上限秒數，預設為 5。
+        
+        Returns:
+            str: DBGModal 的 outerHTML；彈出視窗未出現時為空字串。
+        
+        Examples:
+            >>> modal_html = collector._get_price_modal_html()
+        
+        Raises:
+            無特定錯誤
+        """
+        try:
+            modal = WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.ID, "DBGModal"))
+            )
+        except TimeoutException:
+            return ""
+        return modal.get_attribute("outerHTML") or ""
+
+    def _record_fixture(
+        self,
+        sources: dict,
+        row: dict,
+        start_date: str,
+        return_date: str
+    ) -> None:
+        """
+        將組合的 outerHTML 與 Selenium 擷取結果保存為 fixture，供 html_card_parser 比對離線解析結果。
+        
+        Args:
+            sources (dict): flight、baggage、modal 三個分頁的 outerHTML。
+            row (dict): Selenium 路徑的資料列。
+            start_date (str): 出發日期，格式 'YYYY/MM/DD'。
+            return_date (str): 回程日期，格式 'YYYY/MM/DD'。
+        
+        Examples:
+            >>> collector._record_fixture({"flight": "...", "baggage": "...", "modal": "..."}, row, "2025/10/15", "2025/10/20")
+        
+        Raises:
+            IOError: 當檔案寫入失敗時
+        """
+        fixture_path = os.path.join(self.fixture_dir, f"{time.time_ns()}")
+        os.makedirs(fixture_path, exist_ok=True)
+        for part, source_html in sources.items():
+            with open(os.path.join(fixture_path, f"{part}.html"), "w", encoding="utf-8") as f:
+                f.write(source_html)
+        with open(os.path.join(fixture_path, "expected.json"), "w", encoding="utf-8") as f:
+            json.dump({"start_date": start_date, "return_date": return_date, "row": row}, f, ensure_ascii=False)
+
+    def _extract_flight_details(
+        self,
+        card,
+        locators: CardElementCache,
+        start_date: str,
+        return_date: str
+    ) -> List[dict]:
+        """
+        點擊航班資訊分頁並擷取目前選取組合的航班明細。
+        
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            locators (CardElementCache): 此卡片的元素定位快取。
+            start_date (str): 出發日期，格式 'YYYY/MM/DD'。
+            return_date (str): 回程日期，格式 'YYYY/MM/DD'。
+        
+        Returns:
+            List[dict]: 只包含一筆航班記錄的列表。
+        
+        Examples:
+            >>> collector = FlightDataCollector(driver)
+            >>> collector._extract_flight_details(card, CardElementCache(), "2025/10/15", "2025/10/20")
+        
+        Raises:
+            TimeoutException: 當航班明細未在時限內出現時
+        """
+        self._open_flight_tab(card, locators)
+        return self.flight_extractor.extract_and_clean_flight_data_by_script(
+            card, start_date, return_date
+        )
+
+    def _extract_baggage_details(self, card, locators: CardElementCache, current_flight_details: dict) -> dict:
+        """
+        點擊行李資訊分頁並擷取目前選取組合的行李資訊。
+        
+        Args:
+            card (webdriver.remote.webelement.WebElement): 航班卡片根元素。
+            locators (CardElementCache): 此卡片的元素定位快取。
+            current_flight_details (dict): 當前航班記錄，用於判斷行李去回程。
+        
+        Returns:
+            dict: 行李資訊。
+        
+        Examples:
+            >>> collector = FlightDataCollector(driver)
+            >>> collector._extract_baggage_details(card, CardElementCache(), flight_details)
+        
+        Raises:
+            TimeoutException: 當行李資訊未在時限內出現時
+        """
+        self._open_baggage_tab(card, locators)
+        return self.baggage_extractor.extract_and_clean_baggage_data(
+            card, self.driver, current_flight_details
+        )
+
 
 class DataFrameBuilder:
     """
@@ -279,18 +844,51 @@ class ScraperTaskController:
     Raises:
         ValueError: 當參數無效時
     """
+
+    # 票價頁面在樣本不足時的等待上限秒數
+    RESULTS_PAGE_TIMEOUT = 45
     
-    def __init__(self):
+    def __init__(
+        self,
+        driver_pool: Optional[WebDriverPool] = None,
+        session_store: Optional[SessionStore] = None,
+        lean_mode: bool = False,
+        page_load_strategy: str = 'normal',
+        html_parse_pool: Optional[Executor] = None,
+        fixture_dir: Optional[str] = None,
+        latency_recorder: Optional[LatencyRecorder] = None
+    ):
         """
         初始化爬蟲任務控制器。
         
+        Args:
+            driver_pool (Optional[WebDriverPool]): WebDriver 連線池，預設為 None。
+                提供時會向連線池借用已登入的 driver，任務結束後歸還而非關閉。
+            session_store (Optional[SessionStore]): 登入 session 快取，未使用連線池時
+                登入前會先嘗試還原快取的 session，預設為 None。
+            lean_mode (bool): 是否以精簡模式載入票價頁面（封鎖圖片、字型與追蹤資源），預設為 False。
+            page_load_strategy (str): 未使用連線池時新建 driver 的頁面載入策略，預設為 'normal'。
+            html_parse_pool (Optional[Executor]): HTML 解析行程池，可跨任務共用，預設為 None。
+            fixture_dir (Optional[str]): 錄製 HTML fixture 的目錄，同時錄製頁面的 XHR 回應與 DOM 資料列
+                供日後確認回應欄位（driver 需啟用 performance log），預設為 None。
+            latency_recorder (Optional[LatencyRecorder]): 等待延遲記錄器，依各航線的紀錄推算等待上限，
+                可跨任務共用，None 時每個任務各自在記憶體中記錄，預設為 None。
+        
         Examples:
             >>> controller = ScraperTaskController()
+            >>> controller = ScraperTaskController(driver_pool=WebDriverPool())
         
         Raises:
             無特定錯誤
         """
         self.driver = None
+        self.driver_pool = driver_pool
+        self.session_store = session_store
+        self.lean_mode = lean_mode
+        self.page_load_strategy = page_load_strategy
+        self.html_parse_pool = html_parse_pool
+        self.fixture_dir = fixture_dir
+        self.latency_recorder = latency_recorder or LatencyRecorder()
     
     def run_scraping_task(
         self,
@@ -315,7 +913,9 @@ class ScraperTaskController:
             captcha_model_path (str): 驗證碼模型路徑，預設為 'captcha_model_1.keras'。
         
         Returns:
-            pd.DataFrame: 收集到的航班資料 DataFrame。
+            pd.DataFrame: 收集到的航班資料 DataFrame；查無航班時為空的 DataFrame。
+                個別組合重試後仍失敗時回傳其餘組合的資料，
+                失敗的組合列於 attrs["failed_combinations"]（卡片、去程、回程索引與錯誤訊息）。
         
         Examples:
             >>> controller = ScraperTaskController()
@@ -336,17 +936,19 @@ class ScraperTaskController:
         if not return_date:
             raise ValueError("return_date 不可為空")
         
+        route = f"{origin_code}-{destination_code}"
+        navigator = None
         try:
-            # 初始化 WebDriver
-            factory = WebDriverFactory()
-            self.driver = factory.create_driver()
-            
-            navigator = WebNavigator(self.driver)
+            navigator = self._start_driver(username, password, captcha_model_path)
             
-            # 登入網站
-            navigator.login_with_retry(username, password, captcha_model_path)
+            # 錄製 fixture 時一併擷取 XHR 回應，供日後比對 XHR 與 DOM 的資料列
+            xhr_capture = None
+            if self.fixture_dir:
+                xhr_capture = XhrResponseCapture(self.driver)
+                xhr_capture.clear()
             
             # 導航至機票查詢頁面
+            navigation_start = time.time()
             navigator.navigate_to_flight_page(
                 origin_code=origin_code,
                 destination_code=destination_code,
@@ -354,40 +956,536 @@ class ScraperTaskController:
                 return_date=return_date
             )
             
-            # 等待頁面加載並滾動至底部
-            try:
-                WebDriverWait(self.driver, 45).until(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, 'tab01'))
-                )
-            except TimeoutException:
-                # WebDriverWait 超時時進行截圖
-                try:
-                    screenshot_handler = ScreenshotHandler("testing-cola-rd-vector-storage")
-                    screenshot_handler.capture_and_upload(self.driver, "webdriverwait_timeout_tab01")
-                except Exception as screenshot_error:
-                    print(f"截圖失敗: {screenshot_error}")
-                raise
-            navigator.scroll_to_bottom()
-            
-            # 展開所有航班選項
-            expander = FlightOptionExpander(self.driver)
-            expander.expand_all_options()
-            
-            # 等待展開操作完成
-            time.sleep(2)
-            
-            # 收集資料
-            collector = FlightDataCollector(self.driver)
-            extracted_rows = collector.collect_all_flight_data(start_date, return_date)
-            
-            # 建構 DataFrame
-            builder = DataFrameBuilder()
-            final_df = builder.build_dataframe(extracted_rows)
-            
-            return final_df
+            return self._scrape_loaded_page(
+                navigator, origin_code, destination_code, start_date, return_date, navigation_start, xhr_capture
+            )
             
         except Exception as e:
             raise RuntimeError(f"爬蟲任務失敗: {e}")
         finally:
-            if self.driver:
+            self._finish_task(navigator, route)
+
+    def run_pipelined_tasks(
+        self,
+        origin_code: str,
+        destination_code: str,
+        date_pairs: List[Tuple[str, str]],
+        username: str = '0920262685',
+        password: str = 'B8722000',
+        captcha_model_path: str = 'captcha_model_1.keras'
+    ) -> Iterator[Tuple[str, str, pd.DataFrame]]:
+        """
+        以同一個 driver 依序爬取多組日期，並在擷取目前頁面時於背景分頁預先載入下一組日期的頁面。
+
+        目前頁面就緒後立即以 window.open 開啟下一組日期的查詢頁面，逐一點擊組合的期間
+        下一頁面同時在背景載入；目前日期完成後關閉其分頁並切換至預先載入的分頁，
+        查詢頁面的載入時間因此被擷取時間掩蓋。
+
+        使用連線池時每個頁面都計為一個任務：每組日期完成後以 WebDriverPool.complete_task 檢查
+        任務數、健康狀態與記憶體，driver 被回收時改向連線池取得新的 driver 繼續處理剩餘日期；
+        達到任務數上限前的最後一個頁面不預先載入下一組日期。
+
+        Args:
+            origin_code (str): 出發地代碼 (例如 'TPE')。
+            destination_code (str): 目的地代碼 (例如 'TYO')。
+            date_pairs (List[Tuple[str, str]]): (出發日期, 返回日期) 列表，格式為 'YYYY/MM/DD'。
+            username (str): 登入帳號，預設為 '0920262685'。
+            password (str): 登入密碼，預設為 'B8722000'。
+            captcha_model_path (str): 驗證碼模型路徑，預設為 'captcha_model_1.keras'。
+
+        Returns:
+            Iterator[Tuple[str, str, pd.DataFrame]]: 依序產生 (出發日期, 返回日期, 收集到的資料)。
+
+        Examples:
+            >>> controller = ScraperTaskController(driver_pool=WebDriverPool())
+            >>> for start_date, return_date, df in controller.run_pipelined_tasks("TPE", "NRT", date_pairs):
+            ...     print(start_date, return_date, len(df))
+
+        Raises:
+            ValueError: 當 origin_code 或 destination_code 為空時
+            RuntimeError: 當爬蟲任務失敗時
+        """
+        if not origin_code:
+            raise ValueError("origin_code 不可為空")
+        if not destination_code:
+            raise ValueError("destination_code 不可為空")
+
+        route = f"{origin_code}-{destination_code}"
+        navigator = None
+        try:
+            navigator = self._start_driver(username, password, captcha_model_path)
+            preloaded = {}
+            for pair_index, (start_date, return_date) in enumerate(date_pairs):
+                navigation_start = time.time()
+                if "handle" in preloaded:
+                    navigator.switch_to_preloaded_page(preloaded.pop("handle"))
+                    print(f"切換至預先載入的頁面: {start_date} - {return_date}")
+                else:
+                    navigator.navigate_to_flight_page(origin_code, destination_code, start_date, return_date)
+
+                def preload_next(pair_index=pair_index):
+                    if self.driver_pool is not None and self.driver_pool.remaining_tasks(self.driver) <= 1:
+                        return
+                    if pair_index + 1 < len(date_pairs):
+                        next_start, next_return = date_pairs[pair_index + 1]
+                        preloaded["handle"] = navigator.preload_flight_page(
+                            origin_code, destination_code, next_start, next_return
+                        )
+
+                final_df = self._scrape_loaded_page(
+                    navigator, origin_code, destination_code, start_date, return_date, navigation_start,
+                    on_page_ready=preload_next
+                )
+                yield start_date, return_date, final_df
+
+                # 最後一組日期的任務由 _finish_task 歸還 driver 時累計
+                if self.driver_pool is not None and pair_index + 1 < len(date_pairs):
+                    if not self.driver_pool.complete_task(self.driver):
+                        # driver 已達任務數或記憶體上限而被關閉，預先載入的分頁隨之失效
+                        self.driver = None
+                        preloaded.clear()
+                        navigator = self._start_driver(username, password, captcha_model_path)
+
+        except Exception as e:
+            raise RuntimeError(f"爬蟲任務失敗: {e}")
+        finally:
+            if self.driver is not None:
+                # 關閉尚未使用的預先載入分頁，歸還連線池前只保留一個分頁
+                try:
+                    current_handle = self.driver.current_window_handle
+                    for handle in self.driver.window_handles:
+                        if handle != current_handle:
+                            self.driver.switch_to.window(handle)
+                            self.driver.close()
+                    self.driver.switch_to.window(current_handle)
+                except WebDriverException as e:
+                    print(f"關閉預先載入的分頁失敗: {e}")
+            self._finish_task(navigator, route)
+
+    def _start_driver(self, username: str, password: str, captcha_model_path: str) -> WebNavigator:
+        """
+        取得已登入的 WebDriver 並建立共用 DOM 靜止等待器的導覽器。
+
+        Args:
+            username (str): 登入帳號。
+            password (str): 登入密碼。
+            captcha_model_path (str): 驗證碼模型路徑。
+
+        Returns:
+            WebNavigator: 操作 self.driver 的導覽器。
+
+        Examples:
+            >>> navigator = controller._start_driver("user", "pass", "captcha_model_1.keras")
+
+        Raises:
+            RuntimeError: 當 WebDriver 建立或登入失敗時
+        """
+        if self.driver_pool is not None:
+            # 向連線池借用已登入的 WebDriver
+            self.driver = self.driver_pool.acquire(username, password, captcha_model_path)
+            return WebNavigator(self.driver, lean_mode=self.lean_mode, quiescence=DomQuiescenceWaiter(self.driver))
+
+        # 初始化 WebDriver
+        factory = WebDriverFactory()
+        self.driver = factory.create_driver(
+            page_load_strategy=self.page_load_strategy,
+            enable_performance_log=bool(self.fixture_dir)
+        )
+        navigator = WebNavigator(self.driver, lean_mode=self.lean_mode, quiescence=DomQuiescenceWaiter(self.driver))
+
+        # 登入網站
+        navigator.login_with_retry(
+            username,
+            password,
+            captcha_model_path,
+            session_store=self.session_store
+        )
+        return navigator
+
+    def _scrape_loaded_page(
+        self,
+        navigator: WebNavigator,
+        origin_code: str,
+        destination_code: str,
+        start_date: str,
+        return_date: str,
+        navigation_start: float,
+        xhr_capture: Optional[XhrResponseCapture] = None,
+        on_page_ready: Optional[Callable[[], None]] = None
+    ) -> pd.DataFrame:
+        """
+        等待已開始載入的機票查詢頁面就緒，並擷取所有組合的資料。
+
+        Args:
+            navigator (WebNavigator): 操作 self.driver 的導覽器。
+            origin_code (str): 出發地代碼。
+            destination_code (str): 目的地代碼。
+            start_date (str): 出發日期，格式為 'YYYY/MM/DD'。
+            return_date (str): 返回日期，格式為 'YYYY/MM/DD'。
+            navigation_start (float): 開始載入頁面的時間戳記，用於計算頁面就緒耗時。
+            xhr_capture (Optional[XhrResponseCapture]): 錄製 fixture 時的 XHR 回應擷取器，預設為 None。
+            on_page_ready (Optional[Callable[[], None]]): 頁面就緒後、開始擷取前呼叫的函式，預設為 None。
+
+        Returns:
+            pd.DataFrame: 收集到的航班資料 DataFrame。
+
+        Examples:
+            >>> navigator.navigate_to_flight_page("TPE", "NRT", "2025/10/15", "2025/10/20")
+            >>> df = controller._scrape_loaded_page(navigator, "TPE", "NRT", "2025/10/15", "2025/10/20", time.time())
+
+        Raises:
+            TimeoutException: 當頁面未在時限內就緒時
+        """
+        route = f"{origin_code}-{destination_code}"
+        quiescence = navigator.quiescence
+        builder = DataFrameBuilder()
+
+        # 等待 Angular 渲染完成並滾動至底部
+        try:
+            page_outcome = self.latency_recorder.measure(
+                route, "results_page", self.RESULTS_PAGE_TIMEOUT, navigator.wait_for_results
+            )
+        except TimeoutException:
+            # WebDriverWait 超時時進行截圖
+            try:
+                screenshot_handler = ScreenshotHandler("testing-cola-rd-vector-storage")
+                screenshot_handler.capture_and_upload(self.driver, "webdriverwait_timeout_tab01")
+            except Exception as screenshot_error:
+                print(f"截圖失敗: {screenshot_error}")
+            raise
+        
+        # 記錄頁面載入指標，用於比較精簡模式的效益
+        page_stats = navigator.get_page_transfer_stats()
+        print(f"頁面載入指標（{'精簡模式' if self.lean_mode else '一般模式'}）: "
+              f"頁面就緒耗時 {time.time() - navigation_start:.2f} 秒，"
+              f"傳輸 {page_stats['transfer_bytes'] / 1024:.1f} KB，"
+              f"資源 {page_stats['resource_count']} 個")
+
+        if on_page_ready is not None:
+            on_page_ready()
+        
+        if page_outcome == WebNavigator.PAGE_NO_RESULTS:
+            print(f"查無航班: {origin_code} -> {destination_code}, {start_date} - {return_date}")
+            return builder.build_dataframe([])
+        
+        navigator.scroll_to_bottom()
+        
+        payloads = xhr_capture.collect() if xhr_capture is not None else []
+
+        # 展開所有航班選項（展開後等待 DOM 靜止）
+        expander = FlightOptionExpander(self.driver, quiescence, self.latency_recorder, route)
+        expander.expand_all_options()
+        
+        # 收集資料
+        collector = FlightDataCollector(
+            self.driver, self.html_parse_pool, self.fixture_dir, quiescence, self.latency_recorder, route
+        )
+        # 失敗的組合已在 collect_all_flight_data 內於同一頁面重試 max_retries 次，此處不再重試
+        extracted_rows = collector.collect_all_flight_data(start_date, return_date)
+        
+        if payloads and self.fixture_dir:
+            self._record_xhr_fixture(payloads, extracted_rows, start_date, return_date)
+
+        # 建構 DataFrame，仍失敗的組合附在 attrs 中供呼叫端記錄或另行重試
+        final_df = builder.build_dataframe(extracted_rows)
+        final_df.attrs["failed_combinations"] = collector.failed_combinations
+        return final_df
+
+    def _record_xhr_fixture(self, payloads: List[dict], dom_rows: List[dict], start_date: str, return_date: str) -> None:
+        """
+        將整頁的 XHR 回應與 DOM 路徑的資料列保存為 fixture，供日後確認回應欄位名稱後校正以 JSON 建構資料列的方式。
+
+        Args:
+            payloads (List[dict]): XhrResponseCapture.collect 的回傳值。
+            dom_rows (List[dict]): 同一頁面以 DOM 點擊擷取的資料列。
+            start_date (str): 出發日期，格式 'YYYY/MM/DD'。
+            return_date (str): 回程日期，格式 'YYYY/MM/DD'。
+
+        Examples:
+            >>> controller._record_xhr_fixture(payloads, rows, "2025/10/15", "2025/10/20")
+
+        Raises:
+            無特定錯誤（寫入失敗時僅記錄訊息）
+        """
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        fixture_path = os.path.join(self.fixture_dir, f"xhr_{time.time_ns()}.json")
+        try:
+            with open(fixture_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "start_date": start_date,
+                    "return_date": return_date,
+                    "payloads": payloads,
+                    "dom_rows": dom_rows,
+                }, f, ensure_ascii=False)
+        except IOError as e:
+            print(f"XHR fixture 寫入失敗: {e}")
+            return
+        print(f"已錄製 XHR fixture: {fixture_path}（{len(payloads)} 個回應，{len(dom_rows)} 筆 DOM 資料列）")
+
+    def _finish_task(self, navigator: Optional[WebNavigator], route: str) -> None:
+        """
+        輸出等待統計、保存延遲紀錄並歸還或關閉 WebDriver。
+
+        Args:
+            navigator (Optional[WebNavigator]): 任務使用的導覽器，driver 建立失敗時為 None。
+            route (str): 航線代碼。
+
+        Examples:
+            >>> controller._finish_task(navigator, "TPE-NRT")
+
+        Raises:
+            無特定錯誤
+        """
+        quiescence = navigator.quiescence if navigator is not None else None
+        if quiescence is not None and quiescence.replaced_seconds:
+            print(f"DOM 靜止等待取代固定 sleep {quiescence.replaced_seconds:.1f} 秒，"
+                  f"實際等待 {quiescence.waited_seconds:.1f} 秒，節省 {quiescence.saved_seconds:.1f} 秒")
+        latency_summary = self.latency_recorder.summary(
+            route,
+            {
+                "results_page": self.RESULTS_PAGE_TIMEOUT,
+                "flight_cards": FlightOptionExpander.FLIGHT_CARDS_TIMEOUT,
+                **FlightDataCollector.DEFAULT_WAIT_TIMEOUTS
+            }
+        )
+        if latency_summary:
+            print(f"{route} 等待延遲: {latency_summary}")
+        try:
+            self.latency_recorder.save()
+        except IOError as e:
+            print(e)
+        if self.driver:
+            if self.driver_pool is not None:
+                self.driver_pool.release(self.driver)
+            else:
                 self.driver.quit()
+            self.driver = None
+
+
+class ParallelScrapeRunner:
+    """
+    並行爬蟲執行器，以 K 個獨立的瀏覽器 worker 同時處理多組日期。
+
+    每個 worker 執行緒各自擁有 ScraperTaskController，並向共用的 WebDriverPool
+    借用具備獨立連接埠與使用者資料目錄的 driver。爬蟲大部分時間都在等待頁面載入，
+    因此以執行緒並行即可在單一 CPU 上重疊等待時間。
+
+    Examples:
+        >>> runner = ParallelScrapeRunner(WebDriverPool(), max_workers=3)
+        >>> for start_date, return_date, df in runner.run("TPE", "NRT", date_pairs):
+        ...     uploader.upload_dataframe(df, "dataset.table", "project-id")
+
+    Raises:
+        ValueError: 當參數無效時
+    """
+
+    def __init__(
+        self,
+        driver_pool: WebDriverPool,
+        max_workers: int = 1,
+        lean_mode: bool = False,
+        html_parse_pool: Optional[Executor] = None,
+        fixture_dir: Optional[str] = None,
+        latency_recorder: Optional[LatencyRecorder] = None,
+        pipeline: bool = False,
+        captcha_model_path: str = 'captcha_model_1.keras'
+    ):
+        """
+        初始化並行爬蟲執行器。
+
+        Args:
+            driver_pool (WebDriverPool): 所有 worker 共用的 WebDriver 連線池。
+            max_workers (int): 同時執行的瀏覽器 worker 數量，預設為 1。
+            lean_mode (bool): 是否以精簡模式載入票價頁面，預設為 False。
+            html_parse_pool (Optional[Executor]): 所有 worker 共用的 HTML 解析行程池，預設為 None。
+            fixture_dir (Optional[str]): 錄製 HTML fixture 的目錄，預設為 None。
+            latency_recorder (Optional[LatencyRecorder]): 所有 worker 共用的等待延遲記錄器，預設為 None。
+            pipeline (bool): 是否讓每個 worker 以同一個 driver 依序處理分配到的日期，並在背景分頁
+                預先載入下一組日期的頁面，預設為 False。
+            captcha_model_path (str): 驗證碼模型路徑，副檔名為 .tflite 時使用 TFLite 後端，預設為 'captcha_model_1.keras'。
+
+        Examples:
+            >>> runner = ParallelScrapeRunner(WebDriverPool(), max_workers=3)
+            >>> runner = ParallelScrapeRunner(WebDriverPool(), max_workers=2, pipeline=True)
+
+        Raises:
+            ValueError: 當 driver_pool 為 None 或 max_workers 小於等於 0 時
+        """
+        if driver_pool is None:
+            raise ValueError("driver_pool 不可為 None")
+        if max_workers <= 0:
+            raise ValueError("max_workers 必須大於 0")
+
+        self.driver_pool = driver_pool
+        self.max_workers = max_workers
+        self.lean_mode = lean_mode
+        self.html_parse_pool = html_parse_pool
+        self.fixture_dir = fixture_dir
+        self.latency_recorder = latency_recorder
+        self.pipeline = pipeline
+        self.captcha_model_path = captcha_model_path
+
+    def _create_controller(self) -> ScraperTaskController:
+        """
+        建立 worker 使用的爬蟲任務控制器。
+
+        Returns:
+            ScraperTaskController: 共用連線池與設定的控制器。
+
+        Examples:
+            >>> controller = runner._create_controller()
+
+        Raises:
+            無特定錯誤
+        """
+        return ScraperTaskController(
+            driver_pool=self.driver_pool,
+            lean_mode=self.lean_mode,
+            html_parse_pool=self.html_parse_pool,
+            fixture_dir=self.fixture_dir,
+            latency_recorder=self.latency_recorder
+        )
+
+    def _run_single(
+        self,
+        origin_code: str,
+        destination_code: str,
+        start_date: str,
+        return_date: str
+    ) -> Tuple[str, str, pd.DataFrame]:
+        """
+        在 worker 執行緒中執行單一日期組合的爬蟲任務。
+
+        Args:
+            origin_code (str): 出發地代碼。
+            destination_code (str): 目的地代碼。
+            start_date (str): 出發日期，格式為 'YYYY/MM/DD'。
+            return_date (str): 返回日期，格式為 'YYYY/MM/DD'。
+
+        Returns:
+            Tuple[str, str, pd.DataFrame]: (出發日期, 返回日期, 收集到的資料)。
+
+        Examples:
+            >>> runner._run_single("TPE", "NRT", "2025/10/15", "2025/10/20")
+
+        Raises:
+            RuntimeError: 當爬蟲任務失敗時
+        """
+        print(f"正在爬取: {origin_code} -> {destination_code}, {start_date} - {return_date}")
+        controller = self._create_controller()
+        final_df = controller.run_scraping_task(
+            origin_code=origin_code,
+            destination_code=destination_code,
+            start_date=start_date,
+            return_date=return_date,
+            captcha_model_path=self.captcha_model_path
+        )
+        return start_date, return_date, final_df
+
+    def _run_pipelined_chunk(
+        self,
+        origin_code: str,
+        destination_code: str,
+        date_pairs: List[Tuple[str, str]],
+        results: queue.Queue,
+        stop_event: threading.Event
+    ) -> None:
+        """
+        在 worker 執行緒中以預先載入的方式依序處理分配到的日期，每完成一組即放入 results。
+
+        Args:
+            origin_code (str): 出發地代碼。
+            destination_code (str): 目的地代碼。
+            date_pairs (List[Tuple[str, str]]): 分配給此 worker 的日期組合。
+            results (queue.Queue): 接收 (出發日期, 返回日期, 資料) 的佇列。
+            stop_event (threading.Event): 其他 worker 失敗或呼叫端停止讀取時設定，完成目前的日期後即停止。
+
+        Examples:
+            >>> runner._run_pipelined_chunk("TPE", "NRT", [("2025/10/15", "2025/10/20")], queue.Queue(), threading.Event())
+
+        Raises:
+            RuntimeError: 當爬蟲任務失敗時（例外由 Future 帶回 run）
+        """
+        print(f"正在以預先載入方式爬取 {len(date_pairs)} 組日期: {origin_code} -> {destination_code}")
+        controller = self._create_controller()
+        tasks = controller.run_pipelined_tasks(
+            origin_code, destination_code, date_pairs, captcha_model_path=self.captcha_model_path
+        )
+        try:
+            for result in tasks:
+                results.put(result)
+                if stop_event.is_set():
+                    print(f"停止預先載入，略過此 worker 其餘日期: {origin_code} -> {destination_code}")
+                    break
+        finally:
+            # 關閉產生器以關閉背景分頁並歸還 driver
+            tasks.close()
+
+    def run(
+        self,
+        origin_code: str,
+        destination_code: str,
+        date_pairs: List[Tuple[str, str]]
+    ) -> Iterator[Tuple[str, str, pd.DataFrame]]:
+        """
+        並行執行所有日期組合，並依完成順序逐一回傳結果。
+
+        Args:
+            origin_code (str): 出發地代碼 (例如 'TPE')。
+            destination_code (str): 目的地代碼 (例如 'NRT')。
+            date_pairs (List[Tuple[str, str]]): (出發日期, 返回日期) 列表，格式為 'YYYY/MM/DD'。
+
+        Returns:
+            Iterator[Tuple[str, str, pd.DataFrame]]: 依完成順序產生 (出發日期, 返回日期, 資料)。
+
+        Examples:
+            >>> runner = ParallelScrapeRunner(WebDriverPool(), max_workers=2)
+            >>> results = list(runner.run("TPE", "NRT", [("2025/10/15", "2025/10/20")]))
+
+        Raises:
+            ValueError: 當 origin_code 或 destination_code 為空時
+            RuntimeError: 當任一爬蟲任務失敗時（尚未開始的任務會被取消，預先載入模式下其他 worker 完成目前的日期後停止）
+        """
+        if not origin_code:
+            raise ValueError("origin_code 不可為空")
+        if not destination_code:
+            raise ValueError("destination_code 不可為空")
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scraper")
+        if self.pipeline:
+            # 每個 worker 以同一個 driver 依序處理一部分日期，並在背景預先載入下一組日期的頁面；
+            # worker 結束時（無論成功或任何例外）由 done callback 將其 Future 放入佇列，避免 results.get() 永久等待
+            results = queue.Queue()
+            stop_event = threading.Event()
+            try:
+                chunk_futures = []
+                for worker_index in range(self.max_workers):
+                    chunk = date_pairs[worker_index::self.max_workers]
+                    if chunk:
+                        future = executor.submit(
+                            self._run_pipelined_chunk, origin_code, destination_code, chunk, results, stop_event
+                        )
+                        future.add_done_callback(results.put)
+                        chunk_futures.append(future)
+                running = len(chunk_futures)
+                while running:
+                    item = results.get()
+                    if isinstance(item, Future):
+                        running -= 1
+                        item.result()
+                        continue
+                    yield item
+            finally:
+                stop_event.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+            return
+
+        try:
+            futures = [
+                executor.submit(self._run_single, origin_code, destination_code, start_date, return_date)
+                for start_date, return_date in date_pairs
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
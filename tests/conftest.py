@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+"""
+pytest 共用設定：將專案根目錄加入模組搜尋路徑，讓測試可直接匯入根目錄的模組。
+"""
+
+# 標準庫
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
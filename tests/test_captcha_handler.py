@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""
+CaptchaSolver 批次推論與逐字元推論的一致性與延遲比較測試。
+
+以只依賴 numpy 的替身模型取代 Keras 模型：輸出由固定權重的線性投影經 softmax 得到，
+每次 predict 呼叫另加固定的額外耗時，模擬 model.predict 每次建立資料集與批次迴圈的開銷。
+"""
+
+# 標準庫
+import os
+import time
+
+# 第三方庫
+import numpy as np
+import pytest
+
+# 本地模組
+from captcha_handler import CaptchaModelRegistry, CaptchaSolver, ImageProcessor, benchmark_inference
+
+
+class StubCaptchaModel:
+    """
+    驗證碼模型替身，介面與 Keras 模型及 TFLiteCaptchaModel 相同。
+    """
+
+    # 模擬 model.predict 每次呼叫的固定開銷秒數
+    PREDICT_OVERHEAD = 0.005
+
+    def __init__(self, input_shape=(30, 100, 3)):
+        rng = np.random.default_rng(0)
+        self.input_shape = (None, *input_shape)
+        self.weights = rng.standard_normal((int(np.prod(input_shape)), len(ImageProcessor.CHAR_TO_INT)))
+
+    def __call__(self, x: np.ndarray, training: bool = False) -> np.ndarray:
+        logits = np.asarray(x, dtype='float32').reshape((len(x), -1)) @ self.weights
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict(self, x: np.ndarray, verbose: int = 0) -> np.ndarray:
+        time.sleep(self.PREDICT_OVERHEAD)
+        return self(x, training=False)
+
+
+@pytest.fixture
+def solver(monkeypatch, tmp_path):
+    model_path = str(tmp_path / "stub_model.keras")
+    monkeypatch.setitem(CaptchaModelRegistry._models, os.path.abspath(model_path), StubCaptchaModel())
+    return CaptchaSolver(model_path)
+
+
+@pytest.fixture
+def captchas():
+    return np.random.default_rng(1).random((8, 4, 30, 100, 3), dtype='float32')
+
+
+def test_batched_matches_per_char(solver, captchas):
+    per_char = [solver.predict_captcha(images, batched=False) for images in captchas]
+    batched = [solver.predict_captcha(images) for images in captchas]
+
+    assert batched == per_char
+    assert solver.predict_batch(captchas) == per_char
+    assert len(set(per_char)) > 1
+
+
+def test_batched_inference_is_faster(solver, captchas):
+    timings = benchmark_inference(solver, captchas[0], iterations=5)
+    print(f"逐字元 predict 平均 {timings['per_char']:.1f} 毫秒，單次前向傳遞平均 {timings['batched']:.1f} 毫秒")
+
+    assert timings["label"] == solver.predict_captcha(captchas[0], batched=False)
+    # 逐字元方式每張驗證碼至少有 4 次 predict 開銷，批次方式沒有
+    assert timings["per_char"] >= len(captchas[0]) * StubCaptchaModel.PREDICT_OVERHEAD * 1000
+    assert timings["batched"] < timings["per_char"]
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+html_card_parser 與 Selenium DOM 擷取路徑的比對測試。
+
+fixtures/html 下每個子目錄與 HTML_FIXTURE_DIR 錄製的格式相同（flight.html、baggage.html、modal.html、expected.json），
+另以 dom.json 保存同一組合在瀏覽器中讀到的原始文字：readFlightTables 的回傳值、行李表格各列的 WebElement.text
+與 DBGModal 的 WebElement.text。
+"""
+
+# 標準庫
+import json
+import os
+
+# 第三方庫
+import pytest
+
+# 本地模組
+from data_cleaner import BaggageDataExtractor, FlightDataExtractor, PriceDataExtractor
+from html_card_parser import HtmlCardParser, parse_combination_html, verify_fixtures
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "html")
+FIXTURE_NAMES = sorted(os.listdir(FIXTURES_DIR))
+
+
+def load_fixture(name: str) -> dict:
+    """
+    讀取單一組合 fixture 的 HTML、預期資料列與 DOM 原始文字。
+
+    Args:
+        name (str): fixture 子目錄名稱。
+
+    Returns:
+        dict: 包含 flight、baggage、modal、expected、dom 的字典。
+    """
+    fixture_path = os.path.join(FIXTURES_DIR, name)
+    fixture = {}
+    for part in ["flight", "baggage", "modal"]:
+        with open(os.path.join(fixture_path, f"{part}.html"), "r", encoding="utf-8") as f:
+            fixture[part] = f.read()
+    for part in ["expected", "dom"]:
+        with open(os.path.join(fixture_path, f"{part}.json"), "r", encoding="utf-8") as f:
+            fixture[part] = json.load(f)
+    return fixture
+
+
+def build_dom_row(fixture: dict) -> dict:
+    """
+    以 Selenium 路徑使用的解析函式，將 dom.json 的原始文字組成資料列。
+
+    Args:
+        fixture (dict): load_fixture 的回傳值。
+
+    Returns:
+        dict: 與 FlightDataCollector 相同格式的資料列。
+    """
+    expected = fixture["expected"]
+    dom = fixture["dom"]
+    flight_record = FlightDataExtractor()._build_record_from_tables(
+        dom["flight_tables"],
+        int(expected["start_date"].split("/")[0]),
+        int(expected["return_date"].split("/")[0])
+    )
+    baggage_info = BaggageDataExtractor()._build_baggage_info(dom["baggage_rows"], flight_record)
+    price_record = PriceDataExtractor().parse_modal_text(dom["modal_text"])
+    return {**flight_record, **price_record, **baggage_info, "建立時間": expected["row"]["建立時間"]}
+
+
+@pytest.mark.parametrize("name", FIXTURE_NAMES)
+def test_flight_record_matches_flight_tables(name):
+    fixture = load_fixture(name)
+    expected = fixture["expected"]
+
+    parsed = HtmlCardParser().parse_flight_data(fixture["flight"], expected["start_date"], expected["return_date"])[0]
+    dom_record = FlightDataExtractor()._build_record_from_tables(
+        fixture["dom"]["flight_tables"],
+        int(expected["start_date"].split("/")[0]),
+        int(expected["return_date"].split("/")[0])
+    )
+
+    assert parsed == dom_record
+
+
+@pytest.mark.parametrize("name", FIXTURE_NAMES)
+def test_combination_row_matches_dom_row(name):
+    fixture = load_fixture(name)
+    expected = fixture["expected"]
+
+    parsed_row = parse_combination_html(
+        expected["start_date"],
+        expected["return_date"],
+        expected["row"]["建立時間"],
+        fixture["modal"],
+        flight_html=fixture["flight"],
+        baggage_html=fixture["baggage"]
+    )
+    dom_row = build_dom_row(fixture)
+
+    # 逐欄比對，行李欄位與票價欄位都必須一致
+    assert set(parsed_row) == set(dom_row) == set(expected["row"])
+    assert any(column.startswith(("去程行李", "回程行李")) for column in dom_row)
+    for column in dom_row:
+        assert parsed_row[column] == dom_row[column] == expected["row"][column], column
+
+
+def test_verify_fixtures_reports_no_mismatch():
+    assert verify_fixtures(FIXTURES_DIR) == 0
@@ -1,19 +1,27 @@
 # 標準庫
+import json
+import os
 import platform
 import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # 第三方庫
 from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 # 本地模組
 from captcha_handler import CaptchaSolver, ImageProcessor
+from latency_recorder import LatencyRecorder
 from screenshot_handler import ScreenshotHandler
+from session_store import SessionStore
 
 
 class WebDriverFactory:
@@ -29,10 +37,24 @@ class WebDriverFactory:
     """
     
     @staticmethod
-    def create_driver() -> webdriver.Chrome:
+    def create_driver(
+        remote_debugging_port: int = 9222,
+        user_data_dir: Optional[str] = None,
+        page_load_strategy: str = 'normal',
+        enable_performance_log: bool = False
+    ) -> webdriver.Chrome:
         """
         建立並配置 Chrome WebDriver。
         
+        同一容器內同時啟動多個 Chrome 時，每個實例需使用不同的 remote_debugging_port 與 user_data_dir。
+        
+        Args:
+            remote_debugging_port (int): Chrome 遠端除錯連接埠，預設為 9222。
+            user_data_dir (Optional[str]): Chrome 使用者資料目錄，預設為 None（由 Chrome 自行建立暫存目錄）。
+            page_load_strategy (str): 頁面載入策略，可選 'normal'、'eager'、'none'，預設為 'normal'。
+                使用 'eager' 或 'none' 時 driver.get 不會等待所有子資源，需搭配 WebNavigator.wait_for_results。
+            enable_performance_log (bool): 是否啟用 Chrome performance log，供 XhrResponseCapture 擷取 XHR 回應，預設為 False。
+        
         Returns:
             webdriver.Chrome: 配置好的 Chrome WebDriver 實例。
         
@@ -40,17 +62,34 @@ class WebDriverFactory:
             >>> factory = WebDriverFactory()
             >>> driver = factory.create_driver()
             >>> driver.quit()
+            >>> driver = factory.create_driver(remote_debugging_port=9223, user_data_dir="/tmp/chrome_worker_1")
         
         Raises:
+            ValueError: 當 remote_debugging_port 不在 1-65535 範圍內時
+            ValueError: 當 page_load_strategy 不是 'normal'、'eager' 或 'none' 時
             RuntimeError: 當 WebDriver 建立失敗時
         """
+        if not 1 <= remote_debugging_port <= 65535:
+            raise ValueError(f"remote_debugging_port 必須在 1-65535 範圍內，實際為 {remote_debugging_port}")
+        if page_load_strategy not in ['normal', 'eager', 'none']:
+            raise ValueError("page_load_strategy 必須是 'normal'、'eager' 或 'none'")
+        
         chrome_options = Options()
+        chrome_options.page_load_strategy = page_load_strategy
+        if enable_performance_log:
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--remote-debugging-port=9222")
+        chrome_options.add_argument(f"--remote-debugging-port={remote_debugging_port}")
         chrome_options.add_argument("--window-size=1920x1080")
+        # 避免背景分頁被降速，預先載入的票價頁面才能在背景完成渲染
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        if user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
 
         try:
             if platform.machine() == 'aarch64':
@@ -67,6 +106,168 @@ class WebDriverFactory:
             raise RuntimeError(f"WebDriver 建立失敗: {e}")
 
 
+class DomQuiescenceWaiter:
+    """
+    DOM 靜止等待器，以 MutationObserver 偵測子樹變動，取代固定秒數的 time.sleep。
+
+    子樹在指定的靜止時間內沒有任何變動，且 Angular 沒有進行中的 $http 請求時立即返回；
+    超過上限仍未靜止時也會返回，不會拋出例外。每次等待都會累計原本固定 sleep 的秒數
+    與實際等待秒數，供任務結束時回報節省的時間。
+
+    屬性:
+        replaced_seconds (float): 被取代的固定 sleep 總秒數。
+        waited_seconds (float): 實際等待總秒數。
+
+    Examples:
+        >>> waiter = DomQuiescenceWaiter(driver)
+        >>> waiter.wait(root=card, quiet_ms=50, timeout=0.5, replaced_sleep=0.1)
+        True
+        >>> waiter.saved_seconds
+        0.05
+
+    Raises:
+        ValueError: 當 driver 為 None 時
+    """
+
+    # 取得 Angular 進行中 $http 請求數的 JavaScript 函式，無法取得時視為 0
+    PENDING_HTTP_JS = """
+        function pendingHttp() {
+            try {
+                if (window.angular) {
+                    const injector = angular.element(document.querySelector('[ng-app]') || document.body).injector();
+                    if (injector) {
+                        return injector.get('$http').pendingRequests.length;
+                    }
+                }
+            } catch (e) {}
+            return 0;
+        }
+    """
+
+    WAIT_SCRIPT = PENDING_HTTP_JS + """
+        const root = arguments[0] || document.body;
+        const quietMs = arguments[1];
+        const timeoutMs = arguments[2];
+        const done = arguments[arguments.length - 1];
+        const start = performance.now();
+        let lastMutation = start;
+        const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+        observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+        const timer = setInterval(() => {
+            const now = performance.now();
+            const quiet = now - lastMutation >= quietMs && pendingHttp() === 0;
+            if (quiet || now - start >= timeoutMs) {
+                clearInterval(timer);
+                observer.disconnect();
+                done({elapsed_ms: now - start, quiet: quiet});
+            }
+        }, Math.min(25, quietMs));
+    """
+
+    def __init__(self, driver: webdriver.Chrome):
+        """
+        初始化 DOM 靜止等待器。
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 實例。
+
+        Examples:
+            >>> waiter = DomQuiescenceWaiter(driver)
+
+        Raises:
+            ValueError: 當 driver 為 None 時
+        """
+        if driver is None:
+            raise ValueError("driver 不可為 None")
+        self.driver = driver
+        self.replaced_seconds = 0.0
+        self.waited_seconds = 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """
+        取得以靜止等待取代固定 sleep 後節省的總秒數。
+
+        Returns:
+            float: replaced_seconds 減去 waited_seconds。
+
+        Examples:
+            >>> waiter.saved_seconds
+            12.3
+
+        Raises:
+            無特定錯誤
+        """
+        return self.replaced_seconds - self.waited_seconds
+
+    def record(self, replaced_sleep: float, waited_seconds: float) -> None:
+        """
+        累計一次在頁面內完成、未經由 wait 的等待，納入節省時間的統計。
+
+        Args:
+            replaced_sleep (float): 此次等待取代的固定 sleep 秒數。
+            waited_seconds (float): 此次實際等待的秒數。
+
+        Examples:
+            >>> waiter = DomQuiescenceWaiter(driver)
+            >>> waiter.record(replaced_sleep=4.5, waited_seconds=0.8)
+            >>> waiter.saved_seconds
+            3.7
+
+        Raises:
+            ValueError: 當任一秒數小於 0 時
+        """
+        if replaced_sleep < 0 or waited_seconds < 0:
+            raise ValueError("replaced_sleep 與 waited_seconds 不可小於 0")
+        self.replaced_seconds += replaced_sleep
+        self.waited_seconds += waited_seconds
+
+    def wait(
+        self,
+        root: Optional[WebElement] = None,
+        quiet_ms: int = 150,
+        timeout: float = 2.0,
+        replaced_sleep: float = 0.0
+    ) -> bool:
+        """
+        等待 root 子樹靜止 quiet_ms 毫秒，最多等待 timeout 秒。
+
+        Args:
+            root (Optional[WebElement]): 要觀察的子樹根元素，None 時觀察整個 document.body，預設為 None。
+            quiet_ms (int): 需持續沒有 DOM 變動的毫秒數，預設為 150。
+            timeout (float): 等待上限秒數，需小於 driver 的 script timeout，預設為 2.0。
+            replaced_sleep (float): 此次等待取代的固定 sleep 秒數，僅用於統計，預設為 0。
+
+        Returns:
+            bool: 在上限內靜止時為 True，逾時為 False。
+
+        Examples:
+            >>> waiter = DomQuiescenceWaiter(driver)
+            >>> waiter.wait(quiet_ms=300, timeout=2.0, replaced_sleep=2.0)
+            True
+
+        Raises:
+            ValueError: 當 quiet_ms 或 timeout 小於等於 0 時
+        """
+        if quiet_ms <= 0:
+            raise ValueError("quiet_ms 必須大於 0")
+        if timeout <= 0:
+            raise ValueError("timeout 必須大於 0")
+
+        start = time.time()
+        try:
+            result = self.driver.execute_async_script(self.WAIT_SCRIPT, root, quiet_ms, timeout * 1000)
+            quiet = bool(result and result.get("quiet"))
+        except WebDriverException as e:
+            # 無法注入 MutationObserver（例如頁面切換中）時退回原本的固定 sleep
+            print(f"DOM 靜止等待失敗，改用固定等待: {e}")
+            time.sleep(replaced_sleep or timeout)
+            quiet = False
+
+        self.record(replaced_sleep, time.time() - start)
+        return quiet
+
+
 class WebNavigator:
     """
     用於瀏覽網站和執行相關操作的導覽器類別。
@@ -75,6 +276,8 @@ class WebNavigator:
 
     屬性:
         driver (webdriver.Chrome): Selenium WebDriver，用於瀏覽器自動化。
+        lean_mode (bool): 是否在票價頁面封鎖圖片、字型與第三方追蹤資源。
+        LEAN_BLOCKED_URL_PATTERNS (list): 精簡模式下透過 CDP 封鎖的 URL 樣式。
     
     Examples:
         >>> driver = WebDriverFactory.create_driver()
@@ -85,16 +288,42 @@ class WebNavigator:
         ValueError: 當 driver 為 None 時
     """
 
-    def __init__(self, driver: webdriver.Chrome):
+    # 只封鎖 FlightDataCollector 不會讀取的圖片、字型與第三方追蹤資源；
+    # .js、.css、.aspx 與 XHR 皆不封鎖，Angular 與票價資料請求不受影響
+    LEAN_BLOCKED_URL_PATTERNS = [
+        "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.bmp*",
+        "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+        "*google-analytics.com*", "*googletagmanager.com*", "*googleadservices.com*",
+        "*doubleclick.net*", "*facebook.net*", "*connect.facebook.com*",
+        "*hotjar.com*", "*criteo.com*", "*clarity.ms*",
+    ]
+
+    PAGE_READY = 'ready'
+    PAGE_NO_RESULTS = 'no_results'
+
+    # 票價頁面查無航班時顯示的訊息文字；只有看到可見的訊息才判定查無結果，
+    # 若網站調整文字只需修改此處，對不上時會等滿 timeout 並拋出 TimeoutException
+    NO_RESULTS_TEXTS = ("查無符合", "查無航班", "查無資料")
+
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        lean_mode: bool = False,
+        quiescence: Optional[DomQuiescenceWaiter] = None
+    ):
         """
         初始化 WebNavigator 類別。
 
         Args:
             driver (webdriver.Chrome): Selenium WebDriver 的實例，用於與瀏覽器交互。
+            lean_mode (bool): 是否啟用精簡導航模式，預設為 False。啟用時票價頁面會封鎖
+                LEAN_BLOCKED_URL_PATTERNS；登入頁面一律解除封鎖以保留 imgValidate 驗證碼圖片。
+            quiescence (Optional[DomQuiescenceWaiter]): 共用的 DOM 靜止等待器，None 時自行建立，預設為 None。
         
         Examples:
             >>> driver = WebDriverFactory.create_driver()
             >>> navigator = WebNavigator(driver)
+            >>> navigator = WebNavigator(driver, lean_mode=True)
         
         Raises:
             ValueError: 當 driver 為 None 時
@@ -102,43 +331,238 @@ class WebNavigator:
         if driver is None:
             raise ValueError("driver 不可為 None")
         self.driver = driver
+        self.lean_mode = lean_mode
+        self.quiescence = quiescence or DomQuiescenceWaiter(driver)
+
+    def set_resource_blocking(self, enabled: bool) -> None:
+        """
+        透過 CDP Network.setBlockedURLs 開啟或解除精簡模式的資源封鎖。
 
-    def scroll_to_bottom(self) -> None:
+        Args:
+            enabled (bool): True 時封鎖 LEAN_BLOCKED_URL_PATTERNS，False 時清除所有封鎖規則。
+        
+        Examples:
+            >>> navigator = WebNavigator(driver, lean_mode=True)
+            >>> navigator.set_resource_blocking(True)
+        
+        Raises:
+            selenium.common.exceptions.WebDriverException: 當 CDP 指令執行失敗時
+        """
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {"urls": self.LEAN_BLOCKED_URL_PATTERNS if enabled else []}
+        )
+
+    def wait_for_results(self, timeout: float = 45) -> str:
+        """
+        等待票價頁面的 Angular 應用完成渲染，不等待較晚載入的子資源。
+
+        每次輪詢以一次 script 呼叫檢查：airPrice_box 卡片與 tab01 頁籤數量、Angular $http 尚未完成的請求數，
+        以及頁面上是否有可見的查無航班訊息（NO_RESULTS_TEXTS）。卡片已渲染且沒有進行中的請求時視為就緒；
+        沒有卡片、沒有進行中的請求且顯示查無航班訊息時視為查無結果。僅是暫時沒有卡片不會判定為查無結果。
+
+        Args:
+            timeout (float): 最長等待秒數，預設為 45 秒。
+
+        Returns:
+            str: WebNavigator.PAGE_READY 或 WebNavigator.PAGE_NO_RESULTS。
+
+        Examples:
+            >>> navigator = WebNavigator(driver)
+            >>> navigator.wait_for_results(timeout=45)
+            'ready'
+
+        Raises:
+            ValueError: 當 timeout 小於等於 0 時
+            selenium.common.exceptions.TimeoutException: 當超過 timeout 仍未就緒且沒有查無航班訊息時
+        """
+        if timeout <= 0:
+            raise ValueError("timeout 必須大於 0")
+
+        probe_script = """
+            var noResultsTexts = arguments[0];
+            var state = {
+                cards: document.getElementsByClassName('airPrice_box').length,
+                tabs: document.getElementsByClassName('tab01').length,
+                no_results: false,
+                pending: -1
+            };
+            if (state.cards === 0) {
+                var walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+                while (walker.nextNode()) {
+                    var node = walker.currentNode;
+                    var matched = noResultsTexts.some(function (text) { return node.nodeValue.indexOf(text) >= 0; });
+                    // 只採計畫面上可見的訊息，忽略 ng-hide 等隱藏的範本
+                    if (matched && node.parentElement && node.parentElement.getClientRects().length > 0) {
+                        state.no_results = true;
+                        break;
+                    }
+                }
+            }
+            if (window.angular) {
+                try {
+                    var root = document.querySelector('[ng-app]') || document.body;
+                    var injector = angular.element(root).injector();
+                    if (injector) {
+                        state.pending = injector.get('$http').pendingRequests.length;
+                    }
+                } catch (e) {}
+            }
+            return state;
+        """
+
+        def probe(driver):
+            state = driver.execute_script(probe_script, list(self.NO_RESULTS_TEXTS))
+            # pending 為 -1 代表無法取得 Angular 狀態，僅以卡片、頁籤與查無航班訊息判斷
+            settled = state["pending"] <= 0
+            if state["cards"] > 0 and state["tabs"] > 0 and settled:
+                return self.PAGE_READY
+            if state["cards"] == 0 and state["no_results"] and settled:
+                return self.PAGE_NO_RESULTS
+            return False
+
+        return WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(probe)
+
+    def get_page_transfer_stats(self) -> dict:
+        """
+        以 Resource Timing API 統計目前頁面的傳輸量，用於比較精簡模式的效益。
+
+        跨網域資源若未提供 Timing-Allow-Origin 標頭，其 transferSize 會計為 0。
+
+        Returns:
+            dict: 包含 transfer_bytes（傳輸位元組數）與 resource_count（資源數量）。
+        
+        Examples:
+            >>> navigator = WebNavigator(driver)
+            >>> stats = navigator.get_page_transfer_stats()
+            >>> stats["transfer_bytes"] > 0
+            True
+        
+        Raises:
+            selenium.common.exceptions.WebDriverException: 當 script 執行失敗時
+        """
+        return self.driver.execute_script("""
+            var entries = performance.getEntriesByType('navigation')
+                .concat(performance.getEntriesByType('resource'));
+            var total = 0;
+            for (var i = 0; i < entries.length; i++) {
+                total += entries[i].transferSize || 0;
+            }
+            return {transfer_bytes: total, resource_count: entries.length};
+        """)
+
+    # 在頁面內以 MutationObserver 監看卡片數，每次卡片數改變就再跳至底部，
+    # 卡片數在自適應的靜止時間內不再改變且沒有進行中的 $http 請求即結束
+    SCROLL_BY_CARD_COUNT_SCRIPT = DomQuiescenceWaiter.PENDING_HTTP_JS + """
+        const timeoutMs = arguments[0];
+        const minQuietMs = arguments[1];
+        const done = arguments[arguments.length - 1];
+        const cards = document.getElementsByClassName('airPrice_box');
+        const start = performance.now();
+        let lastCount = cards.length;
+        let lastChange = start;
+        let quietMs = minQuietMs;
+        let iterations = 0;
+        const jump = () => {
+            iterations += 1;
+            window.scrollTo(0, document.body.scrollHeight);
+        };
+        const observer = new MutationObserver(() => {
+            if (cards.length === lastCount) {
+                return;
+            }
+            const now = performance.now();
+            // 靜止時間依上一批卡片載入所需時間調整，避免在下一批載入前提早結束
+            quietMs = Math.min(Math.max(minQuietMs, (now - lastChange) * 1.5), 3000);
+            lastCount = cards.length;
+            lastChange = now;
+            jump();
+        });
+        observer.observe(document.body, {childList: true, subtree: true});
+        jump();
+        const timer = setInterval(() => {
+            const now = performance.now();
+            const converged = now - lastChange >= quietMs && pendingHttp() === 0;
+            if (converged || now - start >= timeoutMs) {
+                clearInterval(timer);
+                observer.disconnect();
+                done({iterations: iterations, cards: lastCount, elapsed_ms: now - start, converged: converged});
+            }
+        }, 50);
+    """
+
+    def scroll_to_bottom(self, mode: str = 'cards', timeout: float = 20, min_quiet_ms: int = 400) -> None:
         """
         滾動至網頁底部，以加載所有內容。
 
-        此方法持續執行滾動操作，直到頁面無法再向下滾動為止。
+        'cards' 模式在頁面內監看 airPrice_box 數量，每次數量改變就直接跳至底部，
+        數量在自適應的靜止時間內不再改變即結束，頁面已完整載入時不需額外等待。
+        'height' 模式為原本以 scrollHeight 判斷的迴圈，保留供比較。兩種模式皆會輸出迭代次數與耗時。
+        
+        Args:
+            mode (str): 'cards' 或 'height'，預設為 'cards'。
+            timeout (float): 'cards' 模式的等待上限秒數，需小於 driver 的 script timeout，預設為 20。
+            min_quiet_ms (int): 'cards' 模式卡片數不再改變的最短靜止毫秒數，預設為 400。
         
         Examples:
             >>> navigator = WebNavigator(driver)
             >>> navigator.scroll_to_bottom()
+            >>> navigator.scroll_to_bottom(mode='height')
         
         Raises:
-            無特定錯誤
+            ValueError: 當 mode 不是 'cards' 或 'height' 時
         """
+        if mode not in ['cards', 'height']:
+            raise ValueError("mode 必須是 'cards' 或 'height'")
+
+        start = time.time()
+        if mode == 'cards':
+            try:
+                result = self.driver.execute_async_script(
+                    self.SCROLL_BY_CARD_COUNT_SCRIPT, timeout * 1000, min_quiet_ms
+                )
+                print(f"滾動載入（卡片數收斂）: 迭代 {result['iterations']} 次，卡片 {result['cards']} 張，"
+                      f"耗時 {time.time() - start:.2f} 秒{'' if result['converged'] else '（已達等待上限）'}")
+                return
+            except WebDriverException as e:
+                print(f"卡片數收斂滾動失敗，改用 scrollHeight 迴圈: {e}")
+
+        iterations = 0
         last_height = self.driver.execute_script("return document.body.scrollHeight")
         while True:
+            iterations += 1
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            self.quiescence.wait(quiet_ms=300, timeout=1.0, replaced_sleep=1)
             new_height = self.driver.execute_script("return document.body.scrollHeight")
             if new_height == last_height:
                 break
             last_height = new_height
+        print(f"滾動載入（scrollHeight）: 迭代 {iterations} 次，耗時 {time.time() - start:.2f} 秒")
 
-    def login_to_website(self, username: str, password: str, captcha_model_path: str) -> None:
+    def login_to_website(
+        self,
+        username: str,
+        password: str,
+        captcha_model_path: str,
+        captcha_debug_dir: Optional[str] = None
+    ) -> None:
         """
         登入指定的網站並處理驗證碼。
 
         此方法包括了加載驗證碼圖片、使用預訓練模型進行驗證碼識別，並將其填入表單中以完成登入。
+        驗證碼圖片全程在記憶體中處理；提供 captcha_debug_dir 時才另外將圖片以辨識結果命名保存，供除錯使用。
 
         Args:
             username (str): 登入帳號。
             password (str): 登入密碼。
             captcha_model_path (str): 預訓練的驗證碼識別模型的路徑。
+            captcha_debug_dir (Optional[str]): 保存驗證碼圖片的除錯目錄，預設為 None 不保存。
         
         Examples:
             >>> navigator = WebNavigator(driver)
             >>> navigator.login_to_website("user", "pass", "model.keras")
+            >>> navigator.login_to_website("user", "pass", "model.keras", captcha_debug_dir="captcha_debug")
         
         Raises:
             ValueError: 當 username、password 或 captcha_model_path 為空時
@@ -151,6 +575,9 @@ class WebNavigator:
         if not captcha_model_path:
             raise ValueError("captcha_model_path 不可為空")
         
+        if self.lean_mode:
+            # 登入頁面需要載入 imgValidate 驗證碼圖片
+            self.set_resource_blocking(False)
         self.driver.get('https://www.colatour.com.tw/C000_Portal/C000_MemberLogin.aspx')
 
         try:
@@ -166,13 +593,21 @@ class WebNavigator:
         captcha_solver = CaptchaSolver(captcha_model_path)
 
         image_base64 = image_processor.get_base64_image(self.driver, image_element)
-        image_processor.save_base64_image(image_base64, "image.png")
 
         target_height = 30
         target_width = 100
-        images = captcha_solver.load_data("image.png", target_height, target_width)
+        images = captcha_solver.load_base64(image_base64, target_height, target_width)
         predicted_label = captcha_solver.predict_captcha(images)
 
+        if captcha_debug_dir:
+            os.makedirs(captcha_debug_dir, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            debug_path = os.path.join(captcha_debug_dir, f"{timestamp}_{predicted_label}.png")
+            try:
+                image_processor.save_base64_image(image_base64, debug_path)
+            except IOError as e:
+                print(f"驗證碼除錯圖片保存失敗: {e}")
+
         input_field = self.driver.find_element(By.ID, 'txtImageValidate')
         input_field.send_keys(predicted_label)
 
@@ -185,21 +620,34 @@ class WebNavigator:
         login_button = self.driver.find_element(By.ID, 'cmdLogin')
         login_button.click()
 
-    def login_with_retry(self, username: str, password: str, captcha_model_path: str, max_retries: int = 10) -> None:
+    def login_with_retry(
+        self,
+        username: str,
+        password: str,
+        captcha_model_path: str,
+        max_retries: int = 10,
+        session_store: Optional[SessionStore] = None,
+        captcha_debug_dir: Optional[str] = None
+    ) -> None:
         """
         嘗試登入網站並處理可能出現的驗證碼與彈出視窗，直到登入成功或達到最大重試次數。
 
         此方法在登入失敗且出現彈出視窗時會自動重試登入，直到成功或達到設定的最大重試次數。
+        提供 session_store 時會先嘗試還原快取的登入 session，失效時才走驗證碼登入流程，
+        登入成功後再將新的 session 寫回快取。
 
         Args:
             username (str): 登入帳號。
             password (str): 登入密碼。
             captcha_model_path (str): 預訓練的驗證碼識別模型的路徑。
             max_retries (int): 最大重試次數，預設為 10 次。
+            session_store (Optional[SessionStore]): 登入 session 快取，預設為 None。
+            captcha_debug_dir (Optional[str]): 保存驗證碼圖片的除錯目錄，預設為 None 不保存。
         
         Examples:
             >>> navigator = WebNavigator(driver)
             >>> navigator.login_with_retry("user", "pass", "model.keras", max_retries=5)
+            >>> navigator.login_with_retry("user", "pass", "model.keras", session_store=SessionStore())
         
         Raises:
             ValueError: 當 username、password 或 captcha_model_path 為空時
@@ -208,8 +656,12 @@ class WebNavigator:
         if max_retries <= 0:
             raise ValueError("max_retries 必須大於 0")
         
+        if session_store is not None and session_store.restore(self.driver):
+            print("已還原快取的登入 session，略過驗證碼登入")
+            return
+        
         retries = 0
-        self.login_to_website(username, password, captcha_model_path)
+        self.login_to_website(username, password, captcha_model_path, captcha_debug_dir)
         alert_present = EC.alert_is_present()
         while retries < max_retries and alert_present(self.driver):
             WebDriverWait(self.driver, 5).until(EC.alert_is_present())
@@ -219,13 +671,151 @@ class WebNavigator:
             retries += 1
             print(f"出現彈出視窗，重試登入...（第 {retries} 次重試）")
 
-            self.login_to_website(username, password, captcha_model_path)
+            self.login_to_website(username, password, captcha_model_path, captcha_debug_dir)
 
         if retries == max_retries:
             print("達到最大重試次數，登入失敗，關閉視窗")
             self.driver.quit()
         else:
             print("登入成功")
+            if session_store is not None:
+                session_store.save(self.driver)
+
+    @staticmethod
+    def build_fare_query(
+        origin_code: str,
+        destination_code: str,
+        start_date: str,
+        return_date: str
+    ) -> str:
+        """
+        組合機票查詢頁面與票價端點共用的查詢字串。
+
+        Args:
+            origin_code (str): 出發地代碼 (例如 'TPE')。
+            destination_code (str): 目的地代碼 (例如 'TYO')。
+            start_date (str): 出發日期，格式為 'YYYY/MM/DD'。
+            return_date (str): 返回日期，格式為 'YYYY/MM/DD'。
+
+        Returns:
+            str: 不含 '?' 的查詢字串。
+
+        Examples:
+            >>> WebNavigator.build_fare_query("TPE", "TYO", "2025/10/15", "2025/10/20")[:40]
+            'DirectFlightMark=False&JourneyType=Round'
+
+        Raises:
+            無特定錯誤
+        """
+        return (f'DirectFlightMark=False&JourneyType=Round&OriginCode={origin_code}&'
+                f'DestinationCode={destination_code}&ReturnCode={destination_code}&'
+                f'StartDate={start_date}&ReturnDate={return_date}&AdtCnt=1&ChdCnt=0&'
+                f'InfantCnt=0&ServiceClass=ALL&SegmentStartDate={start_date.replace("/", "_")},'
+                f'{return_date.replace("/", "_")}&SegmentLocCode={origin_code}.{destination_code},'
+                f'{destination_code}.{origin_code}&SegmentLocType=City.City,City.City')
+
+    @classmethod
+    def build_flight_page_url(cls, origin_code: str, destination_code: str, start_date: str, return_date: str) -> str:
+        """
+        組成機票查詢頁面的網址。
+
+        Args:
+            origin_code (str): 出發地代碼 (例如 'TPE')。
+            destination_code (str): 目的地代碼 (例如 'TYO')。
+            start_date (str): 出發日期，格式為 'YYYY/MM/DD'。
+            return_date (str): 返回日期，格式為 'YYYY/MM/DD'。
+
+        Returns:
+            str: C10C_20_ChooseLowFare.aspx 查詢網址。
+
+        Examples:
+            >>> WebNavigator.build_flight_page_url("TPE", "NRT", "2025/10/15", "2025/10/20")
+            'https://www.colatour.com.tw/C10C_MPAirTicket/C10C_20_ChooseLowFare.aspx?...'
+
+        Raises:
+            無特定錯誤
+        """
+        return (f'https://www.colatour.com.tw/C10C_MPAirTicket/C10C_20_ChooseLowFare.aspx?'
+                f'{cls.build_fare_query(origin_code, destination_code, start_date, return_date)}')
+
+    def preload_flight_page(
+        self,
+        origin_code: str,
+        destination_code: str,
+        start_date: str,
+        return_date: str
+    ) -> str:
+        """
+        在背景分頁開啟下一組日期的機票查詢頁面，返回時仍停留在目前操作的分頁。
+
+        新分頁與目前分頁共用登入 session。CDP 設定只作用於當下的分頁，因此先開啟空白分頁並切換過去，
+        套用與 navigate_to_flight_page 相同的精簡模式封鎖與 Resource Timing 緩衝區設定後，
+        以不等待載入的 location 指派開始載入，再切換回原分頁。
+
+        Args:
+            origin_code (str): 出發地代碼 (例如 'TPE')。
+            destination_code (str): 目的地代碼 (例如 'TYO')。
+            start_date (str): 出發日期，格式為 'YYYY/MM/DD'。
+            return_date (str): 返回日期，格式為 'YYYY/MM/DD'。
+
+        Returns:
+            str: 新分頁的 window handle。
+
+        Examples:
+            >>> navigator = WebNavigator(driver)
+            >>> handle = navigator.preload_flight_page("TPE", "NRT", "2025/10/22", "2025/10/27")
+
+        Raises:
+            ValueError: 當任何參數為空時
+            RuntimeError: 當無法開啟新分頁時
+        """
+        if not origin_code or not destination_code or not start_date or not return_date:
+            raise ValueError("origin_code、destination_code、start_date 與 return_date 不可為空")
+
+        current_handle = self.driver.current_window_handle
+        existing_handles = set(self.driver.window_handles)
+        url = self.build_flight_page_url(origin_code, destination_code, start_date, return_date)
+        self.driver.execute_script("window.open('about:blank', '_blank');")
+        new_handles = [handle for handle in self.driver.window_handles if handle not in existing_handles]
+        if not new_handles:
+            raise RuntimeError("無法開啟預先載入的分頁")
+
+        self.driver.switch_to.window(new_handles[0])
+        try:
+            if self.lean_mode:
+                self.set_resource_blocking(True)
+            # 此分頁只載入這一個頁面，緩衝區設定不需移除
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": "performance.setResourceTimingBufferSize(5000);"}
+            )
+            # 以 location 指派開始導覽不會等待頁面載入，driver.get 則會阻塞直到載入完成
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+        finally:
+            self.driver.switch_to.window(current_handle)
+        return new_handles[0]
+
+    def switch_to_preloaded_page(self, handle: str) -> None:
+        """
+        關閉目前分頁並切換至預先載入的分頁。
+
+        Args:
+            handle (str): preload_flight_page 回傳的 window handle。
+
+        Examples:
+            >>> navigator.switch_to_preloaded_page(handle)
+
+        Raises:
+            ValueError: 當 handle 為空時
+            selenium.common.exceptions.NoSuchWindowException: 當分頁已被關閉時
+        """
+        if not handle:
+            raise ValueError("handle 不可為空")
+
+        if self.driver.current_window_handle != handle:
+            self.driver.close()
+        self.driver.switch_to.window(handle)
+        self.driver.set_window_size(945, 1012)
 
     def navigate_to_flight_page(
         self,
@@ -259,14 +849,19 @@ class WebNavigator:
         if not return_date:
             raise ValueError("return_date 不可為空")
         
-        url = (f'https://www.colatour.com.tw/C10C_MPAirTicket/C10C_20_ChooseLowFare.aspx?'
-               f'DirectFlightMark=False&JourneyType=Round&OriginCode={origin_code}&'
-               f'DestinationCode={destination_code}&ReturnCode={destination_code}&'
-               f'StartDate={start_date}&ReturnDate={return_date}&AdtCnt=1&ChdCnt=0&'
-               f'InfantCnt=0&ServiceClass=ALL&SegmentStartDate={start_date.replace("/", "_")},'
-               f'{return_date.replace("/", "_")}&SegmentLocCode={origin_code}.{destination_code},'
-               f'{destination_code}.{origin_code}&SegmentLocType=City.City,City.City')
+        url = self.build_flight_page_url(origin_code, destination_code, start_date, return_date)
+        if self.lean_mode:
+            self.set_resource_blocking(True)
+        # 擴大 Resource Timing 緩衝區，避免資源超過預設 250 筆時傳輸量統計失準
+        script = self.driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": "performance.setResourceTimingBufferSize(5000);"}
+        )
         self.driver.get(url)
+        self.driver.execute_cdp_cmd(
+            "Page.removeScriptToEvaluateOnNewDocument",
+            {"identifier": script["identifier"]}
+        )
         self.driver.set_window_size(945, 1012)
 
 
@@ -282,12 +877,21 @@ class FlightOptionExpander:
         ValueError: 當 driver 為 None 時
     """
     
-    def __init__(self, driver: webdriver.Chrome):
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        quiescence: Optional[DomQuiescenceWaiter] = None,
+        latency_recorder: Optional[LatencyRecorder] = None,
+        route: str = ''
+    ):
         """
         初始化航班選項展開器。
         
         Args:
             driver (webdriver.Chrome): Selenium WebDriver 實例。
+            quiescence (Optional[DomQuiescenceWaiter]): 共用的 DOM 靜止等待器，None 時自行建立，預設為 None。
+            latency_recorder (Optional[LatencyRecorder]): 等待延遲記錄器，None 時只在記憶體中記錄，預設為 None。
+            route (str): 航線代碼，作為延遲紀錄的分類，預設為空字串。
         
         Examples:
             >>> expander = FlightOptionExpander(driver)
@@ -298,37 +902,333 @@ class FlightOptionExpander:
         if driver is None:
             raise ValueError("driver 不可為 None")
         self.driver = driver
+        self.quiescence = quiescence or DomQuiescenceWaiter(driver)
+        self.latency_recorder = latency_recorder or LatencyRecorder()
+        self.route = route
     
-    def expand_all_options(self) -> None:
+    EXPAND_BUTTON_XPATH = "//a[contains(@class, 'plusBtn') and contains(text(), '更多航班')]"
+
+    # 等待航班卡片出現的預設上限秒數
+    FLIGHT_CARDS_TIMEOUT = 10
+
+    # 一次點擊所有"更多航班"按鈕，再等待 MultiSegment 下的 radio 數量穩定且沒有進行中的 $http 請求；
+    # 點擊失敗的按鈕以元素本身回傳，補點時不需重新依序號定位
+    BATCH_EXPAND_SCRIPT = DomQuiescenceWaiter.PENDING_HTTP_JS + """
+        const buttonXpath = arguments[0];
+        const quietMs = arguments[1];
+        const timeoutMs = arguments[2];
+        const done = arguments[arguments.length - 1];
+        const radioSelector = 'div[ng-repeat="MultiSegment in cjSegment[$index]"] input[type="radio"]';
+        const countRadios = () => document.querySelectorAll(radioSelector).length;
+        const snapshot = document.evaluate(buttonXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const radiosBefore = countRadios();
+        const failed = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            try {
+                snapshot.snapshotItem(i).click();
+            } catch (e) {
+                failed.push([i, snapshot.snapshotItem(i)]);
+            }
+        }
+        const start = performance.now();
+        let lastCount = countRadios();
+        let lastChange = start;
+        const timer = setInterval(() => {
+            const now = performance.now();
+            const count = countRadios();
+            if (count !== lastCount) {
+                lastCount = count;
+                lastChange = now;
+            }
+            const stable = now - lastChange >= quietMs && pendingHttp() === 0;
+            if (stable || now - start >= timeoutMs) {
+                clearInterval(timer);
+                done({buttons: snapshot.snapshotLength, failed: failed, radios_before: radiosBefore,
+                      radios: lastCount, elapsed_ms: now - start, stable: stable});
+            }
+        }, 25);
+    """
+
+    def expand_all_options(self, batch: bool = True) -> None:
         """
         展開所有可用的航班選項，點擊所有"更多航班"按鈕。
+
+        batch 模式以單次 execute_async_script 點擊所有按鈕，並只等待一次至 radio 數量穩定；
+        點擊失敗的按鈕或腳本執行失敗時改以逐一點擊補齊。
+        
+        Args:
+            batch (bool): 是否使用批次展開，預設為 True。
         
         Examples:
             >>> expander = FlightOptionExpander(driver)
             >>> expander.expand_all_options()
+            >>> expander.expand_all_options(batch=False)
         
         Raises:
             無特定錯誤
         """
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, 'airPrice_box'))
+        self.latency_recorder.measure(
+            self.route,
+            "flight_cards",
+            self.FLIGHT_CARDS_TIMEOUT,
+            lambda timeout: WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_all_elements_located((By.CLASS_NAME, 'airPrice_box'))
+            )
         )
 
-        expand_buttons = self.driver.find_elements(
-            By.XPATH, 
-            "//a[contains(@class, 'plusBtn') and contains(text(), '更多航班')]"
-        )
+        if batch:
+            start = time.time()
+            try:
+                result = self.driver.execute_async_script(self.BATCH_EXPAND_SCRIPT, self.EXPAND_BUTTON_XPATH, 300, 5000)
+            except WebDriverException as e:
+                print(f"批次展開失敗，改為逐一點擊: {e}")
+            else:
+                elapsed = time.time() - start
+                # 統計批次展開取代的逐一點擊等待（每個按鈕 0.5 秒加上最後的 2 秒）；
+                # 點擊失敗的按鈕與最後的 2 秒改由 _expand_one_by_one 自行記錄，不重複計入
+                clicked = result['buttons'] - len(result['failed'])
+                self.quiescence.record(clicked * 0.5 + (0 if result['failed'] else 2), elapsed)
+                print(f"批次展開 {result['buttons']} 個更多航班按鈕，radio 由 {result['radios_before']} 增為 "
+                      f"{result['radios']} 個，耗時 {elapsed:.2f} 秒{'' if result['stable'] else '（已達等待上限）'}")
+                if result['failed']:
+                    self._expand_one_by_one([(i, button) for i, button in result['failed']])
+                print("所有航班選項已展開完成")
+                return
 
+        expand_buttons = self.driver.find_elements(By.XPATH, self.EXPAND_BUTTON_XPATH)
         print(f"找到 {len(expand_buttons)} 個更多航班按鈕")
+        self._expand_one_by_one(list(enumerate(expand_buttons)))
+        print("所有航班選項已展開完成")
+
+    def _expand_one_by_one(self, indexed_buttons: List[Tuple[int, WebElement]]) -> None:
+        """
+        逐一捲動並點擊展開按鈕，最後等待展開後的航班選項渲染完成。
+        
+        Args:
+            indexed_buttons (List[Tuple[int, WebElement]]): (按鈕序號, 按鈕元素) 列表。
+        
+        Examples:
+            >>> buttons = driver.find_elements(By.XPATH, FlightOptionExpander.EXPAND_BUTTON_XPATH)
+            >>> expander._expand_one_by_one(list(enumerate(buttons)))
+        
+        Raises:
+            無特定錯誤
+        """
+        if not indexed_buttons:
+            return
 
-        for i, button in enumerate(expand_buttons):
+        for i, button in indexed_buttons:
             try:
                 self.driver.execute_script("arguments[0].scrollIntoView();", button)
-                time.sleep(0.5)
+                self.quiescence.wait(quiet_ms=100, timeout=0.5, replaced_sleep=0.5)
                 self.driver.execute_script("arguments[0].click();", button)
                 print(f"已展開第 {i+1} 個航班選項")
             except Exception as e:
                 print(f"點擊第 {i+1} 個展開按鈕時發生錯誤: {e}")
                 continue
 
-        print("所有航班選項已展開完成")
+        # 等待展開後的航班選項渲染完成
+        self.quiescence.wait(quiet_ms=300, timeout=2.0, replaced_sleep=2)
+
+
+class XhrResponseCapture:
+    """
+    XHR 回應擷取器，透過 Chrome performance log 與 CDP Network.getResponseBody
+    取得票價頁面以 XHR 載入的 JSON 資料。
+
+    driver 必須以 WebDriverFactory.create_driver(enable_performance_log=True) 建立。
+
+    Examples:
+        >>> capture = XhrResponseCapture(driver)
+        >>> capture.clear()
+        >>> navigator.navigate_to_flight_page("TPE", "NRT", "2025/10/15", "2025/10/20")
+        >>> payloads = capture.collect()
+
+    Raises:
+        ValueError: 當 driver 為 None 時
+    """
+
+    def __init__(self, driver: webdriver.Chrome, url_keyword: str = 'colatour.com.tw'):
+        """
+        初始化 XHR 回應擷取器。
+
+        Args:
+            driver (webdriver.Chrome): 已啟用 performance log 的 WebDriver 實例。
+            url_keyword (str): 只擷取 URL 包含此關鍵字的回應，預設為 'colatour.com.tw'。
+
+        Examples:
+            >>> capture = XhrResponseCapture(driver)
+
+        Raises:
+            ValueError: 當 driver 為 None 時
+        """
+        if driver is None:
+            raise ValueError("driver 不可為 None")
+        self.driver = driver
+        self.url_keyword = url_keyword
+
+    def clear(self) -> None:
+        """
+        清空目前累積的 performance log，避免擷取到前一個頁面的回應。
+
+        Examples:
+            >>> capture = XhrResponseCapture(driver)
+            >>> capture.clear()
+
+        Raises:
+            selenium.common.exceptions.WebDriverException: 當 driver 未啟用 performance log 時
+        """
+        self.driver.get_log('performance')
+
+    def collect(self) -> List[dict]:
+        """
+        讀取 performance log，取回所有 XHR/Fetch JSON 回應的內容與對應的完整請求。
+
+        請求包含含查詢字串的完整網址、方法與 POST 內容；POST 內容未隨 Network.requestWillBeSent
+        附上時另以 Network.getRequestPostData 取得。
+
+        Returns:
+            List[dict]: 每筆包含 url（含查詢字串的請求網址）、method（請求方法）、
+                post_data（POST 內容，沒有時為 None）與 data（解析後的 JSON）。
+
+        Examples:
+            >>> capture = XhrResponseCapture(driver)
+            >>> payloads = capture.collect()
+            >>> payloads[0].keys()
+            dict_keys(['url', 'method', 'post_data', 'data'])
+
+        Raises:
+            selenium.common.exceptions.WebDriverException: 當 driver 未啟用 performance log 時
+        """
+        payloads = []
+        requests_sent = {}
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, json.JSONDecodeError):
+                continue
+
+            if message.get("method") == "Network.requestWillBeSent":
+                params = message.get("params", {})
+                requests_sent[params.get("requestId")] = params.get("request", {})
+                continue
+            if message.get("method") != "Network.responseReceived":
+                continue
+
+            params = message.get("params", {})
+            response = params.get("response", {})
+            if params.get("type") not in ("XHR", "Fetch"):
+                continue
+            if self.url_keyword not in response.get("url", ""):
+                continue
+
+            try:
+                body = self.driver.execute_cdp_cmd(
+                    "Network.getResponseBody",
+                    {"requestId": params["requestId"]}
+                )
+            except WebDriverException as e:
+                print(f"取得 XHR 回應內容失敗 ({response.get('url')}): {e}")
+                continue
+
+            if body.get("base64Encoded"):
+                continue
+
+            try:
+                data = json.loads(body.get("body", ""))
+            except json.JSONDecodeError:
+                continue
+
+            request = requests_sent.get(params["requestId"], {})
+            post_data = request.get("postData")
+            if post_data is None and request.get("hasPostData"):
+                try:
+                    post_data = self.driver.execute_cdp_cmd(
+                        "Network.getRequestPostData",
+                        {"requestId": params["requestId"]}
+                    ).get("postData")
+                except WebDriverException as e:
+                    print(f"取得 XHR 請求內容失敗 ({response.get('url')}): {e}")
+
+            payloads.append({
+                "url": request.get("url", response["url"]),
+                "method": request.get("method", "GET"),
+                "post_data": post_data,
+                "data": data
+            })
+
+        print(f"擷取到 {len(payloads)} 筆 XHR JSON 回應")
+        return payloads
+
+
+class CardElementCache:
+    """
+    卡片元素定位快取，同一張卡片的選項按鈕、分頁與票價元素只定位一次並重複使用。
+
+    快取的元素在 Angular 重新渲染後可能失效，動作拋出 StaleElementReferenceException 時
+    會自動重新定位並重試一次，呼叫端不需處理失效的情況。
+
+    屬性:
+        lookups (int): 實際向瀏覽器定位元素的次數。
+        saved_lookups (int): 直接使用快取而省下的定位次數。
+        refreshes (int): 因元素失效而重新定位的次數。
+
+    Examples:
+        >>> locators = CardElementCache()
+        >>> locators.use("flight_tab", lambda: card.find_element(By.CSS_SELECTOR, "a.tab01"),
+        ...              lambda tab: driver.execute_script("arguments[0].click();", tab))
+
+    Raises:
+        無特定錯誤
+    """
+
+    def __init__(self):
+        """
+        初始化卡片元素定位快取。
+
+        Examples:
+            >>> locators = CardElementCache()
+
+        Raises:
+            無特定錯誤
+        """
+        self._elements: Dict[str, Any] = {}
+        self.lookups = 0
+        self.saved_lookups = 0
+        self.refreshes = 0
+
+    def use(self, key: str, resolve: Callable[[], Any], action: Callable[[Any], Any]) -> Any:
+        """
+        以快取的元素執行動作；尚未定位或元素失效時呼叫 resolve 重新定位。
+
+        Args:
+            key (str): 快取鍵，例如 'flight_tab'。
+            resolve (Callable[[], Any]): 定位元素（或元素列表）的函式。
+            action (Callable[[Any], Any]): 使用元素執行的動作。
+
+        Returns:
+            Any: action 的回傳值。
+
+        Examples:
+            >>> locators = CardElementCache()
+            >>> radios = locators.use("departure_radios", find_radios, lambda radios: radios)
+
+        Raises:
+            StaleElementReferenceException: 當重新定位後元素仍然失效時
+        """
+        cached = key in self._elements
+        if not cached:
+            self._elements[key] = resolve()
+            self.lookups += 1
+
+        try:
+            result = action(self._elements[key])
+        except StaleElementReferenceException:
+            self.refreshes += 1
+            self._elements[key] = resolve()
+            self.lookups += 1
+            return action(self._elements[key])
+
+        if cached:
+            self.saved_lookups += 1
+        return result